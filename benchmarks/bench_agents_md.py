@@ -0,0 +1,131 @@
+"""Compare AGENTS.md section replacement strategies on large documents.
+
+Usage: ``python benchmarks/bench_agents_md.py [--lines 20000] [--skills 200] [--repeat 50] [--catalog 20000]``
+
+Builds an AGENTS.md with ``--lines`` lines of prose and a ``<skills_system>``
+section listing ``--skills`` skills near the end, then times replacing the
+section and reading the currently listed names:
+
+* ``regex``: the previous ``re.sub`` patterns plus the ``split``-based name scan.
+* ``scanner``: :func:`locate_skills_section` once, then splicing by slicing.
+
+It then syncs a catalog of ``--catalog`` skills into that document and reports
+the ``tracemalloc`` peak of building the result as one string versus streaming
+:func:`iter_synced_agents_md` chunks into the file.
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from openskills.utils.agents_md import (
+    iter_synced_agents_md,
+    locate_skills_section,
+    render_skills_system,
+    replace_skills_section,
+    update_skills_section,
+)
+from openskills.utils.fs_ops import write_text_atomic
+from openskills.utils.skills import Skill
+
+_START = "<!-- SKILLS_TABLE_START -->"
+_END = "<!-- SKILLS_TABLE_END -->"
+
+
+def _skills(count: int) -> list[Skill]:
+    return [
+        Skill(
+            name=f"skill-{i}",
+            description=f"Handles task number {i} with care",
+            location="project",
+            base_dir=Path(f"/project/.agent/skills/skill-{i}"),
+            skill_path=Path(f"/project/.agent/skills/skill-{i}/SKILL.md"),
+        )
+        for i in range(count)
+    ]
+
+
+def _document(lines: int, skills: list[Skill]) -> str:
+    prose = "\n".join(f"- Guideline {i}: keep the > build green and the <docs> current" for i in range(lines))
+    return f"# Agents\n\n{prose}\n\n{render_skills_system(skills)}\n\n## Footer\n"
+
+
+def _regex(content: str, skills: list[Skill]) -> tuple[str, set[str]]:
+    names: set[str] = set()
+    if _START in content and _END in content:
+        segment = content.split(_START, 1)[1].split(_END, 1)[0]
+        for line in segment.splitlines():
+            if line.strip().startswith("<name>") and line.strip().endswith("</name>"):
+                names.add(line.replace("<name>", "").replace("</name>", "").strip())
+
+    new_section = render_skills_system(skills)
+    return re.sub(r"<skills_system[^>]*>[\s\S]*?</skills_system>", new_section, content, count=1), names
+
+
+def _scanner(content: str, skills: list[Skill]) -> tuple[str, set[str]]:
+    section = locate_skills_section(content)
+    names = set(section.names) if section is not None else set()
+    return replace_skills_section(content, skills), names
+
+
+def _peak_bytes(write: Callable[[], None]) -> int:
+    tracemalloc.start()
+    write()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def _compare_memory(content: str, skills: list[Skill]) -> None:
+    with tempfile.TemporaryDirectory(prefix="openskills-agents-md-") as tmp:
+        path = os.path.join(tmp, "AGENTS.md")
+
+        def joined() -> None:
+            write_text_atomic(path, update_skills_section(content, skills)[0])
+
+        def streamed() -> None:
+            write_text_atomic(path, iter_synced_agents_md(content, skills) or [])
+
+        for label, write in (("joined", joined), ("streamed", streamed)):
+            print(f"{label:>8}: peak {_peak_bytes(write) / 1024 / 1024:7.2f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=20000)
+    parser.add_argument("--skills", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--catalog", type=int, default=20000)
+    args = parser.parse_args()
+
+    skills = _skills(args.skills)
+    content = _document(args.lines, skills)
+    replacement = skills[: args.skills // 2]
+    print(f"AGENTS.md: {args.lines} prose lines, {len(content) / 1024:.0f} KiB, {args.skills} skills listed")
+
+    expected = None
+    for label, strategy in (("regex", _regex), ("scanner", _scanner)):
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            result = strategy(content, replacement)
+        elapsed = (time.perf_counter() - started) / args.repeat
+        if expected is None:
+            expected = result
+        elif result != expected:
+            raise SystemExit(f"{label} output differs from regex output")
+        print(f"{label:>8}: {elapsed * 1000:8.3f} ms per call")
+
+    print(f"\nSyncing {args.catalog} skills into the same document:")
+    _compare_memory(content, _skills(args.catalog))
+
+
+if __name__ == "__main__":
+    main()
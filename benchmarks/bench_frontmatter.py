@@ -0,0 +1,81 @@
+"""Compare SKILL.md description extraction strategies.
+
+Usage: ``python benchmarks/bench_frontmatter.py [--files 10000] [--body-rows 160]``
+
+Generates synthetic SKILL.md files (default body of about 8 KiB, typical for
+published skills) and times three ways of pulling ``name``/``description``:
+
+* ``regex``: full-file read plus a per-field ``re.search`` (the old path).
+* ``pyyaml``: full-file read, split on the delimiters, ``yaml.safe_load``.
+* ``tokenizer``: streaming ``read_frontmatter`` plus ``parse_frontmatter``.
+"""
+
+import argparse
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from openskills.utils.yaml import parse_frontmatter, read_frontmatter
+
+
+def _write_files(root: Path, count: int, body_rows: int) -> list[Path]:
+    body = "\n".join(f"| row {i} | some reference value | another column |" for i in range(body_rows))
+    paths = []
+    for i in range(count):
+        path = root / f"skill-{i}" / "SKILL.md"
+        path.parent.mkdir()
+        path.write_text(
+            f"---\nname: skill-{i}\ndescription: Handles task number {i} with care\ncontext: Notes {i}\n---\n\n{body}\n",
+            encoding="utf-8",
+        )
+        paths.append(path)
+    return paths
+
+
+def _regex(path: Path) -> tuple[str, str]:
+    content = path.read_text(encoding="utf-8")
+    fields = []
+    for field in ("name", "description"):
+        match = re.search(rf"^{re.escape(field)}:\s*(.+)$", content, re.MULTILINE)
+        fields.append(match.group(1).strip() if match else "")
+    return fields[0], fields[1]
+
+
+def _pyyaml(path: Path) -> tuple[str, str]:
+    lines = path.read_text(encoding="utf-8").splitlines()
+    closing = next(idx for idx, line in enumerate(lines[1:], start=1) if line.strip() == "---")
+    data = yaml.safe_load("\n".join(lines[1:closing]))
+    return str(data["name"]), str(data["description"])
+
+
+def _tokenizer(path: Path) -> tuple[str, str]:
+    record = parse_frontmatter(read_frontmatter(path))
+    return record.name or "", record.description or ""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=10_000)
+    parser.add_argument("--body-rows", type=int, default=160)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="openskills-bench-") as tmp:
+        paths = _write_files(Path(tmp), args.files, args.body_rows)
+        expected = None
+        for label, strategy in (("regex", _regex), ("pyyaml", _pyyaml), ("tokenizer", _tokenizer)):
+            start = time.perf_counter()
+            results = [strategy(path) for path in paths]
+            elapsed = time.perf_counter() - start
+            expected = expected or results
+            assert results == expected, f"{label} disagrees with regex results"
+            print(f"{label:10} {elapsed * 1000:9.1f} ms  ({elapsed / len(paths) * 1e6:6.1f} us/file)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Measure serial vs. threaded SKILL.md scanning on a slow filesystem.
+
+Usage: ``python benchmarks/bench_parallel_scan.py [--skills 500] [--latency-ms 2]``
+
+Network home directories (NFS, SMB) add a round trip to every open/read. The
+benchmark simulates that by sleeping ``--latency-ms`` inside each frontmatter
+read, then runs a cold :class:`SkillIndex` scan and install candidate
+discovery with several ``jobs`` settings, checking that every run returns
+exactly the serial results.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from openskills import operations
+from openskills.utils import skill_index, skill_validation
+from openskills.utils.skill_index import SkillIndex
+
+
+def _write_skills(root: Path, count: int) -> None:
+    for i in range(count):
+        skill_dir = root / f"skill-{i:05d}"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: skill-{i:05d}\ndescription: Skill number {i}\n---\n\n# Skill {i}\n",
+            encoding="utf-8",
+        )
+
+
+def _with_latency(fn, delay: float):
+    def _slow(*args, **kwargs):
+        time.sleep(delay)
+        return fn(*args, **kwargs)
+
+    return _slow
+
+
+def _timed(label: str, fn) -> object:
+    start = time.perf_counter()
+    result = fn()
+    print(f"  {label:12} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skills", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 4, 16, 32])
+    args = parser.parse_args()
+
+    delay = args.latency_ms / 1000
+    skill_index.read_frontmatter = _with_latency(skill_index.read_frontmatter, delay)
+    skill_validation.read_frontmatter = _with_latency(skill_validation.read_frontmatter, delay)
+
+    with tempfile.TemporaryDirectory(prefix="openskills-bench-") as tmp:
+        root = Path(tmp) / "skills"
+        _write_skills(root, args.skills)
+        print(f"{args.skills} skills, {args.latency_ms} ms simulated latency per read")
+
+        print("SkillIndex.scan (cold)")
+        baseline = None
+        for jobs in args.jobs:
+            entries = _timed(f"jobs={jobs}", lambda jobs=jobs: SkillIndex(None, jobs=jobs).scan(root))
+            baseline = baseline or entries
+            assert entries == baseline
+
+        print("install candidate discovery")
+        baseline = None
+        for jobs in args.jobs:
+            found = _timed(f"jobs={jobs}", lambda jobs=jobs: operations._discover_skill_candidates(root, jobs=jobs))
+            baseline = baseline or found
+            assert found == baseline
+
+
+if __name__ == "__main__":
+    main()
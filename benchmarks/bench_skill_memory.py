@@ -0,0 +1,101 @@
+"""Measure per-skill memory for in-memory skill listings.
+
+Usage: ``python benchmarks/bench_skill_memory.py [--workspaces 100] [--skills 500]``
+
+Builds the listing an agent host would hold for ``--workspaces`` projects
+that each have ``--skills`` skills (names repeat across workspaces, as they
+do in practice) and reports the ``tracemalloc`` bytes per skill for:
+
+* ``dict-dataclass``: the previous representation, a frozen dataclass with a
+  per-instance ``__dict__`` and freshly read, non-interned name strings.
+* ``Skill``: the current slotted :class:`Skill` with interned names.
+* ``SkillTable``: the columnar container, with paths kept as strings.
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from openskills.utils.skills import Skill, SkillTable
+
+
+@dataclass(frozen=True)
+class _DictSkill:
+    name: str
+    description: str
+    location: str
+    base_dir: Path
+    skill_path: Path
+
+
+def _rows(workspaces: int, skills: int) -> list[tuple[str, str, Path]]:
+    # Rebuild each string per workspace, as parsing separate index files does.
+    return [
+        ("".join(["skill-", str(i)]), f"Handles task {i} in workspace {w}", Path(f"/work/project-{w}/.claude/skills"))
+        for w in range(workspaces)
+        for i in range(skills)
+    ]
+
+
+def _dict_dataclasses(rows: list[tuple[str, str, Path]]) -> object:
+    return [
+        _DictSkill(name, description, "project", root / name, root / name / "SKILL.md")
+        for name, description, root in rows
+    ]
+
+
+def _slotted_skills(rows: list[tuple[str, str, Path]]) -> object:
+    return [
+        Skill(sys.intern(name), description, "project", root / name, root / name / "SKILL.md")
+        for name, description, root in rows
+    ]
+
+
+def _skill_table(rows: list[tuple[str, str, Path]]) -> object:
+    table = SkillTable()
+    for name, description, root in rows:
+        table.append(name, description, "project", root)
+    return table
+
+
+def _measure(build: Callable[[list[tuple[str, str, Path]]], object], workspaces: int, skills: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    rows = _rows(workspaces, skills)
+    result = build(rows)
+    del rows  # only what ``result`` retains is counted
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(result)  # type: ignore[arg-type]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workspaces", type=int, default=100)
+    parser.add_argument("--skills", type=int, default=500)
+    args = parser.parse_args()
+
+    total = args.workspaces * args.skills
+    print(f"{total} skills ({args.workspaces} workspaces x {args.skills} skills)")
+
+    baseline = None
+    for label, build in (
+        ("dict-dataclass", _dict_dataclasses),
+        ("Skill", _slotted_skills),
+        ("SkillTable", _skill_table),
+    ):
+        per_skill = _measure(build, args.workspaces, args.skills)
+        baseline = baseline or per_skill
+        print(f"{label:>15}: {per_skill:8.1f} bytes/skill ({per_skill / baseline:5.1%} of baseline)")
+
+
+if __name__ == "__main__":
+    main()
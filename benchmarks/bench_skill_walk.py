@@ -0,0 +1,67 @@
+"""Compare ``Path.rglob("SKILL.md")`` with the pruning ``find_skill_dirs`` walker.
+
+Usage: ``python benchmarks/bench_skill_walk.py [--files 100000] [--skills 300]``
+
+Builds a synthetic monorepo of roughly ``--files`` files: ``--skills`` skill
+folders with a few bundled resources each, plus a ``.git`` object store and a
+``node_modules`` tree holding most of the files, as found in real checkouts.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from openskills.utils.skill_walk import find_skill_dirs
+
+
+def _touch_many(directory: Path, count: int, fanout: int = 200) -> None:
+    for i in range(count):
+        bucket = directory / f"{i // fanout:03x}"
+        if i % fanout == 0:
+            bucket.mkdir(parents=True, exist_ok=True)
+        (bucket / f"f{i}").write_bytes(b"x")
+
+
+def _build_tree(root: Path, total_files: int, skills: int) -> None:
+    for i in range(skills):
+        skill_dir = root / "skills" / f"group-{i % 10}" / f"skill-{i}"
+        (skill_dir / "references").mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(f"---\nname: skill-{i}\ndescription: d\n---\n", encoding="utf-8")
+        for j in range(5):
+            (skill_dir / "references" / f"ref-{j}.md").write_text("ref", encoding="utf-8")
+
+    remaining = max(total_files - skills * 6, 0)
+    _touch_many(root / ".git" / "objects", remaining // 2)
+    _touch_many(root / "node_modules", remaining - remaining // 2)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--skills", type=int, default=300)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="openskills-bench-") as tmp:
+        root = Path(tmp)
+        _build_tree(root, args.files, args.skills)
+
+        start = time.perf_counter()
+        via_rglob = sorted(path.parent for path in root.rglob("SKILL.md"))
+        rglob_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        via_walker = find_skill_dirs(root)
+        walker_ms = (time.perf_counter() - start) * 1000
+
+        assert sorted(via_walker) == via_rglob
+        print(f"{args.files} files, {len(via_walker)} skills")
+        print(f"rglob           {rglob_ms:9.1f} ms")
+        print(f"find_skill_dirs {walker_ms:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Cold-start regression check for ``openskills read`` using ``python -X importtime``.
+
+Usage: ``python benchmarks/bench_startup.py [--runs 7] [--max-ratio 0.75] [--budget-ms MS]``
+
+Runs ``openskills read <skill>`` in fresh interpreters against a throwaway
+project (daemon disabled) and reports the median time spent importing
+OpenSkills and its dependencies. The time is the cumulative ``-X importtime``
+figure of every top-level import that a bare ``python -c pass`` does not
+also make, so interpreter start-up itself is excluded. It also lists any
+install-only module that leaked onto the read path.
+
+Absolute import times depend heavily on the host, so the default gate is
+relative: the read path must stay under ``--max-ratio`` of the time to import
+the full install/sync command set, measured in the same run. ``--budget-ms``
+adds an absolute limit for a known machine. The original 50 ms target is not
+met on every host (about 65-95 ms was measured on a slow CI-class machine),
+so it is not the default. The exit status is 1 when a gate fails or a
+forbidden module is imported, so CI can run it directly.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Modules only install/update/sync need; ``read`` must never import them.
+FORBIDDEN_MODULES = frozenset(
+    {
+        "yaml",
+        "subprocess",
+        "shutil",
+        "tempfile",
+        "tomllib",
+        "openskills.operations",
+        "openskills.cli_commands",
+        "openskills.utils.repo_service",
+        "openskills.utils.fs_ops",
+        "openskills.utils.skill_validation",
+    }
+)
+
+_ENTRY = "from openskills.client import main; main(['read', 'bench-skill'])"
+# Everything ``install``/``sync`` load; the read path is measured against this.
+_REFERENCE = "import openskills.cli_commands"
+
+
+def import_times(code: str, project: Path, home: Path) -> dict[str, int]:
+    """Return ``{module: cumulative_us}`` for every top-level import made by ``code``.
+
+    Nested imports are folded into their top-level parent; the names of all
+    imported modules, nested or not, are included with a cost of 0.
+    """
+
+    env = {
+        **os.environ,
+        "HOME": str(home),
+        "PYTHONPATH": str(REPO_ROOT),
+        "OPENSKILLS_NO_DAEMON": "1",
+        "OPENSKILLS_CACHE_DIR": str(home / "cache"),
+    }
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=project,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        module = name.strip()
+        top_level = cumulative.strip().isdigit() and name == f" {module}"
+        times[module] = int(cumulative) if top_level else times.get(module, 0)
+    return times
+
+
+def run_once(project: Path, home: Path, baseline: set[str] = frozenset(), code: str = _ENTRY) -> tuple[float, set[str]]:
+    """Return ``(import_ms, imported_module_names)`` for one cold ``read`` (or ``code``).
+
+    Modules in ``baseline`` (what the bare interpreter imports) are not counted.
+    """
+
+    times = import_times(code, project, home)
+    total_us = sum(cost for module, cost in times.items() if module not in baseline)
+    return total_us / 1000, set(times)
+
+
+def make_project(root: Path) -> tuple[Path, Path]:
+    project = root / "project"
+    home = root / "home"
+    skill_dir = project / ".agent/skills/bench-skill"
+    skill_dir.mkdir(parents=True)
+    home.mkdir()
+    (skill_dir / "SKILL.md").write_text(
+        "---\nname: bench-skill\ndescription: Startup benchmark skill\n---\n\n# Bench\n", encoding="utf-8"
+    )
+    return project, home
+
+
+def measure(runs: int) -> tuple[float, float, set[str]]:
+    """Return the median ``read`` and reference import times in ms, and every module ``read`` imported."""
+
+    with tempfile.TemporaryDirectory(prefix="openskills-startup-") as tmp:
+        project, home = make_project(Path(tmp))
+        baseline = set(import_times("pass", project, home))
+        run_once(project, home)  # warm the index and bytecode caches
+        run_once(project, home, code=_REFERENCE)
+        samples = []
+        references = []
+        seen: set[str] = set()
+        for _ in range(runs):
+            # Interleaved so load spikes on the host hit both sides alike.
+            elapsed, modules = run_once(project, home, baseline)
+            samples.append(elapsed)
+            references.append(run_once(project, home, baseline, _REFERENCE)[0])
+            seen |= modules
+    return statistics.median(samples), statistics.median(references), seen
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--max-ratio", type=float, default=0.75)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    median_ms, reference_ms, modules = measure(args.runs)
+    leaked = sorted(modules & FORBIDDEN_MODULES)
+    ratio = median_ms / reference_ms
+
+    print(f"openskills read import time (median of {args.runs}): {median_ms:.1f} ms")
+    print(f"full command set import time: {reference_ms:.1f} ms (read is {ratio:.0%}, limit {args.max_ratio:.0%})")
+    if args.budget_ms is not None:
+        print(f"absolute budget: {args.budget_ms:.0f} ms")
+    print(f"modules imported: {len(modules)}")
+    if leaked:
+        print(f"install-only modules imported by read: {', '.join(leaked)}")
+
+    over_budget = args.budget_ms is not None and median_ms > args.budget_ms
+    if leaked or ratio > args.max_ratio or over_budget:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,61 @@
-"""Command-line interface for the OpenSkills Python port."""
+"""Command-line interface for the OpenSkills Python port.
+
+Only ``list`` and ``read`` are defined here. They are what agents run on
+every turn, so they import just discovery and formatting. Every other
+command lives in :mod:`openskills.cli_commands` and is imported on first
+use by :class:`LazyGroup`.
+"""
+
+import importlib
+import sys
 
 import click
 
 from . import __version__
-from .operations import (
-    install_skill_command,
-    list_skills_command,
-    manage_skills_command,
-    read_skill_command,
-    remove_skill_command,
-    sync_agents_md_command,
-)
 from .utils.errors import exit_not_implemented
 
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 
+jobs_option = click.option(
+    "jobs",
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    # OPENSKILLS_JOBS is read by resolve_jobs, which tolerates bad values.
+    help="Scan SKILL.md files on N threads (default: serial, env: OPENSKILLS_JOBS)",
+)
+
+_COMMANDS_MODULE = "openskills.cli_commands"
+
+LAZY_COMMANDS = {
+    "daemon": "daemon",
+    "gc": "gc",
+    "install": "install",
+    "manage": "manage",
+    "remove": "remove",
+    "rm": "remove",
+    "sync": "sync",
+    "update": "update",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports a subcommand's module only when it is invoked or listed."""
+
+    def __init__(self, *args, lazy_commands: dict[str, str] | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        attribute = self.lazy_commands.get(cmd_name)
+        if attribute is None:
+            return super().get_command(ctx, cmd_name)
+        return getattr(importlib.import_module(_COMMANDS_MODULE), attribute)
+
 
 def _stub(command_name: str) -> None:
     """Temporary stub used while functionality is implemented elsewhere."""
@@ -22,6 +63,8 @@ def _stub(command_name: str) -> None:
 
 
 @click.group(
+    cls=LazyGroup,
+    lazy_commands=LAZY_COMMANDS,
     context_settings=CONTEXT_SETTINGS,
     help="Universal skills loader for AI coding agents",
 )
@@ -31,67 +74,61 @@ def cli() -> None:
 
 
 @cli.command(name="list", help="List all installed skills")
-def list_skills() -> None:
-    list_skills_command()
-
-
-@cli.command(name="install", help="Install skill from GitHub or Git URL")
-@click.argument("source")
-@click.option("global_install", "-g", "--global", is_flag=True, help="Install globally (default: project install)")
 @click.option(
-    "universal",
-    "--universal/--claude",
-    default=True,
-    help="Install to .agent/skills/ (default) or .claude/skills/ (Claude-only)",
+    "output_format",
+    "--format",
+    type=click.Choice(["text", "xml", "json", "ndjson"]),
+    default="text",
+    show_default=True,
+    help="text for people, xml for the <available_skills> block sync writes to AGENTS.md, json or ndjson for tools",
 )
+@click.option("as_json", "--json", is_flag=True, help="Same as --format json: one JSON array")
+@click.option("as_ndjson", "--ndjson", is_flag=True, help="Same as --format ndjson: one JSON object per line, streamed")
 @click.option(
-    "yes",
-    "-y",
-    "--yes",
-    is_flag=True,
-    help="Skip interactive selection, install all skills found",
+    "fields",
+    "--fields",
+    default=None,
+    metavar="FIELDS",
+    help="Comma-separated JSON keys: name, description, location, base_dir, skill_path (default: all)",
 )
-def install(source: str, *, global_install: bool, universal: bool, yes: bool) -> None:
-    install_skill_command(
-        source,
-        global_install=global_install,
-        universal=universal,
-        yes=yes,
-    )
-
-
-@cli.command(name="read", help="Read skill to stdout (for AI agents)")
-@click.argument("skill_name")
-def read(skill_name: str) -> None:
-    read_skill_command(skill_name)
-
-
-@cli.command(
-    name="sync",
-    help="Update AGENTS.md with installed skills (interactive, pre-selects current state)",
-)
-@click.option("yes", "-y", "--yes", is_flag=True, help="Skip interactive selection, sync all skills")
-def sync(yes: bool) -> None:
-    sync_agents_md_command(yes=yes)
-
-
-@cli.command(name="manage", help="Interactively manage (remove) installed skills")
-@click.option("yes", "-y", "--yes", is_flag=True, help="Remove all without prompting")
-def manage(yes: bool) -> None:
-    manage_skills_command(yes=yes)
-
-
-@cli.command(
-    name="remove",
-    help="Remove specific skill (alias: rm) (for scripts, use manage for interactive)",
+@jobs_option
+def list_skills(output_format: str, as_json: bool, as_ndjson: bool, fields: str | None, jobs: int | None) -> None:
+    from .lookup import list_skills_command
+    from .utils.skill_output import parse_skill_fields
+
+    if as_json and as_ndjson:
+        raise click.UsageError("--json and --ndjson are mutually exclusive")
+    if as_json or as_ndjson:
+        output_format = "json" if as_json else "ndjson"
+    if fields is not None and output_format not in ("json", "ndjson"):
+        raise click.UsageError("--fields only applies to --json and --ndjson output")
+    try:
+        selected = parse_skill_fields(fields)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--fields") from exc
+
+    list_skills_command(jobs=jobs, output_format=output_format, fields=selected)
+
+
+@cli.command(name="read", help="Read skills to stdout (for AI agents)")
+@click.argument("skill_names", nargs=-1)
+@click.option("from_stdin", "--stdin", is_flag=True, help="Also read skill names from stdin, one per line")
+@click.option(
+    "max_bytes",
+    "--max-bytes",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Print at most this many bytes of each SKILL.md",
 )
-@click.argument("skill_name")
-def remove(skill_name: str) -> None:
-    remove_skill_command(skill_name)
-
-
-# Register the short alias after definition to keep Click compatibility.
-cli.add_command(remove, "rm")
+def read(skill_names: tuple[str, ...], from_stdin: bool, max_bytes: int | None) -> None:
+    from .lookup import read_skill_command
+
+    names = list(skill_names)
+    if from_stdin:
+        names.extend(line.strip() for line in sys.stdin if line.strip())
+    if not names:
+        raise click.UsageError("Missing skill name (pass names or --stdin)")
+    read_skill_command(names, max_bytes=max_bytes)
 
 
 def main() -> None:
@@ -0,0 +1,282 @@
+"""Install, maintenance and daemon commands, loaded lazily by :class:`openskills.cli.LazyGroup`."""
+
+from pathlib import Path
+
+import click
+
+from .cli import jobs_option
+from .operations import (
+    gc_store_command,
+    install_manifest_command,
+    install_skill_command,
+    manage_skills_command,
+    remove_skill_command,
+    sync_agents_md_command,
+    sync_workspaces_command,
+    update_skills_command,
+)
+from .utils.agents_md import DEFAULT_PRIORITY, SkillBudget
+from .utils.errors import exit_with_error
+from .utils.fs_ops import LINK_MODES, LinkMode
+
+__all__ = ["daemon", "gc", "install", "manage", "remove", "sync", "update"]
+
+
+@click.command(
+    name="install",
+    help="Install skill from GitHub or Git URL (append #path/in/repo to fetch only that subtree)",
+)
+@click.argument("source", required=False)
+@click.option(
+    "manifest",
+    "-f",
+    "--file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Install every source listed in a skills.toml manifest (writes skills.lock next to it)",
+)
+@click.option("global_install", "-g", "--global", is_flag=True, help="Install globally (default: project install)")
+@click.option(
+    "universal",
+    "--universal/--claude",
+    default=True,
+    help="Install to .agent/skills/ (default) or .claude/skills/ (Claude-only)",
+)
+@click.option(
+    "yes",
+    "-y",
+    "--yes",
+    is_flag=True,
+    help="Skip interactive selection, install all skills found",
+)
+@click.option(
+    "max_depth",
+    "--max-depth",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Only look for SKILL.md this many directories below the source root",
+)
+@click.option(
+    "only",
+    "--only",
+    multiple=True,
+    help="Install only these skill folders (comma-separated or repeated); fetches just those paths",
+)
+@click.option(
+    "link_mode",
+    "--link",
+    type=click.Choice(LINK_MODES),
+    default="copy",
+    show_default=True,
+    help="How files reach the target: copy, symlink (local sources only), hardlink or reflink",
+)
+@click.option(
+    "use_cache",
+    "--cache/--no-cache",
+    default=True,
+    help="Reuse a local bare mirror of git sources under the OpenSkills cache dir",
+)
+@click.option(
+    "use_store",
+    "--store/--no-store",
+    default=False,
+    envvar="OPENSKILLS_STORE",
+    help="Keep one copy of each skill in the shared store and hardlink (or --link symlink) it into place",
+)
+@jobs_option
+def install(
+    source: str | None,
+    *,
+    manifest: Path | None,
+    global_install: bool,
+    universal: bool,
+    yes: bool,
+    max_depth: int | None,
+    only: tuple[str, ...],
+    link_mode: LinkMode,
+    use_cache: bool,
+    use_store: bool,
+    jobs: int | None,
+) -> None:
+    if (source is None) == (manifest is None):
+        raise click.UsageError("Pass either SOURCE or -f/--file MANIFEST")
+
+    if manifest is not None:
+        if only:
+            raise click.UsageError("--only is set per source in the manifest")
+        install_manifest_command(
+            manifest,
+            global_install=global_install,
+            universal=universal,
+            yes=yes,
+            jobs=jobs,
+            max_depth=max_depth,
+            use_cache=use_cache,
+            link_mode=link_mode,
+            use_store=use_store,
+        )
+        return
+
+    only_names = [name.strip() for value in only for name in value.split(",") if name.strip()]
+    install_skill_command(
+        source,
+        global_install=global_install,
+        universal=universal,
+        yes=yes,
+        jobs=jobs,
+        max_depth=max_depth,
+        use_cache=use_cache,
+        only=only_names or None,
+        link_mode=link_mode,
+        use_store=use_store,
+    )
+
+
+@click.command(name="update", help="Update installed skills whose source has changed (all, or the named ones)")
+@click.argument("names", nargs=-1)
+@click.option("global_install", "-g", "--global", is_flag=True, help="Update global skills (default: project skills)")
+@click.option(
+    "universal",
+    "--universal/--claude",
+    default=True,
+    help="Update .agent/skills/ (default) or .claude/skills/",
+)
+@click.option(
+    "use_cache",
+    "--cache/--no-cache",
+    default=True,
+    help="Reuse a local bare mirror of git sources under the OpenSkills cache dir",
+)
+@jobs_option
+def update(
+    names: tuple[str, ...],
+    *,
+    global_install: bool,
+    universal: bool,
+    use_cache: bool,
+    jobs: int | None,
+) -> None:
+    update_skills_command(names, global_install=global_install, universal=universal, use_cache=use_cache, jobs=jobs)
+
+
+@click.command(name="gc", help="Delete skill trees in the shared store that no install uses")
+@click.option("dry_run", "-n", "--dry-run", is_flag=True, help="Only report what would be removed")
+def gc(dry_run: bool) -> None:
+    gc_store_command(dry_run=dry_run)
+
+
+@click.command(
+    name="sync",
+    help="Update AGENTS.md with installed skills (interactive, pre-selects current state)",
+)
+@click.option("yes", "-y", "--yes", is_flag=True, help="Skip interactive selection, sync all skills")
+@click.option(
+    "recursive",
+    "-r",
+    "--recursive",
+    "--workspaces",
+    is_flag=True,
+    help="Sync every AGENTS.md under the current directory with all skills visible from it",
+)
+@click.option(
+    "max_bytes",
+    "--max-bytes",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Keep the skills section under this many bytes (shortens descriptions, then collapses skills)",
+)
+@click.option(
+    "max_tokens",
+    "--max-tokens",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Keep the skills section under roughly this many tokens (4 bytes each)",
+)
+@click.option(
+    "priority",
+    "--priority",
+    default=",".join(DEFAULT_PRIORITY),
+    show_default=True,
+    callback=lambda _ctx, _param, value: _parse_priority(value),
+    help="Comma-separated order for choosing skills under a budget: location, usage, name",
+)
+@jobs_option
+def sync(
+    yes: bool,
+    recursive: bool,
+    max_bytes: int | None,
+    max_tokens: int | None,
+    priority: tuple[str, ...],
+    jobs: int | None,
+) -> None:
+    budget = SkillBudget(max_bytes=max_bytes, max_tokens=max_tokens) if max_bytes or max_tokens else None
+    if recursive:
+        sync_workspaces_command(jobs=jobs, budget=budget, priority=priority)
+    else:
+        sync_agents_md_command(yes=yes, jobs=jobs, budget=budget, priority=priority)
+
+
+def _parse_priority(value: str) -> tuple[str, ...]:
+    keys = tuple(key.strip() for key in value.split(",") if key.strip())
+    unknown = [key for key in keys if key not in DEFAULT_PRIORITY]
+    if unknown or len(set(keys)) != len(keys):
+        raise click.BadParameter(
+            f"use a comma-separated subset of {', '.join(DEFAULT_PRIORITY)}", param_hint="--priority"
+        )
+    return keys
+
+
+@click.command(name="manage", help="Interactively manage (remove) installed skills")
+@click.option("yes", "-y", "--yes", is_flag=True, help="Remove all without prompting")
+@jobs_option
+def manage(yes: bool, jobs: int | None) -> None:
+    manage_skills_command(yes=yes, jobs=jobs)
+
+
+@click.command(
+    name="remove",
+    help="Remove specific skill (alias: rm) (for scripts, use manage for interactive)",
+)
+@click.argument("skill_name")
+def remove(skill_name: str) -> None:
+    remove_skill_command(skill_name)
+
+
+@click.group(name="daemon", help="Run a background server that answers read/list without interpreter startup")
+def daemon() -> None:
+    """Manage the opt-in skill daemon."""
+
+
+@daemon.command(name="start", help="Start the daemon (detached unless --foreground)")
+@click.option("foreground", "--foreground", is_flag=True, help="Serve in this process until stopped")
+def daemon_start(foreground: bool) -> None:
+    from .daemon import serve, start_daemon
+
+    try:
+        if foreground:
+            serve()
+        elif not start_daemon():
+            click.echo("Daemon already running")
+        else:
+            click.echo("Daemon started")
+    except RuntimeError as exc:
+        exit_with_error(str(exc))
+
+
+@daemon.command(name="stop", help="Stop the daemon")
+def daemon_stop() -> None:
+    from .daemon import stop_daemon
+
+    click.echo("Daemon stopped" if stop_daemon() else "Daemon not running")
+
+
+@daemon.command(name="status", help="Report whether the daemon is running")
+def daemon_status() -> None:
+    from .client import socket_path
+    from .daemon import daemon_status as is_running
+
+    path = socket_path()
+    if is_running(path):
+        click.echo(f"Daemon running on {path}")
+    else:
+        exit_with_error(f"Daemon not running ({path})")
@@ -0,0 +1,112 @@
+"""Thin ``openskills`` entry point that asks a running daemon first.
+
+``openskills read <name>...`` and ``openskills list`` are sent to the daemon
+(``openskills daemon start``) over its Unix socket when one is listening.
+Without a daemon those two commands are answered in-process by
+:mod:`openskills.lookup`, which does not import click; everything else runs
+the regular click CLI. The daemon is purely an accelerator.
+"""
+
+import os
+import sys
+from collections.abc import Sequence
+from typing import Any
+
+__all__ = ["NO_DAEMON_ENV", "SOCKET_ENV", "daemon_request", "main", "socket_path"]
+
+SOCKET_ENV = "OPENSKILLS_SOCKET"
+NO_DAEMON_ENV = "OPENSKILLS_NO_DAEMON"
+
+# Connecting to a live local socket takes microseconds; anything slower means
+# the daemon is wedged and the in-process path is the better bet.
+_CONNECT_TIMEOUT = 0.05
+_REPLY_TIMEOUT = 5.0
+
+
+def socket_path() -> str:
+    """Return the daemon socket: ``OPENSKILLS_SOCKET``, else per-user runtime or cache dir."""
+
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return os.path.expanduser(override)
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "openskills.sock")
+
+    from .utils.dirs import get_cache_dir
+
+    return str(get_cache_dir() / "daemon.sock")
+
+
+def daemon_request(command: str, args: Sequence[str] = (), *, path: str | None = None) -> dict[str, Any] | None:
+    """Send one request to the daemon; return its reply, or None if it is unreachable."""
+
+    path = path or socket_path()
+    if not os.path.exists(path):
+        return None
+
+    # Only paid when a daemon socket exists; the fallback path skips them.
+    import json
+    import socket
+
+    from .utils.usage import NO_USAGE_ENV, usage_log_path
+
+    request = {
+        "command": command,
+        "args": list(args),
+        "cwd": os.getcwd(),
+        "home": os.path.expanduser("~"),
+        # Reads count into the log this client's own `sync` would read.
+        "usage_log": None if os.environ.get(NO_USAGE_ENV) else str(usage_log_path()),
+    }
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(_CONNECT_TIMEOUT)
+            conn.connect(path)
+            conn.settimeout(_REPLY_TIMEOUT)
+            conn.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with conn.makefile("rb") as reader:
+                reply = json.loads(reader.readline())
+    except (OSError, ValueError):
+        return None
+
+    return reply if isinstance(reply, dict) else None
+
+
+def _daemon_command(argv: Sequence[str]) -> tuple[str, list[str]] | None:
+    if list(argv) == ["list"]:
+        return "list", []
+    if len(argv) >= 2 and argv[0] == "read" and not any(arg.startswith("-") for arg in argv[1:]):
+        return "read", list(argv[1:])
+    return None
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Console entry point: answer from the daemon when possible, else run the CLI."""
+
+    args = sys.argv[1:] if argv is None else list(argv)
+    routed = _daemon_command(args)
+
+    if routed is not None:
+        reply = None if os.environ.get(NO_DAEMON_ENV) else daemon_request(*routed)
+        if reply is not None:
+            sys.stdout.write(reply.get("stdout", ""))
+            sys.stderr.write(reply.get("stderr", ""))
+            sys.stdout.flush()
+            raise SystemExit(int(reply.get("code", 0)))
+
+        from .lookup import answer, emit
+
+        output = answer(*routed)
+        if output is not None:
+            emit(output)
+            return
+
+    from .cli import cli
+
+    cli.main(args=args, prog_name="openskills")
+
+
+if __name__ == "__main__":
+    main()
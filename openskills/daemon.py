@@ -0,0 +1,193 @@
+"""Opt-in background server answering ``read`` and ``list`` over a Unix socket.
+
+The daemon keeps one in-memory :class:`SkillIndex` and the contents of
+recently read SKILL.md files. Every request re-validates what it touches
+with ``stat`` (root directories for ``list``, the SKILL.md for ``read``), so
+edits, installs and removals are picked up on the next call without any
+file-watching dependency. Replies carry the exact bytes the CLI would print;
+see :mod:`openskills.client` for the request side.
+"""
+
+import json
+import os
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from .client import daemon_request, socket_path
+from .lookup import list_skills, read_skills
+from .utils.skill_index import SkillIndex
+from .utils.skills import SkillResolver
+from .utils.usage import record_skill_read
+
+__all__ = ["SkillServer", "daemon_status", "serve", "start_daemon", "stop_daemon"]
+
+# SKILL.md bodies kept in memory; the oldest entry is dropped beyond this.
+MAX_CACHED_DOCUMENTS = 512
+
+_START_TIMEOUT = 5.0
+
+
+def _reply(code: int = 0, stdout: str = "", stderr: str = "") -> dict[str, Any]:
+    return {"code": code, "stdout": stdout, "stderr": stderr}
+
+
+class SkillServer:
+    """Request handler state shared by all daemon connections."""
+
+    def __init__(self) -> None:
+        self.index = SkillIndex(None)
+        self._documents: dict[str, tuple[tuple[int, int], str]] = {}
+        self._lock = threading.Lock()
+
+    def _read_document(self, path: Path) -> str:
+        key = os.fspath(path)
+        st = os.stat(key)
+        stat_key = (st.st_mtime_ns, st.st_size)
+
+        cached = self._documents.get(key)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
+
+        content = path.read_text(encoding="utf-8")
+        self._documents.pop(key, None)
+        self._documents[key] = (stat_key, content)
+        if len(self._documents) > MAX_CACHED_DOCUMENTS:
+            del self._documents[next(iter(self._documents))]
+        return content
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Answer one decoded request with ``{"code", "stdout", "stderr"}``."""
+
+        command = request.get("command")
+        if command == "ping":
+            return _reply()
+
+        cwd = Path(request.get("cwd") or os.getcwd())
+        home = Path(request.get("home") or Path.home())
+        args = request.get("args") or []
+        usage_log = request.get("usage_log")
+
+        with self._lock:
+            resolver = SkillResolver(cwd=cwd, home=home, index=self.index)
+            if command == "list":
+                return asdict(list_skills(resolver=resolver))
+
+            if command == "read" and args:
+                # Usage goes to the client's log (None: the client opted out).
+                def record(name: str) -> None:
+                    if usage_log:
+                        record_skill_read(name, log_path=usage_log)
+
+                return asdict(read_skills(args, resolver=resolver, load=self._read_document, record=record))
+
+        return _reply(2, stderr=f"Unsupported daemon request: {command}\n")
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: "_UnixServer"
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+
+        if request.get("command") == "shutdown":
+            self.wfile.write(json.dumps(_reply()).encode("utf-8") + b"\n")
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return
+
+        try:
+            reply = self.server.skills.handle(request)
+        except Exception as exc:  # noqa: BLE001 - one bad request must not kill the daemon
+            reply = _reply(1, stderr=f"Error: {exc}\n")
+        self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path, _Handler)
+        self.skills = SkillServer()
+
+
+def serve(path: str | None = None, *, ready: threading.Event | None = None) -> None:
+    """Run the daemon in the foreground until a ``shutdown`` request arrives."""
+
+    path = path or socket_path()
+    os.makedirs(os.path.dirname(path) or ".", mode=0o700, exist_ok=True)
+
+    if os.path.exists(path):
+        if daemon_request("ping", path=path) is not None:
+            raise RuntimeError(f"A daemon is already listening on {path}")
+        os.unlink(path)
+
+    old_umask = os.umask(0o177)
+    try:
+        server = _UnixServer(path)
+    finally:
+        os.umask(old_umask)
+
+    if ready is not None:
+        ready.set()
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def daemon_status(path: str | None = None) -> bool:
+    """Return True when a daemon answers on ``path``."""
+
+    return daemon_request("ping", path=path) is not None
+
+
+def start_daemon(path: str | None = None) -> bool:
+    """Spawn a detached daemon; return False if one was already running."""
+
+    path = path or socket_path()
+    if daemon_status(path):
+        return False
+
+    env = {**os.environ, "OPENSKILLS_SOCKET": path}
+    subprocess.Popen(
+        [sys.executable, "-m", "openskills.daemon"],
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + _START_TIMEOUT
+    while time.monotonic() < deadline:
+        if daemon_status(path):
+            return True
+        time.sleep(0.02)
+    raise RuntimeError(f"Daemon did not start listening on {path}")
+
+
+def stop_daemon(path: str | None = None) -> bool:
+    """Ask the daemon to exit; return False if none was running."""
+
+    path = path or socket_path()
+    if daemon_request("shutdown", path=path) is None:
+        return False
+
+    deadline = time.monotonic() + _START_TIMEOUT
+    while os.path.exists(path) and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return True
+
+
+if __name__ == "__main__":
+    serve()
@@ -0,0 +1,182 @@
+"""Read-only command handlers (``list`` and ``read``).
+
+Kept apart from :mod:`openskills.operations` and free of click so the
+commands agents run on every turn import only discovery and formatting.
+The handlers return a :class:`CommandOutput`; the CLI, the client fast path
+and the daemon all print that same value.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from .utils.skill_output import format_skill_list, format_skill_read, format_skills_not_found, truncate_skill_content
+from .utils.skills import SkillResolver
+from .utils.usage import record_skill_read
+
+__all__ = [
+    "CommandOutput",
+    "answer",
+    "emit",
+    "list_skills",
+    "list_skills_command",
+    "read_skill",
+    "read_skill_command",
+    "read_skills",
+]
+
+
+@dataclass(frozen=True)
+class CommandOutput:
+    """What a command prints and the status it exits with."""
+
+    code: int = 0
+    stdout: str = ""
+    stderr: str = ""
+
+
+def _resolver_for(
+    resolver: SkillResolver | None,
+    *,
+    cwd: Path | None,
+    home: Path | None,
+    jobs: int | None = None,
+) -> SkillResolver:
+    return resolver if resolver is not None else SkillResolver(cwd=cwd, home=home, jobs=jobs)
+
+
+def _read_text(path: Path) -> str:
+    return path.read_text(encoding="utf-8")
+
+
+def list_skills(
+    *,
+    cwd: Path | None = None,
+    home: Path | None = None,
+    resolver: SkillResolver | None = None,
+    jobs: int | None = None,
+) -> CommandOutput:
+    skills = _resolver_for(resolver, cwd=cwd, home=home, jobs=jobs).all()
+    return CommandOutput(stdout=format_skill_list(skills))
+
+
+def read_skill(
+    skill_name: str,
+    *,
+    cwd: Path | None = None,
+    home: Path | None = None,
+    resolver: SkillResolver | None = None,
+    load: Callable[[Path], str] = _read_text,
+) -> CommandOutput:
+    """Return the ``read`` output and count the read; ``load`` supplies SKILL.md contents (the daemon caches them)."""
+
+    return read_skills([skill_name], cwd=cwd, home=home, resolver=resolver, load=load)
+
+
+def read_skills(
+    skill_names: Sequence[str],
+    *,
+    cwd: Path | None = None,
+    home: Path | None = None,
+    resolver: SkillResolver | None = None,
+    load: Callable[[Path], str] = _read_text,
+    max_bytes: int | None = None,
+    record: Callable[[str], None] = record_skill_read,
+) -> CommandOutput:
+    """Return the ``read`` output for several skills, resolved against one discovery pass.
+
+    Found skills are printed in the order given (duplicates once), each with
+    the usual framing and cut to ``max_bytes`` when set. Missing names are
+    reported together on stderr, and make the exit status 1. Each skill read
+    is passed to ``record`` (the usage log by default).
+    """
+
+    resolver = _resolver_for(resolver, cwd=cwd, home=home)
+    found = resolver.find_many(skill_names)
+
+    chunks = []
+    for skill in found.values():
+        if skill is not None:
+            content = truncate_skill_content(load(Path(skill.skill_path)), max_bytes, skill.name)
+            chunks.append(format_skill_read(skill, content))
+            record(skill.name)
+
+    missing = [name for name, skill in found.items() if skill is None]
+    if not missing:
+        return CommandOutput(stdout="".join(chunks))
+    return CommandOutput(1, stdout="".join(chunks), stderr=format_skills_not_found(missing, resolver.search_dirs))
+
+
+def answer(command: str, args: Sequence[str]) -> CommandOutput | None:
+    """Run ``read <name>...`` or ``list`` in-process; None for anything else."""
+
+    if command == "list" and not args:
+        return list_skills()
+    if command == "read" and args:
+        return read_skills(args)
+    return None
+
+
+def emit(output: CommandOutput) -> None:
+    """Print ``output`` and exit with its status when that is non-zero."""
+
+    if output.stdout:
+        sys.stdout.write(output.stdout)
+        sys.stdout.flush()
+    if output.stderr:
+        sys.stderr.write(output.stderr)
+    if output.code:
+        raise SystemExit(output.code)
+
+
+def list_skills_command(
+    *,
+    cwd: Path | None = None,
+    home: Path | None = None,
+    resolver: SkillResolver | None = None,
+    jobs: int | None = None,
+    output_format: str = "text",
+    fields: Sequence[str] | None = None,
+) -> None:
+    if output_format in ("json", "ndjson"):
+        from .utils.skill_output import SKILL_FIELDS, iter_skill_json, iter_skill_ndjson
+        from .utils.skills import iter_skills
+
+        fields = SKILL_FIELDS if fields is None else fields
+        resolver = _resolver_for(resolver, cwd=cwd, home=home, jobs=jobs)
+        # Records are written as each search root is scanned, not after the whole listing is sorted.
+        skills = iter_skills(
+            cwd=resolver.cwd, home=resolver.home, index=resolver.index, describe="description" in fields
+        )
+        render = iter_skill_ndjson if output_format == "ndjson" else iter_skill_json
+        sys.stdout.writelines(render(skills, fields))
+        sys.stdout.flush()
+        resolver.index.save()
+        return
+
+    if output_format == "xml":
+        # Same renderer sync uses for AGENTS.md, streamed one skill at a time.
+        from .utils.agents_md import iter_available_skills_xml
+
+        skills = _resolver_for(resolver, cwd=cwd, home=home, jobs=jobs).all()
+        sys.stdout.writelines(iter_available_skills_xml(skills))
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+        return
+
+    emit(list_skills(cwd=cwd, home=home, resolver=resolver, jobs=jobs))
+
+
+def read_skill_command(
+    skill_names: str | Sequence[str],
+    *,
+    cwd: Path | None = None,
+    home: Path | None = None,
+    resolver: SkillResolver | None = None,
+    max_bytes: int | None = None,
+) -> None:
+    names = [skill_names] if isinstance(skill_names, str) else skill_names
+    emit(read_skills(names, cwd=cwd, home=home, resolver=resolver, max_bytes=max_bytes))
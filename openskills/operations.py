@@ -3,51 +3,115 @@
 from __future__ import annotations
 
 import shutil
+import subprocess
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Sequence
+from typing import Iterable, Sequence
 
 import click
 
-from .utils.agents_md import replace_skills_section
-from .utils.dirs import DestinationInfo, get_search_dirs, resolve_destination
+from .lookup import _resolver_for, list_skills_command, read_skill_command
+from .utils.agents_md import (
+    DEFAULT_PRIORITY,
+    SectionPlan,
+    SkillBudget,
+    has_unclosed_skills_section,
+    iter_synced_agents_md,
+    locate_skills_section,
+    plan_skills_section,
+)
+from .utils.concurrency import map_ordered, resolve_jobs
+from .utils.dirs import DestinationInfo, get_cache_dir, resolve_destination
 from .utils.errors import EXIT_GENERIC_ERROR, EXIT_OK, exit_with_error
-from .utils.fs_ops import copy_skill_dir
+from .utils.fs_ops import (
+    LinkMode,
+    TransferResult,
+    confirm_overwrite,
+    copy_skill_dir,
+    prune_backups,
+    write_text_atomic,
+)
+from .utils.install_record import (
+    InstalledSkill,
+    forget_installs,
+    hash_skill_tree,
+    read_install_record,
+    record_installs,
+)
+from .utils.manifest import (
+    LockedSource,
+    ManifestError,
+    ManifestSource,
+    find_locked_source,
+    load_manifest,
+    lockfile_path,
+    read_lockfile,
+    write_lockfile,
+)
 from .utils.prompts import confirm_removal, prompt_for_removal_selection
-from .utils.repo_service import WorkingCopy, prepare_skill_working_copy
-from .utils.skill_validation import SkillDocument, load_skill_document
-from .utils.skills import Skill, discover_skills, find_skill
+from .utils.repo_service import WorkingCopy, prepare_skill_working_copy, remote_head
+from .utils.skill_index import IndexEntry, default_skill_index
+from .utils.skill_store import SkillStore, default_skill_store
+from .utils.skill_validation import SkillMetadata, load_skill_metadata
+from .utils.skill_walk import find_agents_md_files, find_skill_dirs
+from .utils.skills import Skill, SkillResolver, discover_skills
+from .utils.usage import read_usage_counts
 
+# Manifest sources are fetched concurrently by default: the work is network bound.
+MANIFEST_FETCH_JOBS = 4
 
-@dataclass(frozen=True)
+# Workspace AGENTS.md files are rendered and written on this many threads by default.
+SYNC_WRITE_JOBS = 8
+
+# Reported instead of "up to date" when a skills section has no closing tag.
+_UNCLOSED_SECTION = "skills section is opened but never closed (no </skills_system> or SKILLS_TABLE_END)"
+
+# Replaced skill trees go to this hidden folder of their skills root (discovery
+# skips it), and only the newest few per skill are kept.
+BACKUP_DIR = ".openskills-backups"
+BACKUPS_PER_SKILL = 3
+
+
+@dataclass(frozen=True, slots=True)
 class SkillCandidate:
     name: str
     description: str
     path: Path
 
 
-def _read_skill_document(path: Path) -> SkillDocument | None:
+def _read_skill_metadata(path: Path) -> SkillMetadata | None:
     try:
-        return load_skill_document(path, strict=False)
+        return load_skill_metadata(path, strict=False)
     except Exception:
         return None
 
 
-def _discover_skill_candidates(root: Path) -> list[SkillCandidate]:
+def _discover_skill_candidates(
+    root: Path,
+    *,
+    jobs: int = 1,
+    max_depth: int | None = None,
+) -> list[SkillCandidate]:
     candidates: list[SkillCandidate] = []
 
-    for skill_md in root.rglob("SKILL.md"):
-        document = _read_skill_document(skill_md)
-        if document is None:
+    skill_mds = [skill_dir / "SKILL.md" for skill_dir in find_skill_dirs(root, max_depth=max_depth)]
+    for skill_md, metadata in zip(skill_mds, map_ordered(_read_skill_metadata, skill_mds, jobs=jobs), strict=True):
+        if metadata is None:
             continue
 
-        name = document.metadata.name or skill_md.parent.name
-        description = document.metadata.description
+        name = metadata.name or skill_md.parent.name
+        description = metadata.description
         candidates.append(SkillCandidate(name=name, description=description, path=skill_md.parent))
 
     return candidates
 
 
+def _filter_candidates(candidates: Sequence[SkillCandidate], only: Sequence[str]) -> list[SkillCandidate]:
+    wanted = set(only)
+    return [candidate for candidate in candidates if candidate.name in wanted or candidate.path.name in wanted]
+
+
 def _select_candidates(candidates: Sequence[SkillCandidate], *, yes: bool) -> list[SkillCandidate]:
     if yes or len(candidates) <= 1:
         return list(candidates)
@@ -68,6 +132,134 @@ def _display_install_summary(result_label: str, dest: DestinationInfo) -> None:
     click.echo(result_label)
 
 
+def _install_candidates(
+    candidates: Sequence[SkillCandidate],
+    destination: DestinationInfo,
+    *,
+    yes: bool,
+    jobs: int = 1,
+    link_mode: LinkMode = "copy",
+    store: SkillStore | None = None,
+) -> list[TransferResult]:
+    """Install ``candidates`` and return one result per candidate, in order.
+
+    Overwrite prompts all happen up front on the calling thread; the approved
+    copies then run on up to ``jobs`` workers. A name that repeats an earlier
+    candidate is installed after the parallel batch so it overwrites the
+    first one exactly as a serial install would.
+
+    With a ``store`` each skill is added to it first and the target is linked
+    from the stored tree (``copy`` becomes ``hardlink`` there). Replaced trees
+    are renamed into :data:`BACKUP_DIR` of the skills root, which keeps the
+    swap on one filesystem, and pruned to :data:`BACKUPS_PER_SKILL` per skill.
+    """
+
+    def prompt(message: str) -> bool:
+        return click.confirm(message, default=False)
+
+    results: list[TransferResult | None] = [None] * len(candidates)
+    first: list[int] = []
+    repeats: list[int] = []
+    planned: set[Path] = set()
+
+    for index, candidate in enumerate(candidates):
+        target_dir = destination.target_dir / candidate.name
+        repeat = target_dir in planned
+        if repeat:
+            approved = yes or prompt(f"Skill already exists at {target_dir}. Overwrite?")
+        else:
+            approved = confirm_overwrite(str(target_dir), yes=yes, prompt=prompt)
+
+        if not approved:
+            results[index] = TransferResult(status="skipped", target_path=str(target_dir))
+        elif repeat:
+            repeats.append(index)
+        else:
+            first.append(index)
+            planned.add(target_dir)
+
+    backup_root = str(destination.target_dir / BACKUP_DIR)
+
+    def _link(candidate: SkillCandidate, target_dir: Path) -> TransferResult:
+        if store is None:
+            return copy_skill_dir(
+                str(candidate.path), str(target_dir), yes=True, backup_root=backup_root, link_mode=link_mode
+            )
+
+        digest = store.add(candidate.path)
+        store_mode: LinkMode = "hardlink" if link_mode == "copy" else link_mode
+        result = copy_skill_dir(
+            str(store.object_path(digest)), str(target_dir), yes=True, backup_root=backup_root, link_mode=store_mode
+        )
+        store.add_ref(digest, target_dir)
+        return result
+
+    def _transfer(index: int) -> TransferResult:
+        candidate = candidates[index]
+        result = _link(candidate, destination.target_dir / candidate.name)
+        if result.backup_path is not None:
+            prune_backups(backup_root, candidate.name, keep=BACKUPS_PER_SKILL)
+        return result
+
+    for index, result in zip(first, map_ordered(_transfer, first, jobs=jobs), strict=True):
+        results[index] = result
+    for index in repeats:
+        results[index] = _transfer(index)
+
+    return [result for result in results if result is not None]
+
+
+def _report_transfers(candidates: Sequence[SkillCandidate], results: Sequence[TransferResult]) -> None:
+    for candidate, result in zip(candidates, results, strict=True):
+        status = result.status
+        if status == "skipped":
+            click.echo(f"Skipped existing skill: {candidate.name}")
+        elif status == "backed_up":
+            click.echo(
+                f"Updated {candidate.name} -> {result.target_path} (backup: {result.backup_path})"
+            )
+        else:
+            click.echo(f"Installed {candidate.name} -> {result.target_path}")
+
+
+def _record_transfers(
+    destination: DestinationInfo,
+    working: WorkingCopy,
+    candidates: Sequence[SkillCandidate],
+    results: Sequence[TransferResult],
+    *,
+    ref: str | None = None,
+    jobs: int = 1,
+) -> None:
+    """Remember where each installed skill came from so ``update`` can refresh it."""
+
+    installed = [
+        candidate for candidate, result in zip(candidates, results, strict=True) if result.status != "skipped"
+    ]
+    hashes = map_ordered(hash_skill_tree, [candidate.path for candidate in installed], jobs=jobs)
+    record_installs(
+        destination.target_dir,
+        [
+            InstalledSkill(candidate.name, working.source, ref, working.subpath, working.commit, tree_hash)
+            for candidate, tree_hash in zip(installed, hashes, strict=True)
+        ],
+    )
+
+
+def _format_transfer_totals(results: Sequence[TransferResult], elapsed: float) -> str:
+    files = sum(result.files for result in results)
+    size = sum(result.bytes for result in results)
+    return f"Copied {files} file{'s' if files != 1 else ''} ({_format_bytes(size)}) in {elapsed:.2f}s"
+
+
+def _format_bytes(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KiB"
+    return f"{size / (1024 * 1024):.1f} MiB"
+
+
 def install_skill_command(
     source: str,
     *,
@@ -75,22 +267,44 @@ def install_skill_command(
     universal: bool,
     yes: bool,
     temp_root: str | None = None,
+    jobs: int | None = None,
+    max_depth: int | None = None,
+    use_cache: bool = False,
+    only: Sequence[str] | None = None,
+    link_mode: LinkMode = "copy",
+    use_store: bool = False,
 ) -> None:
     destination = resolve_destination(global_install=global_install, universal=universal)
+    mirror_cache = get_cache_dir() / "mirrors" if use_cache else None
+    store = default_skill_store() if use_store else None
 
     click.echo(f"Installing from: {source}")
     click.echo(f"Location: {destination.label}\n")
 
+    started = time.perf_counter()
     working: WorkingCopy | None = None
     try:
-        working = prepare_skill_working_copy(source, temp_root=temp_root)
+        working = prepare_skill_working_copy(
+            source,
+            temp_root=temp_root,
+            mirror_cache=mirror_cache,
+            only=only,
+            in_place=True,
+        )
     except Exception as exc:  # pragma: no cover - subprocess failures surfaced to user
         exit_with_error(str(exc))
 
     assert working is not None
 
     try:
-        candidates = _discover_skill_candidates(Path(working.path))
+        if link_mode == "symlink" and not working.in_place and store is None:
+            exit_with_error("--link symlink requires a local source directory or --store")
+        if not working.skill_root.is_dir():
+            exit_with_error(f"Path '{working.subpath}' not found in source")
+
+        candidates = _discover_skill_candidates(working.skill_root, jobs=resolve_jobs(jobs), max_depth=max_depth)
+        if only:
+            candidates = _filter_candidates(candidates, only)
         if not candidates:
             exit_with_error("No SKILL.md files found in source")
 
@@ -98,140 +312,545 @@ def install_skill_command(
         if not selected:
             exit_with_error("No skills selected for installation", code=EXIT_OK)
 
-        for candidate in selected:
-            target_dir = destination.target_dir / candidate.name
-            result = copy_skill_dir(
-                str(candidate.path),
-                str(target_dir),
-                yes=yes,
-                prompt=lambda message: click.confirm(message, default=False),
-            )
-            status = result.status
-            if status == "skipped":
-                click.echo(f"Skipped existing skill: {candidate.name}")
-            elif status == "backed_up":
-                click.echo(
-                    f"Updated {candidate.name} -> {result.target_path} (backup: {result.backup_path})"
-                )
-            else:
-                click.echo(f"Installed {candidate.name} -> {result.target_path}")
+        results = _install_candidates(
+            selected, destination, yes=yes, jobs=resolve_jobs(jobs), link_mode=link_mode, store=store
+        )
+        _report_transfers(selected, results)
+        _record_transfers(destination, working, selected, results, jobs=resolve_jobs(jobs))
 
-        _display_install_summary("", destination)
+        _display_install_summary(_format_transfer_totals(results, time.perf_counter() - started), destination)
     finally:
         working.cleanup()
 
 
-def _format_location(skill: Skill) -> str:
-    return "project" if skill.location == "project" else "global"
+@dataclass
+class _FetchedSource:
+    spec: ManifestSource
+    working: WorkingCopy | None = None
+    unchanged: LockedSource | None = None
+    error: str | None = None
 
 
-def list_skills_command(*, cwd: Path | None = None, home: Path | None = None) -> None:
-    skills = discover_skills(cwd=cwd, home=home)
+def _fetch_manifest_source(
+    spec: ManifestSource,
+    *,
+    locked: Sequence[LockedSource],
+    destination: DestinationInfo,
+    temp_root: str | None,
+    mirror_cache: Path | None,
+) -> _FetchedSource:
+    previous = find_locked_source(locked, spec)
+    if (
+        previous is not None
+        and previous.commit is not None
+        and all((destination.target_dir / name).exists() for name in previous.skills)
+        and remote_head(spec.source, spec.ref) == previous.commit
+    ):
+        return _FetchedSource(spec, unchanged=previous)
+
+    try:
+        working = prepare_skill_working_copy(
+            spec.source,
+            temp_root=temp_root,
+            mirror_cache=mirror_cache,
+            subpath=spec.subpath,
+            only=spec.only or None,
+            in_place=True,
+            ref=spec.ref,
+        )
+    except Exception as exc:  # noqa: BLE001 - reported per source, other sources continue
+        message = exc.stderr.strip() if isinstance(exc, subprocess.CalledProcessError) and exc.stderr else str(exc)
+        return _FetchedSource(spec, error=message)
+    return _FetchedSource(spec, working=working)
 
-    click.echo("Available Skills:\n")
 
-    if not skills:
-        click.echo("No skills installed.\n")
-        click.echo(
-            "\n".join(
-                [
-                    "Install skills:",
-                    "  openskills install owner/skill     Install from GitHub owner/repo",
-                    "  openskills install <git-url>       Install from Git URL",
-                    "  openskills install --help          See all install options",
-                ]
-            )
+def _install_fetched_source(
+    fetched: _FetchedSource,
+    destination: DestinationInfo,
+    *,
+    yes: bool,
+    jobs: int,
+    max_depth: int | None,
+    link_mode: LinkMode,
+    store: SkillStore | None,
+) -> tuple[LockedSource, list[TransferResult]]:
+    spec = fetched.spec
+    working = fetched.working
+    assert working is not None
+
+    if link_mode == "symlink" and not working.in_place and store is None:
+        raise ValueError("--link symlink requires a local source directory or --store")
+    if not working.skill_root.is_dir():
+        raise ValueError(f"Path '{working.subpath}' not found in source")
+
+    candidates = _discover_skill_candidates(working.skill_root, jobs=jobs, max_depth=max_depth)
+    if spec.only:
+        candidates = _filter_candidates(candidates, spec.only)
+    if not candidates:
+        raise ValueError("No SKILL.md files found in source")
+
+    results = _install_candidates(candidates, destination, yes=yes, jobs=jobs, link_mode=link_mode, store=store)
+    _report_transfers(candidates, results)
+    _record_transfers(destination, working, candidates, results, ref=spec.ref, jobs=jobs)
+
+    # A declined overwrite leaves an older tree in place, so don't pin it.
+    complete = all(result.status != "skipped" for result in results)
+    entry = LockedSource(
+        source=spec.source,
+        ref=spec.ref,
+        subpath=spec.subpath,
+        only=spec.only,
+        commit=working.commit if complete else None,
+        skills=tuple(candidate.name for candidate in candidates),
+    )
+    return entry, results
+
+
+def install_manifest_command(
+    manifest_path: Path | str,
+    *,
+    global_install: bool,
+    universal: bool,
+    yes: bool,
+    temp_root: str | None = None,
+    jobs: int | None = None,
+    max_depth: int | None = None,
+    use_cache: bool = False,
+    link_mode: LinkMode = "copy",
+    use_store: bool = False,
+) -> None:
+    """Install every source listed in a ``skills.toml`` manifest in one pass.
+
+    Sources are fetched concurrently (``jobs``, default 4). A source whose
+    lockfile commit still matches ``git ls-remote`` and whose skills are all
+    present is skipped without fetching. The lockfile is rewritten with the
+    commit each source was installed from.
+    """
+
+    destination = resolve_destination(global_install=global_install, universal=universal)
+    mirror_cache = get_cache_dir() / "mirrors" if use_cache else None
+
+    try:
+        sources = load_manifest(manifest_path)
+    except ManifestError as exc:
+        exit_with_error(str(exc))
+
+    lock_path = lockfile_path(manifest_path)
+    locked = read_lockfile(lock_path)
+    store = default_skill_store() if use_store else None
+
+    click.echo(f"Installing from manifest: {manifest_path} ({len(sources)} sources)")
+    click.echo(f"Location: {destination.label}\n")
+
+    started = time.perf_counter()
+    fetched = map_ordered(
+        lambda spec: _fetch_manifest_source(
+            spec, locked=locked, destination=destination, temp_root=temp_root, mirror_cache=mirror_cache
+        ),
+        sources,
+        jobs=resolve_jobs(jobs, default=MANIFEST_FETCH_JOBS),
+    )
+
+    entries: list[LockedSource] = []
+    results: list[TransferResult] = []
+    failures = 0
+    try:
+        for item in fetched:
+            spec = item.spec
+            if item.unchanged is not None:
+                click.echo(f"Unchanged: {spec.source} ({(item.unchanged.commit or '')[:12]})")
+                entries.append(item.unchanged)
+                continue
+
+            click.echo(f"Source: {spec.source}")
+            error = item.error
+            if error is None:
+                try:
+                    entry, installed = _install_fetched_source(
+                        item,
+                        destination,
+                        yes=yes,
+                        jobs=resolve_jobs(jobs),
+                        max_depth=max_depth,
+                        link_mode=link_mode,
+                        store=store,
+                    )
+                except ValueError as exc:
+                    error = str(exc)
+                else:
+                    entries.append(entry)
+                    results.extend(installed)
+
+            if error is not None:
+                failures += 1
+                click.echo(f"Failed to install {spec.source}: {error}", err=True)
+                previous = find_locked_source(locked, spec)
+                if previous is not None:
+                    entries.append(previous)
+    finally:
+        for item in fetched:
+            if item.working is not None:
+                item.working.cleanup()
+
+    write_lockfile(lock_path, entries)
+    _display_install_summary(_format_transfer_totals(results, time.perf_counter() - started), destination)
+    if failures:
+        exit_with_error(f"{failures} of {len(sources)} sources failed to install")
+
+
+@dataclass
+class _UpdateGroup:
+    source: str
+    ref: str | None
+    subpath: str | None
+    skills: list[InstalledSkill]
+    working: WorkingCopy | None = None
+    up_to_date: bool = False
+    error: str | None = None
+
+
+def _group_installed(skills: Iterable[InstalledSkill]) -> list[_UpdateGroup]:
+    groups: dict[tuple[str, str | None, str | None], _UpdateGroup] = {}
+    for skill in skills:
+        key = (skill.source, skill.ref, skill.subpath)
+        if key not in groups:
+            groups[key] = _UpdateGroup(skill.source, skill.ref, skill.subpath, [])
+        groups[key].skills.append(skill)
+    return list(groups.values())
+
+
+def _check_update_group(group: _UpdateGroup, *, temp_root: str | None, mirror_cache: Path | None) -> _UpdateGroup:
+    commits = {skill.commit for skill in group.skills}
+    if len(commits) == 1 and None not in commits and remote_head(group.source, group.ref) in commits:
+        group.up_to_date = True
+        return group
+
+    try:
+        group.working = prepare_skill_working_copy(
+            group.source,
+            temp_root=temp_root,
+            mirror_cache=mirror_cache,
+            subpath=group.subpath,
+            in_place=True,
+            ref=group.ref,
         )
+    except Exception as exc:  # noqa: BLE001 - reported per source, other sources continue
+        group.error = exc.stderr.strip() if isinstance(exc, subprocess.CalledProcessError) and exc.stderr else str(exc)
+    return group
+
+
+def _apply_update_group(group: _UpdateGroup, destination: DestinationInfo, *, jobs: int) -> list[TransferResult]:
+    working = group.working
+    assert working is not None
+
+    available = {}
+    if working.skill_root.is_dir():
+        available = {candidate.name: candidate for candidate in _discover_skill_candidates(working.skill_root, jobs=jobs)}
+
+    found: list[tuple[InstalledSkill, SkillCandidate]] = []
+    for skill in group.skills:
+        candidate = available.get(skill.name)
+        if candidate is None:
+            click.echo(f"  {skill.name}: no longer in {group.source}, left as is")
+        else:
+            found.append((skill, candidate))
+
+    hashes = map_ordered(hash_skill_tree, [candidate.path for _, candidate in found], jobs=jobs)
+    store = default_skill_store()
+    source_root = Path(working.path).resolve() if working.in_place else None
+    changed: list[SkillCandidate] = []
+    batches: dict[tuple[LinkMode, bool], list[SkillCandidate]] = {}
+    for (skill, candidate), tree_hash in zip(found, hashes, strict=True):
+        if tree_hash == skill.tree_hash:
+            continue
+        target_dir = destination.target_dir / skill.name
+        symlinked = target_dir.is_symlink()
+        from_store = store.linked_object(target_dir, skill.tree_hash) is not None
+        if symlinked and not from_store and source_root and target_dir.resolve().is_relative_to(source_root):
+            # Already points at the local source tree; there is nothing to rewrite.
+            continue
+        # Store installs are relinked from a new stored tree in the same mode.
+        mode: LinkMode = "symlink" if symlinked and from_store else "copy"
+        batches.setdefault((mode, from_store), []).append(candidate)
+        changed.append(candidate)
+
+    results: list[TransferResult] = []
+    for (mode, from_store), batch in batches.items():
+        batch_store = store if from_store else None
+        results.extend(_install_candidates(batch, destination, yes=True, jobs=jobs, link_mode=mode, store=batch_store))
+    for candidate in changed:
+        click.echo(f"  Updated {candidate.name}")
+    if not changed:
+        click.echo("  No skill contents changed")
+
+    # Only skills whose installed tree now matches the source move to the new commit.
+    rewritten = {candidate.name for candidate in changed}
+    record_installs(
+        destination.target_dir,
+        [
+            InstalledSkill(skill.name, skill.source, skill.ref, skill.subpath, working.commit, tree_hash)
+            for (skill, _), tree_hash in zip(found, hashes, strict=True)
+            if tree_hash == skill.tree_hash or skill.name in rewritten
+        ],
+    )
+    return results
+
+
+def update_skills_command(
+    names: Sequence[str] = (),
+    *,
+    global_install: bool = False,
+    universal: bool = True,
+    temp_root: str | None = None,
+    jobs: int | None = None,
+    use_cache: bool = False,
+) -> None:
+    """Refresh installed skills from the sources recorded at install time.
+
+    Sources are checked concurrently. A source whose recorded commit still
+    matches ``git ls-remote`` costs one round trip and nothing else; otherwise
+    it is fetched and only the skills whose tree hash differs are recopied
+    (the previous version is kept as a backup, as with ``install --yes``).
+    """
+
+    destination = resolve_destination(global_install=global_install, universal=universal)
+    record = read_install_record(destination.target_dir)
+
+    missing = [name for name in record if not (destination.target_dir / name).exists()]
+    if missing:
+        forget_installs(destination.target_dir, missing)
+        for name in missing:
+            del record[name]
+
+    if names:
+        unknown = [name for name in names if name not in record]
+        if unknown:
+            exit_with_error(f"No install record for: {', '.join(unknown)} (install them again to enable updates)")
+        record = {name: record[name] for name in names}
+
+    if not record:
+        click.echo(f"No updatable skills in {destination.label} (skills installed by this version are tracked)")
         return
 
-    sorted_skills = sorted(skills, key=lambda s: (s.location != "project", s.name.lower()))
+    mirror_cache = get_cache_dir() / "mirrors" if use_cache else None
+    started = time.perf_counter()
+    groups = map_ordered(
+        lambda group: _check_update_group(group, temp_root=temp_root, mirror_cache=mirror_cache),
+        _group_installed(record.values()),
+        jobs=resolve_jobs(jobs, default=MANIFEST_FETCH_JOBS),
+    )
 
-    for skill in sorted_skills:
-        label = "(project)" if skill.location == "project" else "(global)"
-        click.echo(f"  {skill.name:25} {label}")
-        click.echo(f"    {skill.description}\n")
+    results: list[TransferResult] = []
+    failures = 0
+    try:
+        for group in groups:
+            if group.up_to_date:
+                click.echo(f"Up to date: {group.source} ({len(group.skills)} skills)")
+            elif group.error is not None:
+                failures += 1
+                click.echo(f"Failed to check {group.source}: {group.error}", err=True)
+            else:
+                click.echo(f"Checking: {group.source}")
+                results.extend(_apply_update_group(group, destination, jobs=resolve_jobs(jobs)))
+    finally:
+        for group in groups:
+            if group.working is not None:
+                group.working.cleanup()
 
-    project_count = sum(1 for s in skills if s.location == "project")
-    global_count = len(skills) - project_count
-    click.echo(f"Summary: {project_count} project, {global_count} global ({len(skills)} total)")
+    elapsed = time.perf_counter() - started
+    click.echo(f"\nUpdated {len(results)} of {len(record)} skills in {elapsed:.2f}s")
+    if failures:
+        exit_with_error(f"{failures} of {len(groups)} sources could not be checked")
 
 
-def read_skill_command(skill_name: str, *, cwd: Path | None = None, home: Path | None = None) -> None:
-    skill = find_skill(skill_name, cwd=cwd, home=home)
-    if skill is None:
-        searched = "\n".join(f"  {path}" for path in get_search_dirs(cwd=cwd, home=home))
-        exit_with_error(
-            "\n".join(
-                [
-                    f"Error: Skill '{skill_name}' not found",
-                    "",
-                    "Searched:",
-                    searched,
-                    "",
-                    "Install skills: openskills install owner/repo",
-                ]
-            )
-        )
+def gc_store_command(*, dry_run: bool = False, home: Path | None = None) -> None:
+    """Delete skill trees in the content-addressed store that no install links to."""
 
-    content = Path(skill.skill_path).read_text(encoding="utf-8")
-    click.echo(f"Reading: {skill.name}")
-    click.echo(f"Base directory: {skill.base_dir}")
-    click.echo("")
-    click.echo(content)
-    click.echo("")
-    click.echo(f"Skill read: {skill.name}")
+    store = default_skill_store(home=home)
+    result = store.gc(dry_run=dry_run)
+    verb = "Would remove" if dry_run else "Removed"
+
+    for digest in result.removed:
+        click.echo(f"{verb} {digest[:16]}")
+    click.echo(
+        f"{verb} {len(result.removed)} unreferenced skill trees ({_format_bytes(result.freed_bytes)}), "
+        f"kept {result.kept} in {store.root}"
+    )
 
 
-def _choose_sync_skills(skills: Sequence[Skill], *, yes: bool) -> list[Skill]:
+def _format_location(skill: Skill) -> str:
+    return "project" if skill.location == "project" else "global"
+
+
+def _choose_sync_skills(skills: Sequence[Skill], *, yes: bool, current: Iterable[str] = ()) -> list[Skill]:
     if yes or len(skills) <= 1:
         return list(skills)
 
+    # Pre-select what AGENTS.md already lists; without a section, project skills.
+    listed = set(current)
     chosen: list[Skill] = []
     for skill in skills:
-        default = skill.location == "project"
+        default = skill.name in listed if listed else skill.location == "project"
         if click.confirm(f"Sync {skill.name} ({_format_location(skill)})?", default=default):
             chosen.append(skill)
     return chosen
 
 
-def _parse_current_skill_names(content: str) -> set[str]:
-    names: set[str] = set()
-    marker_start = "<!-- SKILLS_TABLE_START -->"
-    marker_end = "<!-- SKILLS_TABLE_END -->"
+def _sync_usage(budget: SkillBudget | None, priority: Sequence[str]) -> dict[str, int]:
+    # Usage only matters when a budget forces a choice of which skills to list.
+    if budget is None or budget.limit_bytes is None or "usage" not in priority:
+        return {}
+    return read_usage_counts()
+
 
-    if marker_start in content and marker_end in content:
-        segment = content.split(marker_start, 1)[1].split(marker_end, 1)[0]
-        for line in segment.splitlines():
-            if line.strip().startswith("<name>") and line.strip().endswith("</name>"):
-                names.add(line.replace("<name>", "").replace("</name>", "").strip())
-    return names
+def _format_section_plan(plan: SectionPlan) -> str:
+    text = f"{_format_bytes(plan.size_bytes)}, ~{plan.approx_tokens} tokens"
+    if plan.limit_bytes is None:
+        return text
+    text = f"{text} (budget {_format_bytes(plan.limit_bytes)})"
+    if plan.truncated or plan.collapsed:
+        text = (
+            f"{text}; {len(plan.skills)} of {plan.total} listed, "
+            f"{plan.truncated} descriptions shortened, {plan.collapsed} in the index line"
+        )
+    return text
 
 
-def sync_agents_md_command(*, yes: bool, cwd: Path | None = None) -> None:
+def sync_agents_md_command(
+    *,
+    yes: bool,
+    cwd: Path | None = None,
+    home: Path | None = None,
+    resolver: SkillResolver | None = None,
+    jobs: int | None = None,
+    budget: SkillBudget | None = None,
+    priority: Sequence[str] = DEFAULT_PRIORITY,
+) -> None:
     agents_md = Path(cwd or Path.cwd()) / "AGENTS.md"
     if not agents_md.exists():
         click.echo("No AGENTS.md to update")
         return
 
-    skills = discover_skills(cwd=cwd)
+    skills = _resolver_for(resolver, cwd=cwd, home=home, jobs=jobs).all()
     if not skills:
         click.echo("No skills installed. Install skills first: openskills install anthropics/skills --project")
         return
 
     content = agents_md.read_text(encoding="utf-8")
+    if has_unclosed_skills_section(content):
+        click.echo(f"Warning: {_UNCLOSED_SECTION}; AGENTS.md left unchanged", err=True)
+        return
 
-    chosen = _choose_sync_skills(skills, yes=yes)
+    section = locate_skills_section(content)
+    chosen = _choose_sync_skills(skills, yes=yes, current=section.names if section is not None else ())
     if not chosen:
-        agents_md.write_text(content, encoding="utf-8")
         click.echo("No skills selected; AGENTS.md left unchanged")
         return
 
-    updated = replace_skills_section(content, chosen)
-    agents_md.write_text(updated, encoding="utf-8")
+    plan = plan_skills_section(chosen, budget, usage=_sync_usage(budget, priority), priority=priority)
 
-    had_markers = "<skills_system" in content or "<!-- SKILLS_TABLE_START -->" in content
-    message = "Synced" if had_markers else "Added skills section to"
-    click.echo(f"✅ {message} AGENTS.md with {len(chosen)} skill(s)")
+    # Rewriting an identical file still bumps its mtime and busts editor/agent caches.
+    chunks = iter_synced_agents_md(content, plan.skills, overflow=plan.overflow)
+    if chunks is None:
+        click.echo(f"AGENTS.md already up to date with {len(chosen)} skill(s)")
+    else:
+        write_text_atomic(str(agents_md), chunks)
+        message = "Synced" if section is not None else "Added skills section to"
+        click.echo(f"✅ {message} AGENTS.md with {len(chosen)} skill(s)")
+    click.echo(f"Skills section: {_format_section_plan(plan)}")
+
+
+@dataclass(frozen=True)
+class _SyncOutcome:
+    path: Path
+    status: str  # "changed", "unchanged", "skipped" or "failed"
+    skills: int = 0
+    error: str | None = None
+    plan: SectionPlan | None = None
+
+
+def _sync_workspace_file(
+    agents_md: Path,
+    skills: Sequence[Skill],
+    budget: SkillBudget | None = None,
+    usage: dict[str, int] | None = None,
+    priority: Sequence[str] = DEFAULT_PRIORITY,
+) -> _SyncOutcome:
+    if not skills:
+        return _SyncOutcome(agents_md, "skipped")
+
+    plan = plan_skills_section(skills, budget, usage=usage, priority=priority)
+    try:
+        content = agents_md.read_text(encoding="utf-8")
+        if has_unclosed_skills_section(content):
+            return _SyncOutcome(agents_md, "failed", len(skills), _UNCLOSED_SECTION)
+        chunks = iter_synced_agents_md(content, plan.skills, overflow=plan.overflow)
+        if chunks is not None:
+            write_text_atomic(str(agents_md), chunks)
+    except (OSError, UnicodeDecodeError) as exc:
+        return _SyncOutcome(agents_md, "failed", len(skills), str(exc))
+    return _SyncOutcome(agents_md, "unchanged" if chunks is None else "changed", len(skills), plan=plan)
+
+
+def sync_workspaces_command(
+    *,
+    cwd: Path | None = None,
+    home: Path | None = None,
+    jobs: int | None = None,
+    budget: SkillBudget | None = None,
+    priority: Sequence[str] = DEFAULT_PRIORITY,
+) -> None:
+    """Sync every AGENTS.md under ``cwd`` with the skills visible from its own directory.
+
+    Global roots are scanned once for the whole run; each workspace adds its
+    project roots. Files are rendered and written in parallel, unchanged ones
+    are left alone, and every skill is synced (there is no interactive
+    selection across many files).
+    """
+
+    root = Path(cwd or Path.cwd())
+    files = find_agents_md_files(root)
+    if not files:
+        click.echo(f"No AGENTS.md files found under {root}")
+        return
+
+    started = time.perf_counter()
+    index = default_skill_index(home=home, jobs=resolve_jobs(jobs))
+    scanned: dict[Path, list[IndexEntry]] = {}
+    workspace_skills = [
+        discover_skills(cwd=agents_md.parent, home=home, index=index, scanned=scanned) for agents_md in files
+    ]
+    index.save()
+    usage = _sync_usage(budget, priority)
+
+    outcomes = map_ordered(
+        lambda pair: _sync_workspace_file(*pair, budget, usage, priority),
+        list(zip(files, workspace_skills, strict=True)),
+        jobs=resolve_jobs(jobs, default=SYNC_WRITE_JOBS),
+    )
+
+    counts = {"changed": 0, "unchanged": 0, "skipped": 0, "failed": 0}
+    for outcome in outcomes:
+        counts[outcome.status] += 1
+        relative = outcome.path.relative_to(root)
+        if outcome.status == "failed":
+            click.echo(f"  failed     {relative}: {outcome.error}", err=True)
+        elif outcome.status == "skipped":
+            click.echo(f"  skipped    {relative} (no skills installed)")
+        else:
+            assert outcome.plan is not None
+            click.echo(
+                f"  {outcome.status:<10} {relative} ({outcome.skills} skills) {_format_section_plan(outcome.plan)}"
+            )
+
+    elapsed = time.perf_counter() - started
+    click.echo(
+        f"\nSynced {len(files)} AGENTS.md file(s) in {elapsed:.2f}s: "
+        f"{counts['changed']} changed, {counts['unchanged']} unchanged, "
+        f"{counts['skipped']} skipped, {counts['failed']} failed"
+    )
+    if counts["failed"]:
+        exit_with_error(f"{counts['failed']} AGENTS.md file(s) could not be synced")
 
 
 def _remove_skill_folder(path: Path) -> None:
@@ -239,9 +858,21 @@ def _remove_skill_folder(path: Path) -> None:
         shutil.rmtree(path)
 
 
-def manage_skills_command(*, yes: bool, cwd: Path | None = None, home: Path | None = None) -> None:
-    skills = discover_skills(cwd=cwd, home=home)
-    names = [skill.name for skill in skills]
+def _forget_install(skill: Skill) -> None:
+    base_dir = Path(skill.base_dir)
+    forget_installs(base_dir.parent, [base_dir.name])
+
+
+def manage_skills_command(
+    *,
+    yes: bool,
+    cwd: Path | None = None,
+    home: Path | None = None,
+    resolver: SkillResolver | None = None,
+    jobs: int | None = None,
+) -> None:
+    resolver = _resolver_for(resolver, cwd=cwd, home=home, jobs=jobs)
+    names = [skill.name for skill in resolver.all()]
 
     selections = prompt_for_removal_selection(names, yes=yes)
     if not confirm_removal(selections, yes=yes):
@@ -249,26 +880,41 @@ def manage_skills_command(*, yes: bool, cwd: Path | None = None, home: Path | No
         return
 
     for skill_name in selections:
-        skill = find_skill(skill_name, cwd=cwd, home=home)
+        skill = resolver.find(skill_name)
         if skill:
             _remove_skill_folder(skill.base_dir)
+            resolver.forget(skill_name)
+            _forget_install(skill)
             click.echo(f"Removed {skill.name}")
 
 
-def remove_skill_command(skill_name: str, *, cwd: Path | None = None, home: Path | None = None) -> None:
-    skill = find_skill(skill_name, cwd=cwd, home=home)
+def remove_skill_command(
+    skill_name: str,
+    *,
+    cwd: Path | None = None,
+    home: Path | None = None,
+    resolver: SkillResolver | None = None,
+) -> None:
+    resolver = _resolver_for(resolver, cwd=cwd, home=home)
+    skill = resolver.find(skill_name)
     if skill is None:
         exit_with_error(f"Skill '{skill_name}' not found", code=EXIT_GENERIC_ERROR)
 
     _remove_skill_folder(skill.base_dir)
+    resolver.forget(skill_name)
+    _forget_install(skill)
     click.echo(f"Removed {skill.name}")
 
 
 __all__ = [
+    "gc_store_command",
+    "install_manifest_command",
     "install_skill_command",
     "list_skills_command",
     "manage_skills_command",
     "read_skill_command",
     "remove_skill_command",
     "sync_agents_md_command",
+    "sync_workspaces_command",
+    "update_skills_command",
 ]
@@ -1,52 +1,191 @@
-"""Utility helpers for the OpenSkills CLI."""
-
-from .agents_md import (
-    render_available_skills_xml,
-    render_skills_system,
-    render_usage_snippet,
-    replace_skills_section,
-)
-from .dirs import DestinationInfo, get_search_dirs, get_skills_dir, resolve_destination
-from .errors import EXIT_GENERIC_ERROR, EXIT_NOT_IMPLEMENTED, EXIT_OK, exit_not_implemented, exit_with_error
-from .fs_ops import TransferResult, backup_skill_dir, copy_skill_dir, move_skill_dir
-from .prompts import confirm_removal, prompt_for_removal_selection
-from .repo_service import WorkingCopy, git_clone, git_fetch, git_pull, prepare_skill_working_copy
-from .skill_validation import SkillDocument, SkillMetadata, SkillValidationError, load_skill_document
-from .skills import Skill, discover_skills, find_skill
-from .yaml import extract_yaml_field, has_valid_frontmatter
-
-__all__ = [
-    "EXIT_GENERIC_ERROR",
-    "EXIT_NOT_IMPLEMENTED",
-    "EXIT_OK",
-    "DestinationInfo",
-    "TransferResult",
-    "WorkingCopy",
-    "Skill",
-    "SkillDocument",
-    "SkillMetadata",
-    "SkillValidationError",
-    "confirm_removal",
-    "backup_skill_dir",
-    "copy_skill_dir",
-    "discover_skills",
-    "exit_not_implemented",
-    "exit_with_error",
-    "extract_yaml_field",
-    "find_skill",
-    "get_search_dirs",
-    "get_skills_dir",
-    "git_clone",
-    "git_fetch",
-    "git_pull",
-    "has_valid_frontmatter",
-    "load_skill_document",
-    "move_skill_dir",
-    "prepare_skill_working_copy",
-    "prompt_for_removal_selection",
-    "render_available_skills_xml",
-    "render_skills_system",
-    "render_usage_snippet",
-    "replace_skills_section",
-    "resolve_destination",
-]
+"""Utility helpers for the OpenSkills CLI.
+
+Submodules are imported on first attribute access (PEP 562), so
+``from openskills.utils import find_skill`` loads discovery without also
+pulling in git, archive and prompt helpers.
+"""
+
+# The TYPE_CHECKING imports only exist for type checkers, and ``__all__`` is
+# computed, so linters cannot match the two up.
+# ruff: noqa: F401, PLE0605
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .agents_md import (
+        SectionPlan,
+        SkillBudget,
+        SkillsSection,
+        estimate_tokens,
+        has_unclosed_skills_section,
+        iter_available_skills_xml,
+        iter_skills_system,
+        iter_synced_agents_md,
+        locate_skills_section,
+        plan_skills_section,
+        rank_skills,
+        render_available_skills_xml,
+        render_skills_system,
+        render_usage_snippet,
+        replace_skills_section,
+        skills_section_digest,
+        update_skills_section,
+    )
+    from .dirs import DestinationInfo, get_cache_dir, get_search_dirs, get_skills_dir, resolve_destination
+    from .errors import EXIT_GENERIC_ERROR, EXIT_NOT_IMPLEMENTED, EXIT_OK, exit_not_implemented, exit_with_error
+    from .fs_ops import (
+        LINK_MODES,
+        LinkMode,
+        TransferResult,
+        backup_skill_dir,
+        confirm_overwrite,
+        copy_skill_dir,
+        move_skill_dir,
+        prune_backups,
+        write_text_atomic,
+    )
+    from .install_record import InstalledSkill, forget_installs, hash_skill_tree, read_install_record, record_installs
+    from .manifest import LockedSource, ManifestError, ManifestSource, load_manifest, read_lockfile, write_lockfile
+    from .prompts import confirm_removal, prompt_for_removal_selection
+    from .repo_service import (
+        WorkingCopy,
+        git_clone,
+        git_fetch,
+        git_pull,
+        prepare_skill_working_copy,
+        remote_head,
+        sync_mirror,
+    )
+    from .skill_index import IndexEntry, SkillIndex, default_skill_index
+    from .skill_store import GcResult, SkillStore, default_skill_store
+    from .skill_validation import (
+        DocumentCacheStats,
+        SkillDocument,
+        SkillDocumentCache,
+        SkillMetadata,
+        SkillValidationError,
+        get_document_cache,
+        load_skill_document,
+        load_skill_metadata,
+    )
+    from .skills import (
+        Skill,
+        SkillResolver,
+        SkillTable,
+        discover_skill_table,
+        discover_skills,
+        find_skill,
+        iter_skills,
+    )
+    from .usage import read_usage_counts, record_skill_read, usage_log_path
+    from .yaml import (
+        Frontmatter,
+        FrontmatterError,
+        extract_yaml_field,
+        has_valid_frontmatter,
+        parse_frontmatter,
+        read_frontmatter,
+    )
+
+_SUBMODULE_EXPORTS = {
+    "agents_md": (
+        "SectionPlan",
+        "SkillBudget",
+        "SkillsSection",
+        "estimate_tokens",
+        "has_unclosed_skills_section",
+        "iter_available_skills_xml",
+        "iter_skills_system",
+        "iter_synced_agents_md",
+        "locate_skills_section",
+        "plan_skills_section",
+        "rank_skills",
+        "render_available_skills_xml",
+        "render_skills_system",
+        "render_usage_snippet",
+        "replace_skills_section",
+        "skills_section_digest",
+        "update_skills_section",
+    ),
+    "dirs": ("DestinationInfo", "get_cache_dir", "get_search_dirs", "get_skills_dir", "resolve_destination"),
+    "errors": ("EXIT_GENERIC_ERROR", "EXIT_NOT_IMPLEMENTED", "EXIT_OK", "exit_not_implemented", "exit_with_error"),
+    "fs_ops": (
+        "LINK_MODES",
+        "LinkMode",
+        "TransferResult",
+        "backup_skill_dir",
+        "confirm_overwrite",
+        "copy_skill_dir",
+        "move_skill_dir",
+        "prune_backups",
+        "write_text_atomic",
+    ),
+    "install_record": (
+        "InstalledSkill",
+        "forget_installs",
+        "hash_skill_tree",
+        "read_install_record",
+        "record_installs",
+    ),
+    "manifest": ("LockedSource", "ManifestError", "ManifestSource", "load_manifest", "read_lockfile", "write_lockfile"),
+    "prompts": ("confirm_removal", "prompt_for_removal_selection"),
+    "repo_service": (
+        "WorkingCopy",
+        "git_clone",
+        "git_fetch",
+        "git_pull",
+        "prepare_skill_working_copy",
+        "remote_head",
+        "sync_mirror",
+    ),
+    "skill_index": ("IndexEntry", "SkillIndex", "default_skill_index"),
+    "skill_store": ("GcResult", "SkillStore", "default_skill_store"),
+    "skill_validation": (
+        "DocumentCacheStats",
+        "SkillDocument",
+        "SkillDocumentCache",
+        "SkillMetadata",
+        "SkillValidationError",
+        "get_document_cache",
+        "load_skill_document",
+        "load_skill_metadata",
+    ),
+    "skills": (
+        "Skill",
+        "SkillResolver",
+        "SkillTable",
+        "discover_skill_table",
+        "discover_skills",
+        "find_skill",
+        "iter_skills",
+    ),
+    "usage": ("read_usage_counts", "record_skill_read", "usage_log_path"),
+    "yaml": (
+        "Frontmatter",
+        "FrontmatterError",
+        "extract_yaml_field",
+        "has_valid_frontmatter",
+        "parse_frontmatter",
+        "read_frontmatter",
+    ),
+}
+
+_EXPORT_MODULES = {name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names}
+
+# Built from the table above so each export is listed once outside TYPE_CHECKING.
+__all__ = sorted(_EXPORT_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,20 +1,84 @@
 """Rendering and synchronization helpers for AGENTS.md skill tables."""
 
-import re
-from collections.abc import Iterable, Sequence
+import hashlib
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, replace
 
 from .skills import Skill
 
 __all__ = [
     "render_usage_snippet",
+    "iter_available_skills_xml",
+    "iter_skills_system",
+    "iter_synced_agents_md",
     "render_available_skills_xml",
     "render_skills_system",
     "replace_skills_section",
+    "SkillsSection",
+    "has_unclosed_skills_section",
+    "locate_skills_section",
+    "BYTES_PER_TOKEN",
+    "DEFAULT_DESCRIPTION_CHARS",
+    "DEFAULT_PRIORITY",
+    "SectionPlan",
+    "SkillBudget",
+    "estimate_tokens",
+    "plan_skills_section",
+    "rank_skills",
+    "skills_section_digest",
+    "update_skills_section",
 ]
 
 _SKILLS_TABLE_START = "<!-- SKILLS_TABLE_START -->"
 _SKILLS_TABLE_END = "<!-- SKILLS_TABLE_END -->"
 
+# Budgeted rendering: tokens are estimated from bytes; overlong descriptions are cut to this many characters.
+BYTES_PER_TOKEN = 4
+DEFAULT_DESCRIPTION_CHARS = 160
+DEFAULT_PRIORITY: tuple[str, ...] = ("location", "usage", "name")
+
+_SYSTEM_OPEN = "<skills_system"
+_SYSTEM_CLOSE = "</skills_system>"
+
+# Written by ``sync`` right before the section; records the SHA-256 of what it rendered.
+_DIGEST_MARKER_PREFIX = "<!-- openskills:skills-sha256="
+_DIGEST_MARKER = _DIGEST_MARKER_PREFIX + "{digest} -->\n"
+_DIGEST_MARKER_LENGTH = len(_DIGEST_MARKER.format(digest="0" * 64))
+
+
+@dataclass(frozen=True, slots=True)
+class SkillBudget:
+    """Size limit for the skills section; ``max_tokens`` is converted at :data:`BYTES_PER_TOKEN`."""
+
+    max_bytes: int | None = None
+    max_tokens: int | None = None
+    description_chars: int = DEFAULT_DESCRIPTION_CHARS
+
+    @property
+    def limit_bytes(self) -> int | None:
+        limits = [limit for limit in (self.max_bytes, self._token_bytes()) if limit is not None]
+        return min(limits) if limits else None
+
+    def _token_bytes(self) -> int | None:
+        return None if self.max_tokens is None else self.max_tokens * BYTES_PER_TOKEN
+
+
+@dataclass(frozen=True, slots=True)
+class SectionPlan:
+    """Which skills a (possibly budgeted) skills section lists, and how large it is."""
+
+    skills: tuple[Skill, ...]
+    overflow: str | None
+    size_bytes: int
+    total: int
+    truncated: int = 0
+    collapsed: int = 0
+    limit_bytes: int | None = None
+
+    @property
+    def approx_tokens(self) -> int:
+        return estimate_tokens(self.size_bytes)
+
 
 def render_usage_snippet() -> str:
     """Return the static usage guidance block used inside <skills_system>."""
@@ -46,45 +110,409 @@ def _render_skill_entry(skill: Skill) -> str:
     )
 
 
+def iter_available_skills_xml(skills: Iterable[Skill], *, overflow: str | None = None) -> Iterator[str]:
+    """Yield the <available_skills> block in chunks (one per skill), without building it whole.
+
+    ``overflow`` is an index line (see :func:`plan_skills_section`) emitted
+    after the last skill.
+    """
+
+    yield "<available_skills>\n\n"
+    position = -1
+    for position, skill in enumerate(skills):
+        if position:
+            yield "\n\n"
+        yield _render_skill_entry(skill)
+    if overflow is not None:
+        yield "\n\n" if position >= 0 else ""
+        yield overflow
+    yield "\n\n</available_skills>"
+
+
 def render_available_skills_xml(skills: Sequence[Skill] | Iterable[Skill]) -> str:
     """Render the <available_skills> block matching the Node output."""
 
-    entries = [_render_skill_entry(skill) for skill in skills]
-    inner = "\n\n".join(entries)
-    return f"<available_skills>\n\n{inner}\n\n</available_skills>"
+    return "".join(iter_available_skills_xml(skills))
 
 
-def render_skills_system(skills: Sequence[Skill] | Iterable[Skill]) -> str:
-    """Render the full <skills_system> XML payload."""
+def _iter_section_body(skills: Iterable[Skill], overflow: str | None) -> Iterator[str]:
+    yield "## Available Skills\n\n"
+    yield f"{_SKILLS_TABLE_START}\n"
+    yield render_usage_snippet()
+    yield "\n\n"
+    yield from iter_available_skills_xml(skills, overflow=overflow)
+    yield f"\n{_SKILLS_TABLE_END}"
 
-    usage = render_usage_snippet()
-    available_skills = render_available_skills_xml(skills)
 
-    return (
-        "<skills_system priority=\"1\">\n\n"
-        "## Available Skills\n\n"
-        f"{_SKILLS_TABLE_START}\n"
-        f"{usage}\n\n"
-        f"{available_skills}\n"
-        f"{_SKILLS_TABLE_END}\n\n"
-        "</skills_system>"
-    )
+def iter_skills_system(skills: Iterable[Skill], *, overflow: str | None = None) -> Iterator[str]:
+    """Yield the full <skills_system> payload in chunks; ``"".join`` gives :func:`render_skills_system`."""
+
+    yield '<skills_system priority="1">\n\n'
+    yield from _iter_section_body(skills, overflow)
+    yield "\n\n</skills_system>"
+
+
+def render_skills_system(
+    skills: Sequence[Skill] | Iterable[Skill],
+    *,
+    budget: SkillBudget | None = None,
+    usage: Mapping[str, int] | None = None,
+    priority: Sequence[str] = DEFAULT_PRIORITY,
+) -> str:
+    """Render the full <skills_system> XML payload.
+
+    With a ``budget`` the skills are ranked and fitted first; see
+    :func:`plan_skills_section`.
+    """
+
+    if budget is None:
+        return "".join(iter_skills_system(skills))
+
+    plan = plan_skills_section(skills, budget, usage=usage, priority=priority)
+    return "".join(iter_skills_system(plan.skills, overflow=plan.overflow))
+
+
+def estimate_tokens(size_bytes: int) -> int:
+    """Rough token count for English-like markup (about four bytes per token)."""
+
+    return -(-size_bytes // BYTES_PER_TOKEN)
+
+
+def rank_skills(
+    skills: Iterable[Skill],
+    *,
+    usage: Mapping[str, int] | None = None,
+    priority: Sequence[str] = DEFAULT_PRIORITY,
+) -> list[Skill]:
+    """Order skills by ``priority`` keys: ``location`` (project first), ``usage`` (most read first), ``name``."""
+
+    unknown = [key for key in priority if key not in DEFAULT_PRIORITY]
+    if unknown:
+        raise ValueError(f"Unknown priority key(s): {', '.join(unknown)} (choose from {', '.join(DEFAULT_PRIORITY)})")
+
+    counts = usage or {}
+    extractors = {
+        "location": lambda skill: skill.location != "project",
+        "usage": lambda skill: -counts.get(skill.name, 0),
+        "name": lambda skill: skill.name.lower(),
+    }
+    keys = [extractors[key] for key in priority]
+    return sorted(skills, key=lambda skill: tuple(key(skill) for key in keys))
+
+
+def plan_skills_section(
+    skills: Iterable[Skill],
+    budget: SkillBudget | None = None,
+    *,
+    usage: Mapping[str, int] | None = None,
+    priority: Sequence[str] = DEFAULT_PRIORITY,
+) -> SectionPlan:
+    """Fit ``skills`` into ``budget`` and report the rendered size.
+
+    Without a byte limit every skill is listed in the given order. Otherwise
+    skills are ranked with :func:`rank_skills`; if they do not all fit with
+    full descriptions, descriptions are capped at ``description_chars`` and
+    skills are listed in rank order while they fit. The rest are collapsed
+    into one ``<more_skills>`` index line naming as many as the remaining
+    room allows. Only the fixed part of the section exceeding the limit on
+    its own can push the result over budget.
+    """
+
+    skills = list(skills)
+    limit = budget.limit_bytes if budget is not None else None
+    base = _utf8_len("".join(iter_skills_system([])))
+
+    if limit is None:
+        return SectionPlan(tuple(skills), None, base + _items_size(map(_entry_size, skills)), len(skills))
+
+    assert budget is not None
+    ranked = rank_skills(skills, usage=usage, priority=priority)
+    full_size = base + _items_size(map(_entry_size, ranked))
+    if full_size <= limit:
+        return SectionPlan(tuple(ranked), None, full_size, len(ranked), limit_bytes=limit)
+
+    listed: list[Skill] = []
+    used = base
+    for position, skill in enumerate(ranked):
+        shortened = _shorten(skill, budget.description_chars)
+        cost = _entry_size(shortened) + (2 if listed else 0)
+        remaining = len(ranked) - position - 1
+        reserve = _overflow_size(remaining, (), separator=True) if remaining else 0
+        if used + cost + reserve > limit:
+            break
+        listed.append(shortened)
+        used += cost
+
+    truncated = sum(1 for original, kept in zip(ranked, listed, strict=False) if kept is not original)
+    rest = [skill.name for skill in ranked[len(listed) :]]
+    if not rest:
+        return SectionPlan(tuple(listed), None, used, len(ranked), truncated, 0, limit)
+
+    overflow = _fit_overflow(rest, limit - used, separator=bool(listed))
+    size = used + (2 if listed else 0) + _utf8_len(overflow)
+    return SectionPlan(tuple(listed), overflow, size, len(ranked), truncated, len(rest), limit)
+
+
+def _utf8_len(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def _entry_size(skill: Skill) -> int:
+    return _utf8_len(_render_skill_entry(skill))
+
+
+def _items_size(sizes: Iterable[int]) -> int:
+    total = count = 0
+    for size in sizes:
+        total += size
+        count += 1
+    return total + 2 * max(count - 1, 0)
+
+
+def _shorten(skill: Skill, limit: int) -> Skill:
+    if len(skill.description) <= limit:
+        return skill
+    return replace(skill, description=skill.description[: max(limit - 1, 0)].rstrip() + "\u2026")
+
+
+def _render_overflow(count: int, names: Sequence[str], omitted: int) -> str:
+    listed = ", ".join(names)
+    if omitted:
+        listed = f"{listed}, +{omitted} more" if listed else f"+{omitted} more"
+    return f'<more_skills count="{count}">{listed}</more_skills>'
+
+
+def _overflow_size(count: int, names: Sequence[str], *, separator: bool) -> int:
+    return _utf8_len(_render_overflow(count, names, count - len(names))) + (2 if separator else 0)
+
+
+def _fit_overflow(names: Sequence[str], room: int, *, separator: bool) -> str:
+    # Name as many collapsed skills as fit; the count and "+N more" always stay.
+    kept: list[str] = []
+    for name in names:
+        if _overflow_size(len(names), [*kept, name], separator=separator) > room:
+            break
+        kept.append(name)
+    return _render_overflow(len(names), kept, len(names) - len(kept))
 
 
 def replace_skills_section(content: str, skills: Sequence[Skill] | Iterable[Skill]) -> str:
     """Replace or append the skills section inside an AGENTS.md document."""
 
-    new_section = render_skills_system(skills)
+    return _replace_section(content, skills)
+
+
+def skills_section_digest(section: str) -> str:
+    """Return the hex SHA-256 of a rendered ``<skills_system>`` section."""
+
+    return hashlib.sha256(section.encode("utf-8")).hexdigest()
+
+
+def update_skills_section(
+    content: str, skills: Sequence[Skill] | Iterable[Skill], *, overflow: str | None = None
+) -> tuple[str, bool]:
+    """Bring the skills section and its hash marker up to date; return ``(content, changed)``.
+
+    When the marker already records the digest of the freshly rendered
+    section and that section is present verbatim, ``content`` is returned
+    as-is so callers can skip rewriting the file.
+    """
+
+    chunks = iter_synced_agents_md(content, skills, overflow=overflow)
+    return (content, False) if chunks is None else ("".join(chunks), True)
+
+
+def iter_synced_agents_md(
+    content: str, skills: Sequence[Skill] | Iterable[Skill], *, overflow: str | None = None
+) -> Iterator[str] | None:
+    """Return the updated document as chunks (head, marker, section, tail), or None if it is current.
+
+    The section is rendered chunk by chunk for hashing and comparison and
+    again while the result is consumed, so no full-size copy of it is built;
+    pass the chunks to a file's ``writelines`` to stream AGENTS.md out.
+    ``overflow`` is the index line of a budgeted plan (:func:`plan_skills_section`).
+    """
+
+    if isinstance(skills, Iterator):
+        skills = list(skills)
+
+    section = locate_skills_section(content)
+    if section is None and _has_unclosed_section(content):
+        return None
+
+    digest = hashlib.sha256()
+    same = section is not None and section.kind == "system"
+    position = section.start if section is not None else 0
+    for chunk in iter_skills_system(skills, overflow=overflow):
+        digest.update(chunk.encode("utf-8"))
+        if same:
+            same = content.startswith(chunk, position)
+            position += len(chunk)
+    marker = _DIGEST_MARKER.format(digest=digest.hexdigest())
+
+    if section is None:
+        stripped_end = len(content.rstrip())
+        return _chain(
+            [content[:stripped_end], "\n\n" if stripped_end else "", marker],
+            iter_skills_system(skills, overflow=overflow),
+            ["\n"],
+        )
+
+    if section.digest == digest.hexdigest():
+        if section.kind == "system":
+            current = same and position == section.end
+        else:
+            current = _matches(content, section.start, section.end, _iter_table_section(skills, overflow))
+        if current:
+            return None
+
+    if section.kind == "system":
+        replacement = iter_skills_system(skills, overflow=overflow)
+    else:
+        replacement = _iter_table_section(skills, overflow)
+    return _chain([content[: section.marker_start], marker], replacement, [content[section.end :]])
+
+
+def _iter_table_section(skills: Iterable[Skill], overflow: str | None = None) -> Iterator[str]:
+    # Bare table markers get the <skills_system> body without its tags, wrapped in the markers again.
+    yield f"{_SKILLS_TABLE_START}\n"
+    yield from _iter_section_body(skills, overflow)
+    yield f"\n{_SKILLS_TABLE_END}"
+
+
+def _chain(*parts: Iterable[str]) -> Iterator[str]:
+    for part in parts:
+        yield from part
+
+
+def _matches(content: str, start: int, end: int, chunks: Iterable[str]) -> bool:
+    position = start
+    for chunk in chunks:
+        if not content.startswith(chunk, position):
+            return False
+        position += len(chunk)
+    return position == end
 
-    if "<skills_system" in content:
-        return re.sub(r"<skills_system[^>]*>[\s\S]*?</skills_system>", new_section, content, count=1)
 
-    if _SKILLS_TABLE_START in content and _SKILLS_TABLE_END in content:
-        inner = re.sub(r"</?skills_system[^>]*>", "", new_section).strip("\n")
-        pattern = rf"{re.escape(_SKILLS_TABLE_START)}[\s\S]*?{re.escape(_SKILLS_TABLE_END)}"
-        replacement = f"{_SKILLS_TABLE_START}\n{inner}\n{_SKILLS_TABLE_END}"
-        return re.sub(pattern, replacement, content, count=1)
+@dataclass(frozen=True, slots=True)
+class SkillsSection:
+    """Location of the skills section inside an AGENTS.md document.
 
+    ``kind`` is ``"system"`` for a ``<skills_system>`` block and ``"table"`` for
+    bare ``SKILLS_TABLE_START``/``END`` markers. ``content[start:end]`` is the
+    section; ``marker_start`` is where the sync digest marker line begins (equal
+    to ``start`` when there is none). ``names`` are the skills listed in it.
+    """
+
+    kind: str
+    start: int
+    end: int
+    marker_start: int
+    digest: str | None
+    names: tuple[str, ...]
+
+
+def locate_skills_section(content: str) -> SkillsSection | None:
+    """Find the skills section with plain substring searches; ``None`` if there is no complete one.
+
+    Matches what the previous regexes did: the first ``<skills_system ...>``
+    up to the next ``</skills_system>``, else the first table start marker up
+    to the next end marker. Every search moves forward, so the whole scan is
+    linear in the document size.
+    """
+
+    open_at = content.find(_SYSTEM_OPEN)
+    if open_at >= 0:
+        tag_end = content.find(">", open_at)
+        close_at = content.find(_SYSTEM_CLOSE, tag_end + 1) if tag_end >= 0 else -1
+        if close_at < 0:
+            return None
+        kind, start, end = "system", open_at, close_at + len(_SYSTEM_CLOSE)
+    else:
+        table_at = content.find(_SKILLS_TABLE_START)
+        if table_at < 0:
+            return None
+        table_end = _table_end(content, table_at)
+        if table_end < 0:
+            return None
+        kind, start, end = "table", table_at, table_end + len(_SKILLS_TABLE_END)
+
+    marker_start, digest = start, None
+    candidate = start - _DIGEST_MARKER_LENGTH
+    if candidate >= 0 and content.startswith(_DIGEST_MARKER_PREFIX, candidate) and content[start - 1] == "\n":
+        digest = content[candidate + len(_DIGEST_MARKER_PREFIX) : candidate + len(_DIGEST_MARKER_PREFIX) + 64]
+        marker_start = candidate
+
+    return SkillsSection(kind, start, end, marker_start, digest, _listed_names(content, start, end))
+
+
+def _table_end(content: str, table_at: int) -> int:
+    """Return the end marker closing the table that starts at ``table_at``, or -1.
+
+    A synced table nests a second marker pair inside the first (the section
+    body carries its own markers), so markers are matched by depth; when they
+    do not balance, the first end marker wins, as with the old regex.
+    """
+
+    first_end = content.find(_SKILLS_TABLE_END, table_at)
+    depth = 0
+    position = table_at
+    while True:
+        next_start = content.find(_SKILLS_TABLE_START, position)
+        next_end = content.find(_SKILLS_TABLE_END, position)
+        if next_end < 0:
+            return first_end
+        if 0 <= next_start < next_end:
+            depth += 1
+            position = next_start + len(_SKILLS_TABLE_START)
+            continue
+        depth -= 1
+        if depth == 0:
+            return next_end
+        position = next_end + len(_SKILLS_TABLE_END)
+
+
+def _listed_names(content: str, start: int, end: int) -> tuple[str, ...]:
+    table_at = content.find(_SKILLS_TABLE_START, start, end)
+    if table_at < 0:
+        return ()
+    table_end = content.find(_SKILLS_TABLE_END, table_at, end)
+
+    names = []
+    for line in content[table_at : table_end if table_end >= 0 else end].splitlines():
+        stripped = line.strip()
+        if stripped.startswith("<name>") and stripped.endswith("</name>"):
+            names.append(stripped[len("<name>") : -len("</name>")].strip())
+    return tuple(names)
+
+
+def _has_unclosed_section(content: str) -> bool:
+    # The old regexes left such documents untouched instead of appending a second section.
+    return _SYSTEM_OPEN in content or (_SKILLS_TABLE_START in content and _SKILLS_TABLE_END in content)
+
+
+def has_unclosed_skills_section(content: str) -> bool:
+    """Return whether ``content`` opens a skills section that never closes.
+
+    Such a document is left untouched by every sync helper (appending a second
+    section would duplicate it), so callers should report it as malformed.
+    """
+
+    return locate_skills_section(content) is None and _has_unclosed_section(content)
+
+
+def _append_section(content: str, new_section: str) -> str:
     stripped = content.rstrip()
     separator = "\n\n" if stripped else ""
     return f"{stripped}{separator}{new_section}\n"
+
+
+def _replace_section(content: str, skills: Iterable[Skill]) -> str:
+    section = locate_skills_section(content)
+    if section is None:
+        if _has_unclosed_section(content):
+            return content
+        return _append_section(content, render_skills_system(skills))
+
+    replacement = iter_skills_system(skills) if section.kind == "system" else _iter_table_section(skills)
+    return "".join(_chain([content[: section.start]], replacement, [content[section.end :]]))
@@ -0,0 +1,46 @@
+"""Bounded, order-preserving fan-out for I/O-heavy skill scans."""
+
+import os
+from collections.abc import Callable, Iterable
+from typing import TypeVar
+
+__all__ = ["JOBS_ENV", "map_ordered", "resolve_jobs"]
+
+JOBS_ENV = "OPENSKILLS_JOBS"
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def resolve_jobs(jobs: int | None = None, *, default: int = 1) -> int:
+    """Return the worker count to use, defaulting to ``OPENSKILLS_JOBS`` or ``default``.
+
+    Unparsable environment values fall back to ``default``; values below 1
+    mean serial mode.
+    """
+
+    if jobs is None:
+        try:
+            jobs = int(os.environ.get(JOBS_ENV, default))
+        except ValueError:
+            jobs = default
+
+    return max(1, jobs)
+
+
+def map_ordered(fn: Callable[[_T], _R], items: Iterable[_T], *, jobs: int = 1) -> list[_R]:
+    """Apply ``fn`` to ``items`` on up to ``jobs`` threads, keeping input order.
+
+    With ``jobs <= 1`` (or fewer than two items) this is a plain serial map, so
+    the serial path never pays for thread start-up.
+    """
+
+    materialized = list(items)
+    if jobs <= 1 or len(materialized) <= 1:
+        return [fn(item) for item in materialized]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = min(jobs, len(materialized))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="openskills-scan") as pool:
+        return list(pool.map(fn, materialized))
@@ -1,5 +1,6 @@
 """Directory resolution helpers for skill installation roots."""
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
@@ -68,6 +69,26 @@ def get_search_dirs(
     ]
 
 
+def get_cache_dir(*, home: Path | str | None = None) -> Path:
+    """Return the directory used for OpenSkills caches (skill index, mirrors).
+
+    ``OPENSKILLS_CACHE_DIR`` wins when set. An explicit ``home`` hint keeps the
+    cache inside that home directory, otherwise ``XDG_CACHE_HOME`` and finally
+    ``~/.cache`` are used.
+    """
+
+    override = os.environ.get("OPENSKILLS_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+
+    if home is not None:
+        return _as_path(home, default=Path.home()) / ".cache/openskills"
+
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "openskills"
+
+
 @dataclass(frozen=True)
 class DestinationInfo:
     target_dir: Path
@@ -98,4 +119,4 @@ def resolve_destination(
     return DestinationInfo(target_dir=target_dir, folder=folder, scope=scope, label=label)
 
 
-__all__ = ["get_skills_dir", "get_search_dirs", "DestinationInfo", "resolve_destination"]
+__all__ = ["get_cache_dir", "get_skills_dir", "get_search_dirs", "DestinationInfo", "resolve_destination"]
@@ -2,12 +2,20 @@
 
 import os
 import shutil
+import stat
+import tempfile
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from typing import Literal
 
 PromptFn = Callable[[str], bool]
+LinkMode = Literal["copy", "symlink", "hardlink", "reflink"]
+
+LINK_MODES: tuple[LinkMode, ...] = ("copy", "symlink", "hardlink", "reflink")
+
+# Linux FICLONE ioctl (_IOW(0x94, 9, int)): share extents on btrfs/XFS/bcachefs.
+_FICLONE = 0x40049409
 
 
 @dataclass
@@ -15,6 +23,8 @@ class TransferResult:
     status: Literal["copied", "backed_up", "moved", "skipped"]
     target_path: str
     backup_path: str | None = None
+    files: int = 0
+    bytes: int = 0
 
 
 def backup_skill_dir(target_dir: str, backup_root: str | None = None) -> str:
@@ -28,6 +38,138 @@ def backup_skill_dir(target_dir: str, backup_root: str | None = None) -> str:
     return backup_path
 
 
+def prune_backups(backup_root: str, name: str, *, keep: int) -> list[str]:
+    """Delete all but the newest ``keep`` backups of skill ``name`` in ``backup_root``; return the removed paths."""
+
+    try:
+        entries = os.listdir(backup_root)
+    except FileNotFoundError:
+        return []
+
+    stamped: list[tuple[int, str]] = []
+    for entry in entries:
+        prefix, sep, stamp = entry.rpartition(".backup-")
+        if sep and prefix == name and stamp.isdigit():
+            stamped.append((int(stamp), os.path.join(backup_root, entry)))
+
+    stamped.sort(reverse=True)
+    removed = [path for _, path in stamped[max(keep, 0) :]]
+    for path in removed:
+        _remove_path(path)
+    return removed
+
+
+def _hardlink_or_copy(src: str, dst: str) -> str:
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device or unsupported filesystem: fall back to a real copy.
+        return shutil.copy2(src, dst)
+    return dst
+
+
+def _reflink_or_copy(src: str, dst: str) -> str:
+    try:
+        import fcntl
+
+        with open(src, "rb") as src_handle, open(dst, "wb") as dst_handle:
+            fcntl.ioctl(dst_handle.fileno(), _FICLONE, src_handle.fileno())
+        shutil.copystat(src, dst)
+    except (ImportError, OSError):
+        return shutil.copy2(src, dst)
+    return dst
+
+
+def _materialize(source_dir: str, target_dir: str, link_mode: LinkMode) -> tuple[int, int]:
+    """Create ``target_dir`` from ``source_dir``; return ``(files, bytes)`` transferred."""
+
+    os.makedirs(os.path.dirname(target_dir), exist_ok=True)
+
+    if link_mode == "symlink":
+        os.symlink(os.path.abspath(source_dir), target_dir, target_is_directory=True)
+        return 0, 0
+
+    copy_file = {"hardlink": _hardlink_or_copy, "reflink": _reflink_or_copy}.get(link_mode, shutil.copy2)
+    files = 0
+    size = 0
+
+    def _counting_copy(src: str, dst: str) -> str:
+        nonlocal files, size
+        result = copy_file(src, dst)
+        files += 1
+        size += os.path.getsize(dst)
+        return result
+
+    shutil.copytree(source_dir, target_dir, copy_function=_counting_copy)
+    return files, size
+
+
+def _remove_path(path: str) -> None:
+    if os.path.islink(path):
+        os.unlink(path)
+    else:
+        shutil.rmtree(path)
+
+
+def _swap_into_place(
+    source_dir: str,
+    target_dir: str,
+    link_mode: LinkMode,
+    backup_root: str | None,
+) -> tuple[str, int, int]:
+    """Replace ``target_dir`` with a copy of ``source_dir`` using renames.
+
+    The new tree is staged next to the target, the old directory is renamed to
+    its backup name and the staged tree is renamed into place. Both renames
+    stay on one filesystem, so they are O(1) and readers only ever see a
+    complete old or new tree (plus a gap of one rename between the two).
+    """
+
+    parent = os.path.dirname(target_dir)
+    name = os.path.basename(target_dir)
+    stamp = int(time.time() * 1000)
+    staging = os.path.join(parent, f".{name}.staging-{stamp}-{os.getpid()}")
+    local_backup = os.path.join(parent, f"{name}.backup-{stamp}")
+    backup_path = os.path.join(backup_root or parent, f"{name}.backup-{stamp}")
+
+    try:
+        files, size = _materialize(source_dir, staging, link_mode)
+    except BaseException:
+        if os.path.lexists(staging):
+            _remove_path(staging)
+        raise
+
+    aside = backup_path
+    try:
+        os.makedirs(os.path.dirname(backup_path), exist_ok=True)
+        os.rename(target_dir, backup_path)
+    except OSError:
+        # The backup root is on another filesystem: rename next to the target.
+        aside = local_backup
+        os.rename(target_dir, local_backup)
+    try:
+        os.rename(staging, target_dir)
+    except BaseException:
+        os.rename(aside, target_dir)
+        _remove_path(staging)
+        raise
+
+    if aside != backup_path:
+        # Moving across filesystems copies, so it happens after the swap and
+        # never widens the window for readers.
+        shutil.move(local_backup, backup_path)
+
+    return backup_path, files, size
+
+
+def confirm_overwrite(target_dir: str, *, yes: bool = False, prompt: PromptFn | None = None) -> bool:
+    """Return whether ``target_dir`` may be written, asking ``prompt`` if it exists."""
+
+    if yes or not os.path.lexists(target_dir):
+        return True
+    return prompt(f"Skill already exists at {target_dir}. Overwrite?") if prompt else False
+
+
 def copy_skill_dir(
     source_dir: str,
     target_dir: str,
@@ -35,26 +177,61 @@ def copy_skill_dir(
     yes: bool = False,
     prompt: PromptFn | None = None,
     backup_root: str | None = None,
+    link_mode: LinkMode = "copy",
 ) -> TransferResult:
-    """Copy a skill directory with overwrite safeguards and optional backup."""
-
-    target_exists = os.path.exists(target_dir)
-
-    if target_exists:
-        if not yes:
-            should_overwrite = prompt(f"Skill already exists at {target_dir}. Overwrite?") if prompt else False
-            if not should_overwrite:
-                return TransferResult(status="skipped", target_path=target_dir)
-
-        backup_path = backup_skill_dir(target_dir, backup_root)
-        shutil.rmtree(target_dir)
-        os.makedirs(os.path.dirname(target_dir), exist_ok=True)
-        shutil.copytree(source_dir, target_dir)
-        return TransferResult(status="backed_up", target_path=target_dir, backup_path=backup_path)
-
-    os.makedirs(os.path.dirname(target_dir), exist_ok=True)
-    shutil.copytree(source_dir, target_dir)
-    return TransferResult(status="copied", target_path=target_dir)
+    """Copy a skill directory with overwrite safeguards and optional backup.
+
+    ``link_mode`` controls how files reach the target: ``copy`` (default),
+    ``hardlink`` or ``reflink`` per file (each falling back to a copy when the
+    filesystem refuses), or ``symlink`` for the whole directory. Hard links
+    and symlinks share data with the source, so edits show up on both sides.
+
+    The result reports how many files and bytes were written (zero for a
+    symlink). Overwrites are rename-based: the existing directory becomes the backup
+    instead of being copied and deleted (see :func:`_swap_into_place`).
+    """
+
+    if not confirm_overwrite(target_dir, yes=yes, prompt=prompt):
+        return TransferResult(status="skipped", target_path=target_dir)
+
+    if os.path.lexists(target_dir):
+        backup_path, files, size = _swap_into_place(source_dir, target_dir, link_mode, backup_root)
+        return TransferResult("backed_up", target_dir, backup_path, files=files, bytes=size)
+
+    files, size = _materialize(source_dir, target_dir, link_mode)
+    return TransferResult("copied", target_dir, files=files, bytes=size)
+
+
+def write_text_atomic(path: str, text: str | Iterable[str]) -> None:
+    """Replace ``path`` with ``text`` via a sibling temp file and rename.
+
+    ``text`` may be an iterable of chunks, which are streamed to the temp
+    file. Concurrent readers see either the old or the new file, never a
+    partial one. An existing file's permission bits are kept. A symlinked
+    ``path`` (e.g. ``AGENTS.md -> CLAUDE.md``) stays a link: the file it
+    points to is the one replaced.
+    """
+
+    path = os.path.realpath(path)
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as handle:
+            if isinstance(text, str):
+                handle.write(text)
+            else:
+                handle.writelines(text)
+            handle.flush()
+            os.fsync(handle.fileno())
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
 
 
 def move_skill_dir(
@@ -0,0 +1,149 @@
+"""Per-root record of where each installed skill came from.
+
+Every skills root an install writes to gets a ``.openskills-lock.json``
+mapping each skill folder to its source, the commit it was installed from
+and a content hash of its tree. ``openskills update`` uses the commit to
+skip sources that have not moved and the hash to copy only the skills whose
+files actually changed.
+"""
+
+import hashlib
+import json
+import os
+import stat
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+__all__ = [
+    "INSTALL_RECORD_FILE",
+    "InstalledSkill",
+    "forget_installs",
+    "hash_skill_tree",
+    "read_install_record",
+    "record_installs",
+]
+
+INSTALL_RECORD_FILE = ".openskills-lock.json"
+INSTALL_RECORD_VERSION = 1
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class InstalledSkill:
+    """Provenance of one installed skill folder."""
+
+    name: str
+    source: str
+    ref: str | None
+    subpath: str | None
+    commit: str | None
+    tree_hash: str
+
+
+def hash_skill_tree(path: Path | str) -> str:
+    """Return a SHA-256 over the relative paths, modes and contents under ``path``.
+
+    The walk order is sorted, so the hash depends only on the tree's content
+    and not on the filesystem. Symlinks are hashed by their target text and
+    are never followed.
+    """
+
+    root = os.fspath(path)
+    digest = hashlib.sha256()
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        rel_dir = os.path.relpath(dirpath, root).replace(os.sep, "/")
+        for name in sorted(filenames):
+            full_path = os.path.join(dirpath, name)
+            rel_path = name if rel_dir == "." else f"{rel_dir}/{name}"
+            info = os.lstat(full_path)
+
+            if stat.S_ISLNK(info.st_mode):
+                target = os.readlink(full_path).encode("utf-8", "surrogateescape")
+                digest.update(b"L %s %d\0" % (rel_path.encode("utf-8", "surrogateescape"), len(target)))
+                digest.update(target)
+                continue
+
+            kind = b"X" if info.st_mode & 0o111 else b"F"
+            digest.update(b"%s %s %d\0" % (kind, rel_path.encode("utf-8", "surrogateescape"), info.st_size))
+            with open(full_path, "rb") as handle:
+                while chunk := handle.read(_CHUNK_SIZE):
+                    digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def _record_path(target_root: Path | str) -> Path:
+    return Path(target_root, INSTALL_RECORD_FILE)
+
+
+def read_install_record(target_root: Path | str) -> dict[str, InstalledSkill]:
+    """Return the recorded skills of ``target_root`` keyed by folder name.
+
+    A missing or unreadable record is empty: skills installed before records
+    existed simply are not updatable until they are installed again.
+    """
+
+    try:
+        payload = json.loads(_record_path(target_root).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(payload, dict) or payload.get("version") != INSTALL_RECORD_VERSION:
+        return {}
+
+    record: dict[str, InstalledSkill] = {}
+    for name, entry in payload.get("skills", {}).items():
+        try:
+            record[name] = InstalledSkill(
+                name=name,
+                source=entry["source"],
+                ref=entry.get("ref"),
+                subpath=entry.get("subpath"),
+                commit=entry.get("commit"),
+                tree_hash=entry["tree_hash"],
+            )
+        except (KeyError, TypeError):
+            continue
+    return record
+
+
+def _write_install_record(target_root: Path | str, record: dict[str, InstalledSkill]) -> None:
+    path = _record_path(target_root)
+    skills = {}
+    for name in sorted(record):
+        entry = asdict(record[name])
+        del entry["name"]
+        skills[name] = entry
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(
+        json.dumps({"version": INSTALL_RECORD_VERSION, "skills": skills}, indent=2) + "\n",
+        encoding="utf-8",
+    )
+    os.replace(tmp_path, path)
+
+
+def record_installs(target_root: Path | str, entries: Iterable[InstalledSkill]) -> None:
+    """Add or replace ``entries`` in the record of ``target_root``."""
+
+    updates = {entry.name: entry for entry in entries}
+    if not updates:
+        return
+
+    record = read_install_record(target_root)
+    record.update(updates)
+    _write_install_record(target_root, record)
+
+
+def forget_installs(target_root: Path | str, names: Iterable[str]) -> None:
+    """Drop ``names`` from the record of ``target_root`` (after a removal)."""
+
+    record = read_install_record(target_root)
+    removed = [name for name in names if record.pop(name, None) is not None]
+    if removed:
+        _write_install_record(target_root, record)
@@ -0,0 +1,178 @@
+"""Skill manifests (``skills.toml``) and the lockfile written next to them.
+
+A manifest lists the sources to install in one pass::
+
+    [[sources]]
+    source = "anthropics/skills"
+    ref = "main"                  # optional branch or tag
+    subpath = "document-skills"   # optional directory inside the repo
+    only = ["pdf", "docx"]        # optional skill folder names
+
+The lockfile (``skills.lock`` beside ``skills.toml``) records the commit each
+source resolved to and the skills it installed, so a later run can compare
+against ``git ls-remote`` and skip sources that have not moved.
+"""
+
+import json
+import os
+import tomllib
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+__all__ = [
+    "LockedSource",
+    "ManifestError",
+    "ManifestSource",
+    "find_locked_source",
+    "load_manifest",
+    "lockfile_path",
+    "read_lockfile",
+    "write_lockfile",
+]
+
+LOCKFILE_VERSION = 1
+
+_SOURCE_KEYS = frozenset({"source", "ref", "subpath", "only"})
+
+
+class ManifestError(ValueError):
+    """Raised when a skills manifest cannot be read or is malformed."""
+
+
+@dataclass(frozen=True)
+class ManifestSource:
+    """One ``[[sources]]`` entry of a manifest."""
+
+    source: str
+    ref: str | None = None
+    subpath: str | None = None
+    only: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class LockedSource:
+    """A manifest source pinned to the commit it was installed from."""
+
+    source: str
+    ref: str | None
+    subpath: str | None
+    only: tuple[str, ...]
+    commit: str | None
+    skills: tuple[str, ...]
+
+    def matches(self, spec: ManifestSource) -> bool:
+        return (self.source, self.ref, self.subpath, self.only) == (spec.source, spec.ref, spec.subpath, spec.only)
+
+
+def _optional_text(entry: dict[str, Any], key: str, position: int) -> str | None:
+    value = entry.get(key)
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise ManifestError(f"sources[{position}].{key} must be a string")
+    return value.strip("/") if key == "subpath" else value
+
+
+def _parse_only(value: Any, position: int) -> tuple[str, ...]:
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ManifestError(f"sources[{position}].only must be a list of skill names")
+    return tuple(sorted({item.strip() for item in value if item.strip()}))
+
+
+def load_manifest(path: Path | str) -> list[ManifestSource]:
+    """Parse a TOML manifest into its sources, in file order.
+
+    Raises:
+        ManifestError: If the file is missing, is not valid TOML, or an
+            entry is malformed.
+    """
+
+    try:
+        with open(path, "rb") as handle:
+            data = tomllib.load(handle)
+    except OSError as exc:
+        raise ManifestError(f"Cannot read manifest {path}: {exc.strerror or exc}") from exc
+    except tomllib.TOMLDecodeError as exc:
+        raise ManifestError(f"Invalid manifest {path}: {exc}") from exc
+
+    entries = data.get("sources")
+    if not isinstance(entries, list) or not entries:
+        raise ManifestError(f"Manifest {path} has no [[sources]] entries")
+
+    sources: list[ManifestSource] = []
+    for position, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            raise ManifestError(f"sources[{position}] must be a table")
+        unknown = sorted(set(entry) - _SOURCE_KEYS)
+        if unknown:
+            raise ManifestError(f"sources[{position}] has unknown keys: {', '.join(unknown)}")
+        source = entry.get("source")
+        if not isinstance(source, str) or not source.strip():
+            raise ManifestError(f"sources[{position}].source is required")
+
+        sources.append(
+            ManifestSource(
+                source=source.strip(),
+                ref=_optional_text(entry, "ref", position),
+                subpath=_optional_text(entry, "subpath", position) or None,
+                only=_parse_only(entry.get("only"), position),
+            )
+        )
+    return sources
+
+
+def lockfile_path(manifest_path: Path | str) -> Path:
+    """Return the lockfile that belongs to ``manifest_path`` (``skills.toml`` -> ``skills.lock``)."""
+
+    return Path(manifest_path).with_suffix(".lock")
+
+
+def read_lockfile(path: Path | str) -> list[LockedSource]:
+    """Return the pinned sources in ``path``; a missing or unreadable lockfile is empty."""
+
+    try:
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+
+    if not isinstance(payload, dict) or payload.get("version") != LOCKFILE_VERSION:
+        return []
+
+    locked: list[LockedSource] = []
+    for entry in payload.get("sources", []):
+        try:
+            locked.append(
+                LockedSource(
+                    source=entry["source"],
+                    ref=entry.get("ref"),
+                    subpath=entry.get("subpath"),
+                    only=tuple(entry.get("only", ())),
+                    commit=entry.get("commit"),
+                    skills=tuple(entry.get("skills", ())),
+                )
+            )
+        except (KeyError, TypeError):
+            continue
+    return locked
+
+
+def find_locked_source(locked: Sequence[LockedSource], spec: ManifestSource) -> LockedSource | None:
+    """Return the lock entry recorded for ``spec``, if any."""
+
+    return next((entry for entry in locked if entry.matches(spec)), None)
+
+
+def write_lockfile(path: Path | str, entries: Sequence[LockedSource]) -> None:
+    """Atomically write ``entries`` to ``path``."""
+
+    target = Path(path)
+    payload = {"version": LOCKFILE_VERSION, "sources": [asdict(entry) for entry in entries]}
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp_path, target)
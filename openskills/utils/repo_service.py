@@ -1,9 +1,11 @@
 """Git-backed repository helpers for skill working copies."""
 
+import hashlib
 import os
 import shutil
 import subprocess
 import tempfile
+import threading
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from pathlib import Path
@@ -19,6 +21,14 @@ class WorkingCopy:
     source: str
     commit: str | None
     cleanup: Callable[[], None]
+    subpath: str | None = None
+    in_place: bool = False
+
+    @property
+    def skill_root(self) -> Path:
+        """Directory to search for skills (the requested subpath, if any)."""
+
+        return Path(self.path, self.subpath) if self.subpath else Path(self.path)
 
 
 def _run_git(args: Sequence[str], cwd: str | None = None) -> str:
@@ -33,9 +43,20 @@ def _run_git(args: Sequence[str], cwd: str | None = None) -> str:
     return completed.stdout.strip()
 
 
-def git_clone(repo: str, destination: Path, *, git_runner: GitRunner | None = None) -> None:
+def git_clone(
+    repo: str,
+    destination: Path,
+    *,
+    git_runner: GitRunner | None = None,
+    sparse: bool = False,
+    ref: str | None = None,
+) -> None:
+    """Shallow-clone ``repo`` at ``ref`` (a branch or tag); ``sparse`` skips blobs and the checkout."""
+
     runner = git_runner or _run_git
-    runner(["clone", "--quiet", "--depth", "1", repo, str(destination)])
+    partial = ["--filter=blob:none", "--no-checkout"] if sparse else []
+    branch = ["--branch", ref] if ref else []
+    runner(["clone", "--quiet", "--depth", "1", *partial, *branch, repo, str(destination)])
 
 
 def git_fetch(cwd: Path, *, git_runner: GitRunner | None = None) -> None:
@@ -53,6 +74,82 @@ def _rev_parse_head(cwd: Path, *, git_runner: GitRunner | None = None) -> str:
     return runner(["rev-parse", "HEAD"], str(cwd))
 
 
+def remote_head(source: str, ref: str | None = None, *, git_runner: GitRunner | None = None) -> str | None:
+    """Return the commit ``ref`` (default ``HEAD``) points at in ``source`` without fetching.
+
+    This is a single ``git ls-remote`` round trip. Annotated tags resolve to
+    the tagged commit. Returns None when the source is not a reachable git
+    repository, so callers can treat "unknown" as "changed".
+    """
+
+    runner = git_runner or _run_git
+    normalized_source, _ = _normalize_source(split_source_subpath(source)[0])
+    patterns = [ref, f"{ref}^{{}}"] if ref else ["HEAD"]
+    try:
+        output = runner(["ls-remote", normalized_source, *patterns], None)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    # Same precedence as ``clone --branch``: a branch wins over a tag, and a
+    # tag resolves to the commit it points at.
+    preference = [f"refs/heads/{ref}", f"refs/tags/{ref}^{{}}", f"refs/tags/{ref}", ref] if ref else ["HEAD"]
+    refs: dict[str, str] = {}
+    for line in output.splitlines():
+        sha, _, name = line.partition("\t")
+        refs[name] = sha
+    return next((refs[name] for name in preference if name in refs), None)
+
+
+def split_source_subpath(source: str) -> tuple[str, str | None]:
+    """Split ``owner/repo#path/in/repo`` into the source and the subpath.
+
+    Existing local paths are returned untouched even if they contain ``#``.
+    """
+
+    if "#" not in source or Path(os.path.expanduser(source)).exists():
+        return source, None
+
+    base, _, subpath = source.partition("#")
+    return base, subpath.strip("/") or None
+
+
+def _sparse_paths(
+    working_dir: Path,
+    subpath: str | None,
+    only: Sequence[str] | None,
+    *,
+    git_runner: GitRunner | None = None,
+) -> list[str]:
+    """Return the directories to materialize for ``subpath`` and ``only``.
+
+    Skill names are matched against SKILL.md folder names using the tree
+    listing alone, so no file contents are fetched to decide.
+    """
+
+    if not only:
+        return [subpath] if subpath else []
+
+    runner = git_runner or _run_git
+    listing = runner(["ls-tree", "-r", "--name-only", "HEAD"], str(working_dir))
+    prefix = f"{subpath}/" if subpath else ""
+    wanted = set(only)
+
+    selected: set[str] = set()
+    for line in listing.splitlines():
+        parent, _, filename = line.rpartition("/")
+        if filename != "SKILL.md" or not parent.startswith(prefix):
+            continue
+        if parent.rpartition("/")[2] in wanted:
+            selected.add(parent)
+    return sorted(selected)
+
+
+def _sparse_checkout(working_dir: Path, paths: Sequence[str], *, git_runner: GitRunner | None = None) -> None:
+    runner = git_runner or _run_git
+    runner(["sparse-checkout", "set", "--cone", *paths], str(working_dir))
+    runner(["checkout", "--quiet"], str(working_dir))
+
+
 def _normalize_source(source: str) -> tuple[str, bool]:
     expanded = os.path.expanduser(source)
     local_path = Path(expanded)
@@ -65,28 +162,156 @@ def _normalize_source(source: str) -> tuple[str, bool]:
     return f"https://github.com/{source}", False
 
 
+# Mirrors track branches and tags only; hosts also advertise refs such as
+# GitHub's refs/pull/*, which would pull in every pull request's history.
+_MIRROR_REFSPECS = ("+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*")
+
+
+def _mirror_path(mirror_cache: Path, normalized_source: str) -> Path:
+    digest = hashlib.sha256(normalized_source.encode("utf-8")).hexdigest()[:24]
+    return mirror_cache / f"{digest}.git"
+
+
+_MIRROR_LOCKS: dict[Path, threading.Lock] = {}
+_MIRROR_LOCKS_GUARD = threading.Lock()
+
+
+def _mirror_lock(mirror: Path) -> threading.Lock:
+    with _MIRROR_LOCKS_GUARD:
+        return _MIRROR_LOCKS.setdefault(mirror, threading.Lock())
+
+
+def sync_mirror(normalized_source: str, mirror_cache: Path | str, *, git_runner: GitRunner | None = None) -> Path:
+    """Create or refresh the bare mirror for ``normalized_source``.
+
+    Mirrors live under ``mirror_cache`` keyed by a hash of the normalized
+    source. A missing mirror is cloned with ``--bare`` into a unique
+    staging directory and renamed into place, so concurrent installs never
+    observe a half-written mirror. An existing mirror is updated with
+    ``git fetch``. Only branches and tags are fetched (see
+    :data:`_MIRROR_REFSPECS`), never the pull request refs a full
+    ``--mirror`` clone would download. Threads syncing the same mirror (e.g. two manifest entries
+    for one repository) take turns, so the second one only fetches.
+    """
+
+    runner = git_runner or _run_git
+    mirror = _mirror_path(Path(mirror_cache), normalized_source)
+
+    with _mirror_lock(mirror):
+        if (mirror / "HEAD").exists():
+            runner(["fetch", "--quiet", "--prune", "origin", *_MIRROR_REFSPECS], str(mirror))
+            return mirror
+
+        mirror.parent.mkdir(parents=True, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=f"{mirror.name}.tmp-", dir=mirror.parent)
+        try:
+            runner(["clone", "--quiet", "--bare", normalized_source, staging])
+            os.replace(staging, mirror)
+        except OSError:
+            # Another process published the mirror first; keep theirs.
+            if not (mirror / "HEAD").exists():
+                raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+    return mirror
+
+
+def _clone_from_mirror(
+    mirror: Path,
+    destination: Path,
+    *,
+    git_runner: GitRunner | None = None,
+    sparse: bool = False,
+    ref: str | None = None,
+) -> None:
+    runner = git_runner or _run_git
+    # --shared borrows the mirror's objects via alternates: nothing is copied
+    # and nothing goes over the network. Working copies are short-lived.
+    no_checkout = ["--no-checkout"] if sparse else []
+    branch = ["--branch", ref] if ref else []
+    runner(["clone", "--quiet", "--shared", *no_checkout, *branch, str(mirror), str(destination)])
+
+
 def _allocate_workdir(temp_root: str | None = None) -> tuple[Path, Path]:
     base_dir = Path(tempfile.mkdtemp(prefix="openskills-", dir=temp_root))
     working_dir = base_dir / "skill"
     return base_dir, working_dir
 
 
+def _local_in_place(source_dir: str, subpath: str | None, *, git_runner: GitRunner | None = None) -> WorkingCopy:
+    commit: str | None = None
+    # Only a repository root yields a commit, matching what a copied tree
+    # (which never includes a parent's .git) would report.
+    if Path(source_dir, ".git").exists():
+        try:
+            commit = _rev_parse_head(Path(source_dir), git_runner=git_runner)
+        except subprocess.CalledProcessError:
+            commit = None
+
+    return WorkingCopy(source_dir, source_dir, commit, lambda: None, subpath, in_place=True)
+
+
 def prepare_skill_working_copy(
     source: str,
     *,
     temp_root: str | None = None,
     git_runner: GitRunner | None = None,
+    mirror_cache: Path | str | None = None,
+    subpath: str | None = None,
+    only: Sequence[str] | None = None,
+    in_place: bool = False,
+    ref: str | None = None,
 ) -> WorkingCopy:
+    """Materialize ``source`` in a temporary directory.
+
+    When ``mirror_cache`` is set, git sources are fetched into a bare mirror
+    kept in that directory and the working copy is a local clone of it, so
+    repeated installs of the same source only pay for an incremental fetch.
+
+    A subpath (``owner/repo#skills/pdf`` or ``subpath=``) and/or ``only``
+    skill folder names switch git sources to a shallow, blob-less clone with
+    a cone sparse checkout, so only the selected skill directories are
+    downloaded and written. Such installs bypass ``mirror_cache``: a full
+    mirror would fetch every blob and all history first.
+
+    With ``in_place`` a local source is not copied at all: the returned
+    working copy points at the source directory (which callers must treat
+    as read-only) and ``cleanup`` is a no-op.
+
+    ``ref`` checks out a branch or tag instead of the default branch; a local
+    source with a ``ref`` is cloned rather than copied or used in place.
+    """
+
+    source, spec_subpath = split_source_subpath(source)
+    subpath = (subpath.strip("/") or None) if subpath else spec_subpath
     normalized_source, is_local = _normalize_source(source)
+
+    if is_local and in_place and not ref:
+        return _local_in_place(normalized_source, subpath, git_runner=git_runner)
+
     base_dir, working_dir = _allocate_workdir(temp_root)
+    sparse = not is_local and bool(subpath or only)
 
     def _cleanup() -> None:
         shutil.rmtree(base_dir, ignore_errors=True)
 
-    if is_local:
-        shutil.copytree(normalized_source, working_dir)
-    else:
-        git_clone(normalized_source, working_dir, git_runner=git_runner)
+    try:
+        if is_local and not ref:
+            shutil.copytree(normalized_source, working_dir)
+        elif mirror_cache is not None and not is_local and not sparse:
+            mirror = sync_mirror(normalized_source, mirror_cache, git_runner=git_runner)
+            _clone_from_mirror(mirror, working_dir, git_runner=git_runner, sparse=sparse, ref=ref)
+        else:
+            git_clone(normalized_source, working_dir, git_runner=git_runner, sparse=sparse, ref=ref)
+
+        if sparse:
+            paths = _sparse_paths(working_dir, subpath, only, git_runner=git_runner)
+            if not paths:
+                raise ValueError(f"No skills named {', '.join(only or [])} found in {normalized_source}")
+            _sparse_checkout(working_dir, paths, git_runner=git_runner)
+    except BaseException:
+        _cleanup()
+        raise
 
     commit: str | None
     try:
@@ -94,5 +319,5 @@ def prepare_skill_working_copy(
     except subprocess.CalledProcessError:
         commit = None
 
-    return WorkingCopy(str(working_dir), normalized_source, commit, _cleanup)
+    return WorkingCopy(str(working_dir), normalized_source, commit, _cleanup, subpath)
 
@@ -0,0 +1,283 @@
+"""Persistent per-root index of installed skills validated by ``stat`` identity.
+
+Each search root gets a small JSON file under ``<cache>/index`` recording the
+root directory's own ``stat`` plus, for every skill folder, the name, the
+description and the ``(mtime_ns, size, inode)`` of its SKILL.md. A scan only
+re-lists the root when the directory changed and only re-reads the SKILL.md
+files whose identity changed, so steady-state discovery is a handful of
+``stat`` calls instead of one full file read per skill.
+"""
+
+import hashlib
+import json
+import os
+import stat
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .concurrency import map_ordered, resolve_jobs
+from .dirs import get_cache_dir
+from .yaml import FrontmatterError, parse_frontmatter, read_frontmatter
+
+__all__ = ["IndexEntry", "SkillIndex", "default_skill_index"]
+
+INDEX_VERSION = 1
+
+StatKey = tuple[int, int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class IndexEntry:
+    """Cached metadata for one skill folder inside a search root."""
+
+    name: str
+    description: str
+    mtime_ns: int
+    size: int
+    inode: int
+
+    @property
+    def stat_key(self) -> StatKey:
+        return (self.mtime_ns, self.size, self.inode)
+
+
+@dataclass
+class _RootState:
+    dir_key: tuple[int, int]
+    skills: dict[str, IndexEntry] = field(default_factory=dict)
+    other_dirs: list[str] = field(default_factory=list)
+
+
+def _stat_key(st: os.stat_result) -> StatKey:
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _stat_skill_md(skill_md: str) -> os.stat_result | None:
+    try:
+        st = os.stat(skill_md)
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
+def _read_description(skill_md: str) -> str:
+    try:
+        frontmatter = read_frontmatter(skill_md)
+    except (FrontmatterError, UnicodeDecodeError):
+        return ""
+    return parse_frontmatter(frontmatter, lenient=True).description or ""
+
+
+def _build_entry(name: str, skill_md: str, st: os.stat_result) -> IndexEntry:
+    return IndexEntry(
+        name=sys.intern(name),
+        description=_read_description(skill_md),
+        mtime_ns=st.st_mtime_ns,
+        size=st.st_size,
+        inode=st.st_ino,
+    )
+
+
+def _bare_entry(name: str, st: os.stat_result) -> IndexEntry:
+    return IndexEntry(sys.intern(name), "", st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class SkillIndex:
+    """Stat-validated skill metadata cache shared by discovery and lookup.
+
+    Args:
+        cache_dir: Directory holding the per-root JSON files. ``None`` keeps
+            the index in memory only (nothing is read from or written to disk).
+        jobs: Number of threads used to stat and parse SKILL.md files during
+            :meth:`scan`. Results are identical to the serial scan.
+    """
+
+    def __init__(self, cache_dir: Path | None = None, *, jobs: int = 1) -> None:
+        self.cache_dir = cache_dir
+        self.jobs = jobs
+        self._roots: dict[str, _RootState] = {}
+        self._dirty: set[str] = set()
+
+    def scan(self, root: Path, *, describe: bool = True) -> list[IndexEntry]:
+        """Return the skills directly under ``root`` sorted by folder name.
+
+        With ``describe=False`` new or changed SKILL.md files are only
+        ``stat``-ed: their entries carry an empty description and are not
+        stored, so a later full scan still reads them.
+        """
+
+        root_key = os.path.abspath(root)
+        try:
+            root_stat = os.stat(root_key)
+        except OSError:
+            root_stat = None
+
+        if root_stat is None or not stat.S_ISDIR(root_stat.st_mode):
+            self._forget(root_key)
+            return []
+
+        dir_key = (root_stat.st_mtime_ns, root_stat.st_ino)
+        previous = self._load(root_key)
+
+        if previous is not None and previous.dir_key == dir_key:
+            names = [*previous.skills, *previous.other_dirs]
+        else:
+            names = self._list_subdirs(root_key)
+
+        cached = previous.skills if previous is not None else {}
+
+        def _probe(name: str) -> IndexEntry | None:
+            skill_md = os.path.join(root_key, name, "SKILL.md")
+            st = _stat_skill_md(skill_md)
+            if st is None:
+                return None
+
+            entry = cached.get(name)
+            if entry is None or entry.stat_key != _stat_key(st):
+                entry = _build_entry(name, skill_md, st) if describe else _bare_entry(name, st)
+            return entry
+
+        sorted_names = sorted(names)
+        if not describe:
+            return [entry for entry in map(_probe, sorted_names) if entry is not None]
+
+        state = _RootState(dir_key=dir_key)
+        for name, entry in zip(sorted_names, map_ordered(_probe, sorted_names, jobs=self.jobs), strict=True):
+            if entry is None:
+                state.other_dirs.append(name)
+            else:
+                state.skills[entry.name] = entry
+
+        if previous is None or previous != state:
+            self._roots[root_key] = state
+            self._dirty.add(root_key)
+
+        return list(state.skills.values())
+
+    def lookup(self, root: Path, name: str) -> IndexEntry | None:
+        """Return the entry for ``root/name`` or ``None`` if it is not a skill.
+
+        Only consults roots already loaded by :meth:`scan`; a single lookup
+        never pays for parsing a whole root index from disk.
+        """
+
+        root_key = os.path.abspath(root)
+        skill_md = os.path.join(root_key, name, "SKILL.md")
+        st = _stat_skill_md(skill_md)
+        if st is None:
+            return None
+
+        state = self._roots.get(root_key)
+        cached = state.skills.get(name) if state is not None else None
+        if cached is not None and cached.stat_key == _stat_key(st):
+            return cached
+
+        entry = _build_entry(name, skill_md, st)
+        if state is not None and name in state.skills:
+            state.skills[name] = entry
+            self._dirty.add(root_key)
+        return entry
+
+    def save(self) -> None:
+        """Persist every root whose state changed since it was loaded."""
+
+        if self.cache_dir is None:
+            self._dirty.clear()
+            return
+
+        for root_key in sorted(self._dirty):
+            state = self._roots.get(root_key)
+            path = self._index_path(root_key)
+            try:
+                if state is None:
+                    path.unlink(missing_ok=True)
+                else:
+                    _write_json_atomic(path, _dump_state(root_key, state))
+            except OSError:
+                # The index is only an accelerator; an unwritable cache must
+                # never break discovery.
+                continue
+        self._dirty.clear()
+
+    def _forget(self, root_key: str) -> None:
+        if self._roots.pop(root_key, None) is not None or self._index_path_exists(root_key):
+            self._dirty.add(root_key)
+
+    def _load(self, root_key: str) -> _RootState | None:
+        if root_key in self._roots:
+            return self._roots[root_key]
+
+        if self.cache_dir is None:
+            return None
+
+        try:
+            raw = json.loads(self._index_path(root_key).read_text(encoding="utf-8"))
+            state = _load_state(root_key, raw)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if state is not None:
+            self._roots[root_key] = state
+        return state
+
+    @staticmethod
+    def _list_subdirs(root_key: str) -> list[str]:
+        try:
+            with os.scandir(root_key) as entries:
+                return [entry.name for entry in entries if entry.is_dir()]
+        except OSError:
+            return []
+
+    def _index_path(self, root_key: str) -> Path:
+        assert self.cache_dir is not None
+        digest = hashlib.sha1(root_key.encode("utf-8")).hexdigest()[:20]
+        return self.cache_dir / f"{digest}.json"
+
+    def _index_path_exists(self, root_key: str) -> bool:
+        return self.cache_dir is not None and self._index_path(root_key).exists()
+
+
+def _dump_state(root_key: str, state: _RootState) -> dict:
+    return {
+        "version": INDEX_VERSION,
+        "root": root_key,
+        "dir": list(state.dir_key),
+        "skills": {
+            name: [entry.description, entry.mtime_ns, entry.size, entry.inode] for name, entry in state.skills.items()
+        },
+        "other_dirs": state.other_dirs,
+    }
+
+
+def _load_state(root_key: str, raw: dict) -> _RootState | None:
+    if raw.get("version") != INDEX_VERSION or raw.get("root") != root_key:
+        return None
+
+    mtime_ns, inode = raw["dir"]
+    skills = {}
+    for raw_name, (description, m, s, i) in raw["skills"].items():
+        name = sys.intern(raw_name)
+        skills[name] = IndexEntry(name=name, description=description, mtime_ns=m, size=s, inode=i)
+    return _RootState(dir_key=(mtime_ns, inode), skills=skills, other_dirs=list(raw["other_dirs"]))
+
+
+def _write_json_atomic(path: Path, payload: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def default_skill_index(*, home: Path | str | None = None, jobs: int | None = None) -> SkillIndex:
+    """Return an index persisted under the OpenSkills cache directory.
+
+    Setting ``OPENSKILLS_NO_INDEX`` keeps the index in memory only. ``jobs``
+    defaults to ``OPENSKILLS_JOBS`` (serial when unset).
+    """
+
+    workers = resolve_jobs(jobs)
+    if os.environ.get("OPENSKILLS_NO_INDEX"):
+        return SkillIndex(None, jobs=workers)
+
+    return SkillIndex(get_cache_dir(home=home) / "index", jobs=workers)
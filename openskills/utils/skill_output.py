@@ -0,0 +1,131 @@
+"""Plain-text and JSON renderings of ``list`` and ``read`` output.
+
+These return exactly what the commands print, so the CLI and the daemon
+produce byte-identical output.
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+
+from .skills import Skill
+
+__all__ = [
+    "SKILL_FIELDS",
+    "format_skill_list",
+    "format_skill_not_found",
+    "format_skill_read",
+    "format_skills_not_found",
+    "iter_skill_json",
+    "iter_skill_ndjson",
+    "parse_skill_fields",
+    "truncate_skill_content",
+]
+
+# Keys of a ``list --json`` record, in output order.
+SKILL_FIELDS = ("name", "description", "location", "base_dir", "skill_path")
+
+_INSTALL_HINT = (
+    "Install skills:\n"
+    "  openskills install owner/skill     Install from GitHub owner/repo\n"
+    "  openskills install <git-url>       Install from Git URL\n"
+    "  openskills install --help          See all install options\n"
+)
+
+
+def format_skill_list(skills: Sequence[Skill]) -> str:
+    """Return the ``openskills list`` report, project skills first."""
+
+    lines = ["Available Skills:\n\n"]
+
+    if not skills:
+        lines.append("No skills installed.\n\n")
+        lines.append(_INSTALL_HINT)
+        return "".join(lines)
+
+    for skill in sorted(skills, key=lambda s: (s.location != "project", s.name.lower())):
+        label = "(project)" if skill.location == "project" else "(global)"
+        lines.append(f"  {skill.name:25} {label}\n")
+        lines.append(f"    {skill.description}\n\n")
+
+    project_count = sum(1 for s in skills if s.location == "project")
+    global_count = len(skills) - project_count
+    lines.append(f"Summary: {project_count} project, {global_count} global ({len(skills)} total)\n")
+    return "".join(lines)
+
+
+def format_skill_read(skill: Skill, content: str) -> str:
+    """Return the ``openskills read`` output for ``skill`` with its SKILL.md ``content``."""
+
+    return f"Reading: {skill.name}\nBase directory: {skill.base_dir}\n\n{content}\n\nSkill read: {skill.name}\n"
+
+
+def truncate_skill_content(content: str, max_bytes: int | None, skill_name: str) -> str:
+    """Cut ``content`` to at most ``max_bytes`` UTF-8 bytes and say so; unchanged when it fits."""
+
+    encoded = content.encode("utf-8")
+    if max_bytes is None or len(encoded) <= max_bytes:
+        return content
+    kept = encoded[:max_bytes].decode("utf-8", errors="ignore")
+    return (
+        f"{kept}\n\n[Truncated: showing {max_bytes} of {len(encoded)} bytes; "
+        f"run `openskills read {skill_name}` without --max-bytes for the full skill]"
+    )
+
+
+def format_skill_not_found(skill_name: str, search_dirs: Sequence[Path]) -> str:
+    """Return the error printed when ``skill_name`` is not installed in any root."""
+
+    searched = "\n".join(f"  {path}" for path in search_dirs)
+    return f"Error: Skill '{skill_name}' not found\n\nSearched:\n{searched}\n\nInstall skills: openskills install owner/repo\n"
+
+
+def format_skills_not_found(skill_names: Sequence[str], search_dirs: Sequence[Path]) -> str:
+    """Return one report for every name a batch ``read`` could not find."""
+
+    if len(skill_names) == 1:
+        return format_skill_not_found(skill_names[0], search_dirs)
+
+    searched = "\n".join(f"  {path}" for path in search_dirs)
+    missing = ", ".join(f"'{name}'" for name in skill_names)
+    return (
+        f"Error: {len(skill_names)} skills not found: {missing}\n\nSearched:\n{searched}\n\n"
+        "Install skills: openskills install owner/repo\n"
+    )
+
+
+def parse_skill_fields(value: str | None) -> tuple[str, ...]:
+    """Parse a comma-separated ``--fields`` value; ``None`` selects every field."""
+
+    if value is None:
+        return SKILL_FIELDS
+    fields = tuple(dict.fromkeys(field.strip() for field in value.split(",") if field.strip()))
+    unknown = [field for field in fields if field not in SKILL_FIELDS]
+    if unknown or not fields:
+        named = ", ".join(unknown) if unknown else "(none)"
+        raise ValueError(f"Unknown field(s): {named} (choose from {', '.join(SKILL_FIELDS)})")
+    return fields
+
+
+def _skill_record(skill: Skill, fields: Sequence[str]) -> dict[str, str]:
+    return {field: str(getattr(skill, field)) for field in fields}
+
+
+def iter_skill_ndjson(skills: Iterable[Skill], fields: Sequence[str] = SKILL_FIELDS) -> Iterator[str]:
+    """Yield one JSON object per line for each skill, as soon as it is produced."""
+
+    import json
+
+    for skill in skills:
+        yield json.dumps(_skill_record(skill, fields), ensure_ascii=False) + "\n"
+
+
+def iter_skill_json(skills: Iterable[Skill], fields: Sequence[str] = SKILL_FIELDS) -> Iterator[str]:
+    """Yield a JSON array of skill records in chunks, one element per skill."""
+
+    import json
+
+    yield "["
+    for position, skill in enumerate(skills):
+        yield ",\n" if position else "\n"
+        yield json.dumps(_skill_record(skill, fields), ensure_ascii=False)
+    yield "\n]\n"
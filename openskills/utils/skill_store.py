@@ -0,0 +1,169 @@
+"""Content-addressed store holding each unique skill tree once.
+
+With ``install --store`` a skill is first added to ``<cache>/store/objects/<hash>``
+(keyed by :func:`~openskills.utils.install_record.hash_skill_tree`) and the
+install target is then populated from there by hard links or a symlink, so
+the same skill installed into many project and global roots shares one copy
+on disk. Store files are made read-only because every hard link shares them.
+
+Each install target is registered under ``refs/<hash>/``; :meth:`SkillStore.gc`
+drops registrations whose target no longer points into the store and then
+deletes the objects nobody references.
+"""
+
+import hashlib
+import os
+import shutil
+import stat
+from dataclasses import dataclass
+from pathlib import Path
+
+from .dirs import get_cache_dir
+from .install_record import hash_skill_tree
+
+__all__ = ["GcResult", "SkillStore", "default_skill_store"]
+
+_WRITE_BITS = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+
+
+@dataclass(frozen=True)
+class GcResult:
+    """Outcome of :meth:`SkillStore.gc`."""
+
+    removed: tuple[str, ...]
+    freed_bytes: int
+    kept: int
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            total += os.lstat(os.path.join(dirpath, name)).st_size
+    return total
+
+
+def _make_read_only(path: Path) -> None:
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            file_path = os.path.join(dirpath, name)
+            mode = os.lstat(file_path).st_mode
+            if stat.S_ISREG(mode):
+                os.chmod(file_path, stat.S_IMODE(mode) & ~_WRITE_BITS)
+
+
+class SkillStore:
+    """A directory of immutable skill trees addressed by their content hash."""
+
+    def __init__(self, root: Path | str) -> None:
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.refs_dir = self.root / "refs"
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest
+
+    def add(self, source_dir: Path | str) -> str:
+        """Store a copy of ``source_dir`` unless an identical tree is present; return its hash."""
+
+        digest = hash_skill_tree(source_dir)
+        target = self.object_path(digest)
+        if target.is_dir():
+            return digest
+
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        staging = self.objects_dir / f".{digest}.tmp-{os.getpid()}"
+        shutil.rmtree(staging, ignore_errors=True)
+        shutil.copytree(source_dir, staging, symlinks=True)
+        _make_read_only(staging)
+        try:
+            os.rename(staging, target)
+        except OSError:
+            # Another install published the same tree first; theirs is identical.
+            shutil.rmtree(staging, ignore_errors=True)
+        return digest
+
+    def _ref_path(self, digest: str, target_dir: Path | str) -> Path:
+        key = hashlib.sha1(os.path.abspath(target_dir).encode("utf-8")).hexdigest()[:20]
+        return self.refs_dir / digest / key
+
+    def add_ref(self, digest: str, target_dir: Path | str) -> None:
+        """Record that ``target_dir`` was populated from object ``digest``."""
+
+        ref = self._ref_path(digest, target_dir)
+        ref.parent.mkdir(parents=True, exist_ok=True)
+        ref.write_text(os.path.abspath(target_dir), encoding="utf-8")
+
+    def links_to(self, digest: str, target_dir: Path | str) -> bool:
+        """Return whether ``target_dir`` is a symlink to, or hard links into, object ``digest``."""
+
+        obj = self.object_path(digest)
+        if os.path.islink(target_dir):
+            return os.path.realpath(target_dir) == os.path.realpath(obj)
+        try:
+            return os.path.samefile(os.path.join(target_dir, "SKILL.md"), obj / "SKILL.md")
+        except OSError:
+            return False
+
+    def linked_object(self, target_dir: Path | str, digest: str | None = None) -> str | None:
+        """Return the hash of the stored tree ``target_dir`` was linked from, if any.
+
+        A symlinked target names its object directly; a hard-linked one is
+        only matched against ``digest`` (usually the recorded tree hash).
+        """
+
+        if os.path.islink(target_dir):
+            real = Path(os.path.realpath(target_dir))
+            return real.name if real.parent == Path(os.path.realpath(self.objects_dir)) else None
+        if digest is not None and self.links_to(digest, target_dir):
+            return digest
+        return None
+
+    def gc(self, *, dry_run: bool = False) -> GcResult:
+        """Delete objects no install target still links to.
+
+        A reference is live while its target is a symlink to the object or
+        its SKILL.md is a hard link to the object's. Targets that were
+        removed, reinstalled from elsewhere or copied out no longer count.
+        """
+
+        removed: list[str] = []
+        freed = 0
+        kept = 0
+
+        if not self.objects_dir.is_dir():
+            return GcResult((), 0, 0)
+
+        for entry in sorted(os.scandir(self.objects_dir), key=lambda item: item.name):
+            obj = Path(entry.path)
+            if entry.name.startswith("."):
+                # Staging leftovers from an interrupted add.
+                if not dry_run:
+                    shutil.rmtree(obj, ignore_errors=True)
+                continue
+
+            ref_dir = self.refs_dir / entry.name
+            live = False
+            for ref in sorted(ref_dir.iterdir()) if ref_dir.is_dir() else []:
+                if self.links_to(entry.name, ref.read_text(encoding="utf-8")):
+                    live = True
+                elif not dry_run:
+                    ref.unlink(missing_ok=True)
+
+            if live:
+                kept += 1
+                continue
+
+            removed.append(entry.name)
+            freed += _tree_size(obj)
+            if not dry_run:
+                shutil.rmtree(obj)
+                shutil.rmtree(ref_dir, ignore_errors=True)
+
+        return GcResult(tuple(removed), freed, kept)
+
+
+def default_skill_store(*, home: Path | str | None = None) -> SkillStore:
+    """Return the store kept under the OpenSkills cache directory."""
+
+    return SkillStore(get_cache_dir(home=home) / "store")
@@ -1,19 +1,40 @@
-"""Validate and parse SKILL.md files with YAML frontmatter."""
+"""Validate and parse SKILL.md files with YAML frontmatter.
 
+Parsed results are kept in a process-wide :class:`SkillDocumentCache`, keyed
+by the file's stat identity, so hosts that embed openskills and look up the
+same skills repeatedly only pay for parsing once per file version.
+"""
+
+import os
+import sys
+import threading
 import warnings
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any
 
-import yaml
+from .yaml import FrontmatterError, parse_frontmatter, read_frontmatter, read_frontmatter_from
 
 
 class SkillValidationError(Exception):
     """Raised when a SKILL.md file fails validation."""
 
 
-@dataclass
+# Default memory cap for the process-wide document cache.
+DEFAULT_DOCUMENT_CACHE_BYTES = 32 * 1024 * 1024
+
+# Rough per-entry bookkeeping cost (dataclass instances, key tuple, dict slot).
+_ENTRY_OVERHEAD_BYTES = 512
+
+# (absolute path, "document" | "metadata", max_frontmatter_bytes)
+_CacheKey = tuple[str, str, int | None]
+# (st_mtime_ns, st_size, st_ino)
+_StatIdentity = tuple[int, int, int]
+
+
+@dataclass(frozen=True, slots=True)
 class SkillMetadata:
     """Metadata defined in the SKILL.md YAML frontmatter."""
 
@@ -22,7 +43,7 @@ class SkillMetadata:
     context: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SkillDocument:
     """Structured representation of a SKILL.md file."""
 
@@ -31,63 +52,247 @@ class SkillDocument:
     body: str
 
 
-def load_skill_document(path: Path | str, *, strict: bool = True) -> SkillDocument | None:
+def load_skill_document(
+    path: Path | str,
+    *,
+    strict: bool = True,
+    max_frontmatter_bytes: int | None = None,
+    use_cache: bool = True,
+) -> SkillDocument | None:
     """Load and validate a SKILL.md file.
 
     Args:
         path: Path to the SKILL.md file.
         strict: When True, raise :class:`SkillValidationError` on problems.
             When False, emit warnings and return ``None`` to allow lenient flows.
+        max_frontmatter_bytes: Cap on the frontmatter block size; ``None``
+            uses the default from :func:`openskills.utils.yaml.read_frontmatter`.
+        use_cache: Serve and store the result in the process-wide
+            :class:`SkillDocumentCache`; pass False to always re-read the file.
 
     Returns:
         SkillDocument if the file is valid, otherwise ``None`` when ``strict`` is False.
     """
 
-    skill_path = Path(path)
+    try:
+        if use_cache:
+            return _document_cache.document(path, max_frontmatter_bytes=max_frontmatter_bytes)
+        return _parse_document(Path(path), max_frontmatter_bytes)
+    except SkillValidationError as exc:
+        return _handle_error(str(exc), strict)
+
 
-    if not skill_path.exists():
-        return _handle_error(f"SKILL.md not found at {skill_path}", strict)
+def load_skill_metadata(
+    path: Path | str,
+    *,
+    strict: bool = True,
+    max_frontmatter_bytes: int | None = None,
+    use_cache: bool = True,
+) -> SkillMetadata | None:
+    """Load and validate only the frontmatter of a SKILL.md file.
 
-    content = skill_path.read_text(encoding="utf-8")
+    Same contract as :func:`load_skill_document`, but the skill body is never
+    read, which keeps listing and installing cheap for very large skills.
+    """
 
     try:
-        frontmatter, body = _split_frontmatter(content)
-        metadata = _parse_frontmatter(frontmatter)
-    except SkillValidationError as exc:  # pragma: no cover - propagated in strict
+        if use_cache:
+            return _document_cache.metadata(path, max_frontmatter_bytes=max_frontmatter_bytes)
+        return _parse_metadata(Path(path), max_frontmatter_bytes)
+    except SkillValidationError as exc:
         return _handle_error(str(exc), strict)
 
-    return SkillDocument(path=skill_path, metadata=metadata, body=body)
 
+@dataclass(frozen=True)
+class DocumentCacheStats:
+    """Counters reported by :meth:`SkillDocumentCache.stats`."""
 
-def _handle_error(message: str, strict: bool) -> SkillDocument | None:
-    if strict:
-        raise SkillValidationError(message)
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
 
-    warnings.warn(message, stacklevel=2)
-    return None
 
+class SkillDocumentCache:
+    """Thread-safe LRU of parsed SKILL.md files, bounded by an estimated byte size.
+
+    Entries are keyed by absolute path and validated against the file's
+    ``(mtime_ns, size, inode)`` on every lookup, so an edited or replaced file
+    is re-parsed instead of served stale. Failed parses are never cached.
+    The returned dataclasses are frozen and shared between callers.
+    """
 
-def _split_frontmatter(content: str) -> tuple[dict[str, Any], str]:
-    lines = content.splitlines()
-    if not lines or lines[0].strip() != "---":
-        raise SkillValidationError("SKILL.md is missing YAML frontmatter start delimiter ('---')")
+    def __init__(self, max_bytes: int = DEFAULT_DOCUMENT_CACHE_BYTES) -> None:
+        self.max_bytes = max_bytes
+        # key -> (stat identity, parsed value, estimated size)
+        self._entries: OrderedDict[_CacheKey, tuple[_StatIdentity, Any, int]] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def document(self, path: Path | str, *, max_frontmatter_bytes: int | None = None) -> SkillDocument:
+        """Return the parsed document at ``path``; raise :class:`SkillValidationError` if invalid."""
+
+        skill_path = Path(path)
+        key = (os.path.abspath(skill_path), "document", max_frontmatter_bytes)
+        identity = _stat_identity(skill_path)
+
+        document = self._get(key, identity)
+        if document is None:
+            document = _parse_document(skill_path, max_frontmatter_bytes)
+            self._put(key, identity, document, _document_size(document))
+        elif document.path != skill_path:
+            document = replace(document, path=skill_path)
+        return document
+
+    def metadata(self, path: Path | str, *, max_frontmatter_bytes: int | None = None) -> SkillMetadata:
+        """Return the frontmatter at ``path``, reusing a cached full document when there is one."""
+
+        skill_path = Path(path)
+        absolute = os.path.abspath(skill_path)
+        identity = _stat_identity(skill_path)
+
+        document = self._get((absolute, "document", max_frontmatter_bytes), identity, count_miss=False)
+        if document is not None:
+            return document.metadata
+
+        key = (absolute, "metadata", max_frontmatter_bytes)
+        metadata = self._get(key, identity)
+        if metadata is None:
+            metadata = _parse_metadata(skill_path, max_frontmatter_bytes)
+            self._put(key, identity, metadata, _metadata_size(metadata))
+        return metadata
+
+    def invalidate(self, path: Path | str | None = None) -> int:
+        """Drop the entries for ``path`` (every entry when None); return how many were dropped."""
+
+        with self._lock:
+            if path is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                self._size = 0
+                return dropped
+
+            absolute = os.path.abspath(path)
+            keys = [key for key in self._entries if key[0] == absolute]
+            for key in keys:
+                self._size -= self._entries.pop(key)[2]
+            return len(keys)
+
+    def stats(self) -> DocumentCacheStats:
+        with self._lock:
+            return DocumentCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size_bytes=self._size,
+                max_bytes=self.max_bytes,
+            )
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = self._misses = self._evictions = 0
+
+    def _get(self, key: _CacheKey, identity: _StatIdentity, *, count_miss: bool = True) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == identity:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            if entry is not None:
+                self._size -= entry[2]
+                del self._entries[key]
+            if count_miss:
+                self._misses += 1
+            return None
+
+    def _put(self, key: _CacheKey, identity: _StatIdentity, value: Any, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[2]
+            self._entries[key] = (identity, value, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._size -= evicted
+                self._evictions += 1
+
+
+_document_cache = SkillDocumentCache()
+
+
+def get_document_cache() -> SkillDocumentCache:
+    """Return the process-wide cache used by :func:`load_skill_document` and :func:`load_skill_metadata`."""
+
+    return _document_cache
+
+
+def _stat_identity(skill_path: Path) -> _StatIdentity:
+    try:
+        st = skill_path.stat()
+    except FileNotFoundError:
+        raise SkillValidationError(f"SKILL.md not found at {skill_path}") from None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
 
-    closing_index = next((idx for idx, line in enumerate(lines[1:], start=1) if line.strip() == "---"), None)
-    if closing_index is None:
-        raise SkillValidationError("SKILL.md frontmatter is missing the closing '---' delimiter")
 
-    frontmatter_text = "\n".join(lines[1:closing_index])
-    body = "\n".join(lines[closing_index + 1 :])
+def _document_size(document: SkillDocument) -> int:
+    return sys.getsizeof(document.body) + _metadata_size(document.metadata)
 
+
+def _metadata_size(metadata: SkillMetadata) -> int:
+    size = _ENTRY_OVERHEAD_BYTES + sys.getsizeof(metadata.name) + sys.getsizeof(metadata.description)
+    return size + (sys.getsizeof(metadata.context) if metadata.context else 0)
+
+
+def _parse_document(skill_path: Path, max_frontmatter_bytes: int | None) -> SkillDocument:
+    try:
+        handle = skill_path.open("rb")
+    except FileNotFoundError:
+        raise SkillValidationError(f"SKILL.md not found at {skill_path}") from None
+
+    with handle:
+        try:
+            frontmatter_text = read_frontmatter_from(handle, max_bytes=max_frontmatter_bytes)
+        except FrontmatterError as exc:
+            raise SkillValidationError(str(exc)) from exc
+        body = "\n".join(handle.read().decode("utf-8").splitlines())
+
+    metadata = _parse_frontmatter(_load_frontmatter_mapping(frontmatter_text))
+    return SkillDocument(path=skill_path, metadata=metadata, body=body)
+
+
+def _parse_metadata(skill_path: Path, max_frontmatter_bytes: int | None) -> SkillMetadata:
     try:
-        data = yaml.safe_load(frontmatter_text) or {}
-    except yaml.YAMLError as exc:  # pragma: no cover - safety net for malformed YAML
-        raise SkillValidationError(f"Invalid YAML frontmatter: {exc}") from exc
+        frontmatter_text = read_frontmatter(skill_path, max_bytes=max_frontmatter_bytes)
+    except FileNotFoundError:
+        raise SkillValidationError(f"SKILL.md not found at {skill_path}") from None
+    except FrontmatterError as exc:
+        raise SkillValidationError(str(exc)) from exc
+
+    return _parse_frontmatter(_load_frontmatter_mapping(frontmatter_text))
 
-    if not isinstance(data, dict):
-        raise SkillValidationError("SKILL.md frontmatter must be a mapping")
 
-    return data, body
+def _handle_error(message: str, strict: bool) -> None:
+    if strict:
+        raise SkillValidationError(message)
+
+    warnings.warn(message, stacklevel=2)
+
+
+def _load_frontmatter_mapping(frontmatter_text: str) -> dict[str, Any]:
+    try:
+        return parse_frontmatter(frontmatter_text).fields
+    except FrontmatterError as exc:
+        raise SkillValidationError(str(exc)) from exc
 
 
 def _parse_frontmatter(frontmatter: dict[str, Any]) -> SkillMetadata:
@@ -0,0 +1,164 @@
+"""Pruning directory walker that locates skill folders in a source tree."""
+
+import os
+from collections.abc import Callable, Iterable
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+__all__ = [
+    "BUILD_OUTPUT_DIRS",
+    "DEFAULT_IGNORED_DIRS",
+    "SKILLIGNORE_FILE",
+    "find_agents_md_files",
+    "find_skill_dirs",
+    "load_skillignore",
+]
+
+SKILLIGNORE_FILE = ".skillignore"
+
+# Hidden directories (``.git``, ``.venv`` ...) are always skipped as well.
+DEFAULT_IGNORED_DIRS = frozenset(
+    {
+        "node_modules",
+        "__pycache__",
+        "venv",
+        "site-packages",
+        "bower_components",
+    }
+)
+
+# Common build output folders. Skill discovery does not prune them, because a
+# skill may really be named ``build`` or live under ``dist/``; list them in
+# ``.skillignore`` to skip them there. The AGENTS.md walk skips them by default.
+BUILD_OUTPUT_DIRS = frozenset({"build", "dist", "target", "out"})
+
+
+def load_skillignore(root: Path | str) -> list[str]:
+    """Return the patterns from ``root/.skillignore`` (empty if absent).
+
+    One ``fnmatch`` pattern per line; blank lines and ``#`` comments are
+    skipped. Patterns containing ``/`` match the path relative to ``root``,
+    others match any directory name. Leading and trailing slashes are ignored.
+    """
+
+    try:
+        text = Path(root, SKILLIGNORE_FILE).read_text(encoding="utf-8")
+    except OSError:
+        return []
+
+    patterns = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        pattern = stripped.strip("/")
+        if pattern:
+            patterns.append(pattern)
+    return patterns
+
+
+def _is_ignored(name: str, rel_path: str, ignored_names: frozenset[str], patterns: list[str]) -> bool:
+    if name.startswith(".") or name in ignored_names:
+        return True
+
+    for pattern in patterns:
+        target = rel_path if "/" in pattern else name
+        if fnmatchcase(target, pattern):
+            return True
+    return False
+
+
+def _walk(
+    root: Path | str,
+    visit: Callable[[str, list[os.DirEntry[str]]], tuple[Iterable[Path], bool]],
+    *,
+    ignore: Iterable[str] | None,
+    max_depth: int | None,
+) -> list[Path]:
+    """Depth-first pruning walk shared by the finders; results come back in path order.
+
+    ``visit(directory, entries)`` returns the matches in one directory and
+    whether to descend into it. Hidden and ignored directories,
+    ``.skillignore`` patterns and ``max_depth`` are applied here, and
+    symlinked directories are never entered.
+    """
+
+    root_path = os.fspath(root)
+    ignored_names = DEFAULT_IGNORED_DIRS if ignore is None else frozenset(ignore)
+    patterns = load_skillignore(root_path)
+
+    found: list[Path] = []
+    stack: list[tuple[str, str, int]] = [(root_path, "", 0)]
+
+    while stack:
+        directory, rel_dir, depth = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                listing = list(entries)
+        except OSError:
+            continue
+
+        matches, descend = visit(directory, listing)
+        found.extend(matches)
+        if not descend or (max_depth is not None and depth >= max_depth):
+            continue
+
+        subdirs = [(entry.name, entry.path) for entry in listing if entry.is_dir(follow_symlinks=False)]
+        for name, path in sorted(subdirs, reverse=True):
+            rel_path = f"{rel_dir}/{name}" if rel_dir else name
+            if not _is_ignored(name, rel_path, ignored_names, patterns):
+                stack.append((path, rel_path, depth + 1))
+
+    return found
+
+
+def _visit_for_skill(directory: str, entries: list[os.DirEntry[str]]) -> tuple[Iterable[Path], bool]:
+    # A directory containing SKILL.md is a skill; nothing below it is visited.
+    for entry in entries:
+        if entry.name == "SKILL.md" and entry.is_file():
+            return [Path(directory)], False
+    return (), True
+
+
+def _visit_for_agents_md(directory: str, entries: list[os.DirEntry[str]]) -> tuple[Iterable[Path], bool]:
+    return [Path(entry.path) for entry in entries if entry.name == "AGENTS.md" and entry.is_file()], True
+
+
+def find_skill_dirs(
+    root: Path | str,
+    *,
+    ignore: Iterable[str] | None = None,
+    max_depth: int | None = None,
+) -> list[Path]:
+    """Return every directory under ``root`` that holds a SKILL.md, in path order.
+
+    The walk uses ``os.scandir`` and prunes aggressively:
+
+    * hidden directories and :data:`DEFAULT_IGNORED_DIRS` (or ``ignore``) are skipped;
+    * patterns from ``root/.skillignore`` are honored;
+    * a directory containing SKILL.md is a skill, so nothing below it is visited;
+    * directories deeper than ``max_depth`` (``root`` is depth 0) are not entered.
+
+    Symlinked directories are not followed, which keeps the walk cycle-free.
+    """
+
+    return _walk(root, _visit_for_skill, ignore=ignore, max_depth=max_depth)
+
+
+def find_agents_md_files(
+    root: Path | str,
+    *,
+    ignore: Iterable[str] | None = None,
+    max_depth: int | None = None,
+) -> list[Path]:
+    """Return every ``AGENTS.md`` file under ``root`` (including ``root`` itself), in path order.
+
+    Pruning matches :func:`find_skill_dirs`: hidden and ignored directories,
+    ``.skillignore`` patterns and ``max_depth`` apply, and symlinked
+    directories are not followed. By default :data:`BUILD_OUTPUT_DIRS` are
+    skipped too. Nested workspaces are all reported.
+    """
+
+    if ignore is None:
+        ignore = DEFAULT_IGNORED_DIRS | BUILD_OUTPUT_DIRS
+    return _walk(root, _visit_for_agents_md, ignore=ignore, max_depth=max_depth)
@@ -1,15 +1,27 @@
 """Skill discovery utilities."""
 
+import os
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
 from .dirs import get_search_dirs
-from .yaml import extract_yaml_field
+from .skill_index import IndexEntry, SkillIndex, default_skill_index
 
-__all__ = ["Skill", "discover_skills", "find_skill"]
+__all__ = [
+    "Skill",
+    "SkillResolver",
+    "SkillTable",
+    "discover_skill_table",
+    "discover_skills",
+    "find_skill",
+    "iter_skills",
+]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Skill:
     """Representation of an installed skill."""
 
@@ -26,68 +38,296 @@ def _is_relative_to(base: Path, target: Path) -> bool:
     return target.is_relative_to(base)
 
 
-def discover_skills(*, cwd: Path | None = None, home: Path | None = None) -> list[Skill]:
+def discover_skills(
+    *,
+    cwd: Path | None = None,
+    home: Path | None = None,
+    index: SkillIndex | None = None,
+    scanned: dict[Path, list[IndexEntry]] | None = None,
+) -> list[Skill]:
     """Find all installed skills across search roots.
 
     Deduplicates by skill name, honoring search priority to mirror Node output.
+    Metadata comes from the persistent :class:`SkillIndex`, so unchanged skills
+    cost a ``stat`` rather than a full SKILL.md read. When no ``index`` is
+    passed, the default on-disk index is used and saved before returning.
+    ``scanned`` memoizes root scans across calls, so discovering many
+    workspaces that share one home scans the global roots once.
     """
 
-    cwd = Path.cwd() if cwd is None else cwd
-    search_dirs = get_search_dirs(cwd=cwd, home=home)
+    return list(iter_skills(cwd=cwd, home=home, index=index, scanned=scanned))
 
-    skills: list[Skill] = []
-    seen: set[str] = set()
 
-    for directory in search_dirs:
-        if not directory.is_dir():
-            continue
+def iter_skills(
+    *,
+    cwd: Path | None = None,
+    home: Path | None = None,
+    index: SkillIndex | None = None,
+    scanned: dict[Path, list[IndexEntry]] | None = None,
+    describe: bool = True,
+) -> Iterator[Skill]:
+    """Yield the skills :func:`discover_skills` returns, one search root at a time.
 
-        for entry in sorted(directory.iterdir(), key=lambda p: p.name):
-            if not entry.is_dir():
-                continue
+    Skills from the first roots are available before later roots are
+    scanned. With ``describe=False`` SKILL.md files are not read for their
+    descriptions (cached ones are still filled in), which is all a listing
+    of names or paths needs.
+    """
 
-            skill_name = entry.name
-            if skill_name in seen:
-                continue
+    for directory, location, entry in _scan_search_dirs(
+        cwd=cwd, home=home, index=index, scanned=scanned, describe=describe
+    ):
+        base_dir = directory / entry.name
+        yield Skill(
+            name=entry.name,
+            description=entry.description,
+            location=location,
+            base_dir=base_dir,
+            skill_path=base_dir / "SKILL.md",
+        )
 
-            skill_md = entry / "SKILL.md"
-            if not skill_md.is_file():
-                continue
 
-            content = skill_md.read_text(encoding="utf-8")
-            description = extract_yaml_field(content, "description")
+def discover_skill_table(
+    *,
+    cwd: Path | None = None,
+    home: Path | None = None,
+    index: SkillIndex | None = None,
+) -> "SkillTable":
+    """Like :func:`discover_skills`, but collect the result into a compact :class:`SkillTable`."""
 
-            location = "project" if _is_relative_to(cwd, directory) else "global"
+    table = SkillTable()
+    for directory, location, entry in _scan_search_dirs(cwd=cwd, home=home, index=index, scanned=None):
+        table.append(entry.name, entry.description, location, directory)
+    return table
 
-            skills.append(
-                Skill(
-                    name=skill_name,
-                    description=description,
-                    location=location,
-                    base_dir=entry,
-                    skill_path=skill_md,
-                )
-            )
-            seen.add(skill_name)
 
-    return skills
+def _scan_search_dirs(
+    *,
+    cwd: Path | None,
+    home: Path | None,
+    index: SkillIndex | None,
+    scanned: dict[Path, list[IndexEntry]] | None,
+    describe: bool = True,
+) -> Iterator[tuple[Path, str, IndexEntry]]:
+    """Yield ``(root, location, entry)`` for each skill name's highest-priority copy."""
+
+    cwd = Path.cwd() if cwd is None else cwd
+    search_dirs = get_search_dirs(cwd=cwd, home=home)
+    owns_index = index is None
+    if index is None:
+        index = default_skill_index(home=home)
+
+    seen: set[str] = set()
+    for directory in search_dirs:
+        location = "project" if _is_relative_to(cwd, directory) else "global"
 
+        if not describe:
+            entries = index.scan(directory, describe=False)
+        elif scanned is None:
+            entries = index.scan(directory)
+        elif directory in scanned:
+            entries = scanned[directory]
+        else:
+            entries = scanned[directory] = index.scan(directory)
+
+        for entry in entries:
+            if entry.name in seen:
+                continue
+            seen.add(entry.name)
+            yield directory, location, entry
 
-def find_skill(skill_name: str, *, cwd: Path | None = None, home: Path | None = None) -> Skill | None:
+    if owns_index:
+        index.save()
+
+
+def find_skill(
+    skill_name: str,
+    *,
+    cwd: Path | None = None,
+    home: Path | None = None,
+    index: SkillIndex | None = None,
+) -> Skill | None:
     """Find the first matching skill across search roots."""
 
     cwd = Path.cwd() if cwd is None else cwd
+    if index is None:
+        index = SkillIndex(None)
 
     for directory in get_search_dirs(cwd=cwd, home=home):
-        skill_md = directory / skill_name / "SKILL.md"
-        if skill_md.is_file():
+        entry = index.lookup(directory, skill_name)
+        if entry is not None:
             location = "project" if _is_relative_to(cwd, directory) else "global"
             return Skill(
                 name=skill_name,
-                description=extract_yaml_field(skill_md.read_text(encoding="utf-8"), "description"),
+                description=entry.description,
                 location=location,
                 base_dir=directory / skill_name,
-                skill_path=skill_md,
+                skill_path=directory / skill_name / "SKILL.md",
             )
 
     return None
+
+
+class SkillTable:
+    """Columnar collection of skills for large, read-mostly listings.
+
+    Names and descriptions live in parallel lists of (interned) strings, and
+    each row points at its search root through a 4-byte index into a short
+    list of root directories. A row therefore costs a few pointers instead of
+    a :class:`Skill` holding two ``Path`` objects; :class:`Skill` instances
+    are only built when a row is read.
+    """
+
+    __slots__ = ("_descriptions", "_names", "_positions", "_root_ids", "_root_lookup", "_roots")
+
+    def __init__(self) -> None:
+        self._names: list[str] = []
+        self._descriptions: list[str] = []
+        self._root_ids = array("I")
+        self._roots: list[tuple[str, str]] = []
+        self._root_lookup: dict[tuple[str, str], int] = {}
+        self._positions: dict[str, int] | None = None
+
+    @classmethod
+    def from_skills(cls, skills: Iterable[Skill]) -> "SkillTable":
+        table = cls()
+        for skill in skills:
+            table.append(skill.name, skill.description, skill.location, skill.base_dir.parent)
+        return table
+
+    def append(self, name: str, description: str, location: str, root: Path | str) -> None:
+        """Add the skill ``root/name``; ``location`` is ``"project"`` or ``"global"``."""
+
+        key = (os.fspath(root), sys.intern(location))
+        root_id = self._root_lookup.get(key)
+        if root_id is None:
+            root_id = self._root_lookup[key] = len(self._roots)
+            self._roots.append(key)
+
+        name = sys.intern(name)
+        if self._positions is not None:
+            self._positions.setdefault(name, len(self._names))
+        self._names.append(name)
+        self._descriptions.append(description)
+        self._root_ids.append(root_id)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __getitem__(self, position: int) -> Skill:
+        root, location = self._roots[self._root_ids[position]]
+        base_dir = Path(root, self._names[position])
+        return Skill(
+            name=self._names[position],
+            description=self._descriptions[position],
+            location=location,
+            base_dir=base_dir,
+            skill_path=base_dir / "SKILL.md",
+        )
+
+    def __iter__(self) -> Iterator[Skill]:
+        for position in range(len(self._names)):
+            yield self[position]
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and name in self._index()
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._names)
+
+    def find(self, name: str) -> Skill | None:
+        """Return the first row named ``name``; the name index is built on first use."""
+
+        position = self._index().get(name)
+        return None if position is None else self[position]
+
+    def rows(self) -> Iterator[tuple[str, str, str, str]]:
+        """Yield ``(name, description, location, base_dir)`` with the directory as a plain string."""
+
+        for name, description, root_id in zip(self._names, self._descriptions, self._root_ids, strict=True):
+            root, location = self._roots[root_id]
+            yield name, description, location, os.path.join(root, name)
+
+    def _index(self) -> dict[str, int]:
+        if self._positions is None:
+            positions: dict[str, int] = {}
+            for position, name in enumerate(self._names):
+                positions.setdefault(name, position)
+            self._positions = positions
+        return self._positions
+
+
+class SkillResolver:
+    """Resolve skill names against the search roots once per command.
+
+    Positive and negative lookups are memoized, and once :meth:`all` has run
+    every further :meth:`find` is a dictionary lookup. Callers that remove a
+    skill must call :meth:`forget` so a lower-priority copy can surface.
+    """
+
+    def __init__(
+        self,
+        *,
+        cwd: Path | None = None,
+        home: Path | None = None,
+        index: SkillIndex | None = None,
+        jobs: int | None = None,
+    ) -> None:
+        self.cwd = Path.cwd() if cwd is None else cwd
+        self.home = home
+        self.index = default_skill_index(home=home, jobs=jobs) if index is None else index
+        self.search_dirs = get_search_dirs(cwd=self.cwd, home=home)
+        self._found: dict[str, Skill] = {}
+        self._missing: set[str] = set()
+        self._stale: set[str] = set()
+        self._complete = False
+        self._all: list[Skill] | None = None
+
+    def all(self) -> list[Skill]:
+        """Return every installed skill in priority order (scanned once)."""
+
+        if self._all is None:
+            self._all = discover_skills(cwd=self.cwd, home=self.home, index=self.index)
+            self._found = {skill.name: skill for skill in self._all}
+            self._missing.clear()
+            self._stale.clear()
+            self._complete = True
+            self.index.save()
+
+        return list(self._all)
+
+    def find(self, skill_name: str) -> Skill | None:
+        """Return the highest-priority skill named ``skill_name``."""
+
+        if skill_name in self._found:
+            return self._found[skill_name]
+        if skill_name in self._missing:
+            return None
+        if self._complete and skill_name not in self._stale:
+            return None
+
+        skill = find_skill(skill_name, cwd=self.cwd, home=self.home, index=self.index)
+        self._stale.discard(skill_name)
+        if skill is None:
+            self._missing.add(skill_name)
+        else:
+            self._found[skill_name] = skill
+        return skill
+
+    def find_many(self, skill_names: Iterable[str]) -> dict[str, Skill | None]:
+        """Resolve several names at once; more than one name costs a single :meth:`all` scan."""
+
+        names = list(dict.fromkeys(skill_names))
+        if len(names) > 1 and not all(name in self._found for name in names):
+            self.all()
+        return {name: self.find(name) for name in names}
+
+    def forget(self, skill_name: str) -> None:
+        """Drop cached results for ``skill_name`` after it changed on disk."""
+
+        self._found.pop(skill_name, None)
+        self._missing.discard(skill_name)
+        if self._complete:
+            self._stale.add(skill_name)
+        self._all = None
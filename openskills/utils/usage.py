@@ -0,0 +1,100 @@
+"""Per-user count of how often each skill is read, used to rank skills in AGENTS.md.
+
+Every successful ``openskills read`` appends the skill name to
+``<cache>/usage.log`` with a single ``O_APPEND`` write, which keeps the read
+path free of locking and parsing. Readers aggregate the log; once it grows
+past :data:`COMPACT_BYTES` it is rewritten as one ``name<TAB>count`` line per
+skill. Set ``OPENSKILLS_NO_USAGE`` to stop recording.
+
+The log location follows the environment of the process running the command
+(see :func:`usage_log_path`). A daemon serving ``read`` records into the path
+the client resolved, so both routes count into the log ``sync`` reads.
+"""
+
+import os
+from pathlib import Path
+
+from .dirs import get_cache_dir
+
+__all__ = ["NO_USAGE_ENV", "USAGE_LOG", "read_usage_counts", "record_skill_read", "usage_log_path"]
+
+USAGE_LOG = "usage.log"
+NO_USAGE_ENV = "OPENSKILLS_NO_USAGE"
+
+# Rewrite the log as aggregated counts once it is this large.
+COMPACT_BYTES = 256 * 1024
+
+
+def usage_log_path() -> Path:
+    """Return the usage log under this process's cache directory."""
+
+    return get_cache_dir() / USAGE_LOG
+
+
+def record_skill_read(skill_name: str, *, log_path: Path | str | None = None) -> None:
+    """Count one read of ``skill_name``; failures are ignored (usage is advisory).
+
+    ``log_path`` defaults to :func:`usage_log_path`; when it is given the caller
+    has already applied ``OPENSKILLS_NO_USAGE``.
+    """
+
+    if "\n" in skill_name or "\t" in skill_name:
+        return
+    if log_path is None:
+        if os.environ.get(NO_USAGE_ENV):
+            return
+        log_path = usage_log_path()
+
+    path = Path(log_path)
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    except FileNotFoundError:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        except OSError:
+            return
+    except OSError:
+        return
+
+    try:
+        os.write(fd, f"{skill_name}\n".encode())
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def read_usage_counts(*, log_path: Path | str | None = None) -> dict[str, int]:
+    """Return ``{skill_name: reads}`` from the usage log, compacting it when large."""
+
+    path = Path(log_path) if log_path is not None else usage_log_path()
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return {}
+
+    counts: dict[str, int] = {}
+    for line in data.decode("utf-8", errors="replace").splitlines():
+        name, _, count = line.partition("\t")
+        if not name:
+            continue
+        counts[name] = counts.get(name, 0) + (int(count) if count.isdigit() else 1)
+
+    if len(data) > COMPACT_BYTES:
+        _compact(path, len(data), counts)
+    return counts
+
+
+def _compact(path: Path, aggregated_bytes: int, counts: dict[str, int]) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as out:
+            out.write("".join(f"{name}\t{count}\n" for name, count in sorted(counts.items())).encode("utf-8"))
+            # Carry over reads appended while we were aggregating.
+            with path.open("rb") as handle:
+                handle.seek(aggregated_bytes)
+                out.write(handle.read())
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
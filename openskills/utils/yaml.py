@@ -1,21 +1,284 @@
 """Minimal YAML helpers for parsing SKILL.md frontmatter."""
 
+import os
 import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
 
-__all__ = ["extract_yaml_field", "has_valid_frontmatter"]
+__all__ = [
+    "DEFAULT_FRONTMATTER_MAX_BYTES",
+    "Frontmatter",
+    "FrontmatterError",
+    "extract_yaml_field",
+    "has_valid_frontmatter",
+    "parse_frontmatter",
+    "read_frontmatter",
+    "read_frontmatter_from",
+]
 
 
 FRONTMATTER_PREFIX = "---"
+DEFAULT_FRONTMATTER_MAX_BYTES = 64 * 1024
+
+_DELIMITER = b"---"
+_MAX_BYTES_ENV = "OPENSKILLS_FRONTMATTER_MAX_BYTES"
+
+_SIMPLE_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_.-]*")
+_KNOWN_KEYS = frozenset({"name", "description", "context", "license", "version"})
+_NULL_VALUES = frozenset({"", "~", "null", "Null", "NULL"})
+# Plain scalars PyYAML would resolve to bool/int/float/timestamp are handed to
+# the full parser so the tokenizer never disagrees with it.
+_BOOL_WORDS = frozenset(
+    {
+        *("true", "True", "TRUE", "false", "False", "FALSE"),
+        *("yes", "Yes", "YES", "no", "No", "NO"),
+        *("on", "On", "ON", "off", "Off", "OFF"),
+    }
+)
+# PyYAML's value and merge-key tags; safe_load rejects both as plain values.
+_SPECIAL_WORDS = frozenset({"=", "<<"})
+_NUMERIC_START = frozenset("0123456789+-.")
+_NUMERIC_LIKE = re.compile(
+    r"[-+]?\.?[0-9][0-9_.:eE+-]*"  # decimal, octal, float and base-60 ints
+    r"|[-+]?0[xXoObB][0-9a-fA-F_]+"  # hex/binary ints (and 0o forms, kept as strings by PyYAML)
+    r"|[-+]?\.(?:inf|Inf|INF|nan|NaN|NAN)"
+)
+# Dates and timestamps, with ``T`` or spaces before the time; a prefix match is enough to defer.
+_TIMESTAMP_LIKE = re.compile(r"[0-9]{4}-[0-9]{1,2}-[0-9]{1,2}")
+_INDICATORS = frozenset("-?:,[]{}#&*!|>'\"%@`")
+
+
+class FrontmatterError(ValueError):
+    """Raised when a SKILL.md frontmatter block cannot be located or parsed."""
+
+
+@dataclass
+class Frontmatter:
+    """Top-level keys parsed from a SKILL.md frontmatter block."""
+
+    name: str | None
+    description: str | None
+    context: str | None
+    fields: dict[str, Any]
+
+
+def _as_text(value: Any) -> str | None:
+    return None if value is None else str(value)
+
+
+def _make_record(fields: dict[str, Any]) -> Frontmatter:
+    return Frontmatter(
+        name=_as_text(fields.get("name")),
+        description=_as_text(fields.get("description")),
+        context=_as_text(fields.get("context")),
+        fields=fields,
+    )
+
+
+def _scalar(raw: str) -> tuple[Any, bool]:
+    """Return ``(value, simple)`` for the text after ``key:`` on one line."""
+
+    if raw in _NULL_VALUES:
+        return None, True
+
+    first = raw[0]
+    if first == "'":
+        if len(raw) < 2 or not raw.endswith("'"):
+            return raw, False
+        inner = raw[1:-1]
+        if "'" in inner.replace("''", ""):
+            return raw, False
+        return inner.replace("''", "'"), True
+
+    if first == '"':
+        inner = raw[1:-1]
+        if len(raw) < 2 or not raw.endswith('"') or "\\" in inner or '"' in inner:
+            return raw, False
+        return inner, True
+
+    if first in _INDICATORS or "\t" in raw:
+        # PyYAML rejects tabs inside most plain scalars; let it decide.
+        return raw, False
+
+    if "#" in raw:
+        comment = raw.find(" #")
+        if comment != -1:
+            raw = raw[:comment].rstrip()
+
+    if ": " in raw or raw[-1] == ":" or raw in _BOOL_WORDS or raw in _SPECIAL_WORDS:
+        return raw, False
+    if first in _NUMERIC_START and (_NUMERIC_LIKE.fullmatch(raw) or _TIMESTAMP_LIKE.match(raw)):
+        return raw, False
+
+    return raw, True
+
+
+def _tokenize(text: str) -> tuple[dict[str, Any], bool]:
+    """Split ``key: value`` lines in one pass; flag anything needing real YAML."""
+
+    fields: dict[str, Any] = {}
+    simple = True
+
+    for line in text.splitlines():
+        if not line or line[0] == "#":
+            continue
+        if line[0] in " \t":
+            stripped = line.lstrip()
+            if stripped and stripped[0] != "#":
+                simple = False
+            continue
+
+        key, sep, rest = line.partition(":")
+        if not sep or (rest and rest[0] not in " \t"):
+            simple = False
+            continue
+        if key not in _KNOWN_KEYS and not _SIMPLE_KEY.fullmatch(key):
+            simple = False
+            continue
+
+        value, is_simple = _scalar(rest.strip())
+        fields[key] = value
+        simple = simple and is_simple
+
+    return fields, simple
+
+
+def parse_frontmatter(text: str, *, lenient: bool = False) -> Frontmatter:
+    """Parse the top-level keys of a frontmatter block in a single pass.
+
+    Plain, single-quoted and escape-free double-quoted one-line scalars are
+    handled directly. Anything else (block scalars, flow collections, nested
+    mappings, continuation lines, tabs, and anything that looks like a bool,
+    number, date or timestamp) falls back to ``yaml.safe_load`` for the whole
+    block, so those values get PyYAML's types and PyYAML's errors.
+
+    Args:
+        text: Frontmatter text without the ``---`` delimiters.
+        lenient: When True, YAML errors return the raw one-line values instead
+            of raising, mirroring the forgiving regex lookup used by discovery.
+
+    Raises:
+        FrontmatterError: If the YAML is invalid or not a mapping (strict mode).
+    """
+
+    fields, simple = _tokenize(text)
+    if simple:
+        return _make_record(fields)
+
+    import yaml  # Deferred: PyYAML is only needed for complex frontmatter.
+
+    try:
+        data = yaml.safe_load(text)
+    except yaml.YAMLError as exc:
+        if lenient:
+            return _make_record(fields)
+        raise FrontmatterError(f"Invalid YAML frontmatter: {exc}") from exc
+
+    if data is None:
+        data = {}
+    if not isinstance(data, dict):
+        if lenient:
+            return _make_record(fields)
+        raise FrontmatterError("SKILL.md frontmatter must be a mapping")
+
+    return _make_record(data)
+
+
+def _frontmatter_block(content: str) -> str | None:
+    """Return the text between the ``---`` delimiters of an in-memory document."""
+
+    if not content.startswith(FRONTMATTER_PREFIX):
+        return None
+
+    start = content.find("\n")
+    if start == -1 or content[:start].strip() != FRONTMATTER_PREFIX:
+        return None
+
+    position = start + 1
+    while position < len(content):
+        end = content.find("\n", position)
+        line_end = len(content) if end == -1 else end
+        if content[position:line_end].strip() == FRONTMATTER_PREFIX:
+            return content[start + 1 : position]
+        position = line_end + 1
+    return None
 
 
 def extract_yaml_field(content: str, field: str) -> str:
-    """Extract a simple field from YAML frontmatter using a lightweight regex."""
+    """Extract a top-level field from a document's YAML frontmatter.
 
-    match = re.search(rf"^{re.escape(field)}:\s*(.+)$", content, re.MULTILINE)
-    return match.group(1).strip() if match else ""
+    Only the frontmatter block is inspected, so a ``field:`` line in the body
+    never matches. Returns an empty string when the field is absent.
+    """
+
+    block = _frontmatter_block(content)
+    if block is None:
+        return ""
+
+    value = parse_frontmatter(block, lenient=True).fields.get(field)
+    return "" if value is None else str(value)
 
 
 def has_valid_frontmatter(content: str) -> bool:
     """Check whether the provided content starts with YAML frontmatter."""
 
     return content.strip().startswith(FRONTMATTER_PREFIX)
+
+
+def _resolve_max_bytes(max_bytes: int | None) -> int:
+    if max_bytes is not None:
+        return max_bytes
+
+    override = os.environ.get(_MAX_BYTES_ENV)
+    if override:
+        try:
+            return int(override)
+        except ValueError:
+            pass
+    return DEFAULT_FRONTMATTER_MAX_BYTES
+
+
+def read_frontmatter_from(handle: BinaryIO, *, max_bytes: int | None = None) -> str:
+    """Read the frontmatter block from a binary file positioned at its start.
+
+    Lines are consumed one at a time and reading stops at the closing ``---``,
+    leaving ``handle`` positioned at the first body byte. At most ``max_bytes``
+    (delimiters included) are read; ``None`` uses ``OPENSKILLS_FRONTMATTER_MAX_BYTES``
+    or :data:`DEFAULT_FRONTMATTER_MAX_BYTES`.
+
+    Raises:
+        FrontmatterError: If a delimiter is missing or the cap is exceeded.
+    """
+
+    limit = _resolve_max_bytes(max_bytes)
+
+    first = handle.readline(limit + 1)
+    consumed = len(first)
+    if first.removeprefix(b"\xef\xbb\xbf").strip() != _DELIMITER:
+        raise FrontmatterError("SKILL.md is missing YAML frontmatter start delimiter ('---')")
+
+    lines: list[bytes] = []
+    while True:
+        line = handle.readline(limit - consumed + 1)
+        consumed += len(line)
+        if consumed > limit:
+            raise FrontmatterError(f"SKILL.md frontmatter exceeds {limit} bytes")
+        if not line:
+            raise FrontmatterError("SKILL.md frontmatter is missing the closing '---' delimiter")
+        if line.strip() == _DELIMITER:
+            break
+        lines.append(line)
+
+    return b"".join(lines).decode("utf-8")
+
+
+def read_frontmatter(path: Path | str, *, max_bytes: int | None = None) -> str:
+    """Return the raw YAML between the ``---`` delimiters of a SKILL.md file.
+
+    The skill body is never read. See :func:`read_frontmatter_from` for the
+    byte cap and the errors raised.
+    """
+
+    with open(path, "rb") as handle:
+        return read_frontmatter_from(handle, max_bytes=max_bytes)
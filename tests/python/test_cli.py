@@ -49,3 +49,18 @@ def test_remove_alias_help(runner: CliRunner) -> None:
 
     assert result.exit_code == 0
     assert re.search(r"remove.*rm", result.output, re.IGNORECASE)
+
+
+@pytest.mark.parametrize("value", ["0", "many"])
+def test_bad_jobs_env_falls_back_instead_of_failing(runner: CliRunner, tmp_path, monkeypatch, value: str) -> None:
+    source = tmp_path / "source" / "pdf"
+    source.mkdir(parents=True)
+    (source / "SKILL.md").write_text("---\nname: pdf\ndescription: PDF tools\n---\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    env = {"HOME": str(tmp_path / "home"), "OPENSKILLS_CACHE_DIR": str(tmp_path / "cache"), "OPENSKILLS_JOBS": value}
+
+    for args in (["install", str(source.parent), "--yes"], ["list", "--json"], ["sync", "--yes"], ["update"]):
+        result = runner.invoke(cli, args, env=env)
+        assert result.exit_code == 0, (args, result.output)
+
+    assert runner.invoke(cli, ["list", "-j", "0"], env=env).exit_code == 2
@@ -0,0 +1,34 @@
+import time
+
+import pytest
+
+from openskills.utils.concurrency import map_ordered, resolve_jobs
+
+
+def test_resolve_jobs_reads_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("OPENSKILLS_JOBS", raising=False)
+    assert resolve_jobs() == 1
+
+    monkeypatch.setenv("OPENSKILLS_JOBS", "8")
+    assert resolve_jobs() == 8
+    assert resolve_jobs(3) == 3
+
+    monkeypatch.setenv("OPENSKILLS_JOBS", "many")
+    assert resolve_jobs() == 1
+    assert resolve_jobs(0) == 1
+
+
+def test_map_ordered_keeps_input_order_when_completion_is_reversed() -> None:
+    def _slow_for_small(value: int) -> int:
+        time.sleep((5 - value) * 0.01)
+        return value * 10
+
+    assert map_ordered(_slow_for_small, range(5), jobs=5) == [0, 10, 20, 30, 40]
+
+
+def test_resolve_jobs_uses_caller_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("OPENSKILLS_JOBS", raising=False)
+    assert resolve_jobs(default=4) == 4
+
+    monkeypatch.setenv("OPENSKILLS_JOBS", "2")
+    assert resolve_jobs(default=4) == 2
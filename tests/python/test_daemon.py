@@ -0,0 +1,103 @@
+import threading
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from openskills import client
+from openskills.cli import cli
+from openskills.daemon import SkillServer, daemon_status, serve, stop_daemon
+from openskills.utils import read_usage_counts
+
+
+def _write_skill(root: Path, name: str, body: str) -> Path:
+    skill_md = root / name / "SKILL.md"
+    skill_md.parent.mkdir(parents=True, exist_ok=True)
+    skill_md.write_text(f"---\nname: {name}\ndescription: {name} description\n---\n\n{body}\n", encoding="utf-8")
+    return skill_md
+
+
+@pytest.fixture()
+def running_daemon(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    path = str(tmp_path / "d.sock")
+    monkeypatch.setenv("OPENSKILLS_SOCKET", path)
+    ready = threading.Event()
+    thread = threading.Thread(target=serve, args=(path,), kwargs={"ready": ready}, daemon=True)
+    thread.start()
+    assert ready.wait(5)
+    yield path
+    stop_daemon(path)
+    thread.join(5)
+
+
+def test_daemon_replies_match_cli_output(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, running_daemon: str) -> None:
+    project = tmp_path / "project"
+    home = tmp_path / "home"
+    skill_md = _write_skill(project / ".agent/skills", "alpha", "First body")
+    _write_skill(home / ".agent/skills", "beta", "Global body")
+    monkeypatch.chdir(project)
+    monkeypatch.setenv("HOME", str(home))
+
+    runner = CliRunner()
+    for args in (["list"], ["read", "alpha"], ["read", "missing"], ["read", "alpha", "beta", "missing", "gone"]):
+        expected = runner.invoke(cli, args)
+        reply = client.daemon_request(args[0], args[1:])
+        assert reply is not None
+        assert reply["code"] == expected.exit_code
+        assert reply["stdout"] + reply["stderr"] == expected.output
+
+    skill_md.write_text("---\nname: alpha\ndescription: changed\n---\n\nSecond body, longer\n", encoding="utf-8")
+    reply = client.daemon_request("read", ["alpha"])
+    assert reply is not None
+    assert "Second body, longer" in reply["stdout"]
+
+
+def test_client_answers_in_process_without_daemon(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setenv("OPENSKILLS_SOCKET", str(tmp_path / "absent.sock"))
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.chdir(tmp_path)
+
+    assert not daemon_status()
+    client.main(["list"])
+    assert "No skills installed." in capsys.readouterr().out
+
+    with pytest.raises(SystemExit) as exc_info:
+        client.main(["read", "missing"])
+    assert exc_info.value.code == 1
+    assert "Skill 'missing' not found" in capsys.readouterr().err
+
+
+def test_daemon_reads_count_into_the_client_usage_log(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, running_daemon: str
+) -> None:
+    project = tmp_path / "project"
+    _write_skill(project / ".agent/skills", "alpha", "First body")
+    monkeypatch.chdir(project)
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.delenv("OPENSKILLS_CACHE_DIR", raising=False)
+    monkeypatch.delenv("OPENSKILLS_NO_USAGE", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+
+    assert client.daemon_request("read", ["alpha"]) is not None
+    assert read_usage_counts() == {"alpha": 1}
+    assert (tmp_path / "xdg/openskills/usage.log").exists()
+
+    monkeypatch.setenv("OPENSKILLS_NO_USAGE", "1")
+    assert client.daemon_request("read", ["alpha"]) is not None
+    assert read_usage_counts() == {"alpha": 1}
+
+
+def test_daemon_records_usage_where_the_request_says(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    project = tmp_path / "project"
+    _write_skill(project / ".agent/skills", "alpha", "First body")
+    monkeypatch.delenv("OPENSKILLS_NO_USAGE", raising=False)
+    log = tmp_path / "client-cache/usage.log"
+    request = {"command": "read", "args": ["alpha"], "cwd": str(project), "home": str(tmp_path / "home")}
+
+    server = SkillServer()
+    assert server.handle({**request, "usage_log": str(log)})["code"] == 0
+    assert server.handle({**request, "usage_log": None})["code"] == 0
+
+    assert read_usage_counts(log_path=log) == {"alpha": 1}
@@ -1,6 +1,7 @@
 import os
+from pathlib import Path
 
-from openskills.utils import copy_skill_dir
+from openskills.utils import copy_skill_dir, prune_backups, write_text_atomic
 
 
 def test_copy_skill_dir_skips_when_prompt_declines(tmp_path) -> None:
@@ -40,3 +41,142 @@ def test_copy_skill_dir_backs_up_when_yes(tmp_path) -> None:
     assert result.backup_path is not None
     assert os.path.exists(result.backup_path)
     assert (target_dir / "file.txt").read_text() == "new-content"
+
+
+def _make_source(tmp_path: Path) -> Path:
+    source_dir = tmp_path / "source"
+    (source_dir / "scripts").mkdir(parents=True)
+    (source_dir / "SKILL.md").write_text("skill")
+    (source_dir / "scripts" / "run.sh").write_text("echo hi")
+    return source_dir
+
+
+def test_copy_skill_dir_hardlink_shares_inodes(tmp_path) -> None:
+    source_dir = _make_source(tmp_path)
+    target_dir = tmp_path / "dest" / "skill"
+
+    result = copy_skill_dir(str(source_dir), str(target_dir), link_mode="hardlink")
+
+    assert result.status == "copied"
+    assert (target_dir / "scripts" / "run.sh").stat().st_ino == (source_dir / "scripts" / "run.sh").stat().st_ino
+
+
+def test_copy_skill_dir_symlink_points_at_source(tmp_path) -> None:
+    source_dir = _make_source(tmp_path)
+    target_dir = tmp_path / "dest" / "skill"
+    target_dir.parent.mkdir()
+    (tmp_path / "elsewhere").mkdir()
+    target_dir.symlink_to(tmp_path / "elsewhere")
+
+    result = copy_skill_dir(str(source_dir), str(target_dir), yes=True, link_mode="symlink")
+
+    assert result.status == "backed_up"
+    assert os.readlink(target_dir) == str(source_dir)
+    assert (target_dir / "SKILL.md").read_text() == "skill"
+
+
+def test_copy_skill_dir_reflink_falls_back_to_copy(tmp_path) -> None:
+    source_dir = _make_source(tmp_path)
+    target_dir = tmp_path / "dest" / "skill"
+
+    copy_skill_dir(str(source_dir), str(target_dir), link_mode="reflink")
+
+    assert (target_dir / "scripts" / "run.sh").read_text() == "echo hi"
+    assert not (target_dir / "scripts" / "run.sh").is_symlink()
+
+
+def test_copy_skill_dir_overwrite_renames_old_tree_to_backup(tmp_path: Path) -> None:
+    source_dir = _make_source(tmp_path)
+    target_dir = tmp_path / "dest" / "skill"
+    target_dir.mkdir(parents=True)
+    (target_dir / "SKILL.md").write_text("old")
+    original_inode = target_dir.stat().st_ino
+
+    result = copy_skill_dir(str(source_dir), str(target_dir), yes=True)
+
+    backup = Path(result.backup_path)
+    assert backup.stat().st_ino == original_inode
+    assert (backup / "SKILL.md").read_text() == "old"
+    assert (target_dir / "SKILL.md").read_text() == "skill"
+    assert sorted(path.name for path in target_dir.parent.iterdir()) == ["skill", backup.name]
+
+
+def test_copy_skill_dir_overwrite_moves_backup_to_backup_root(tmp_path: Path) -> None:
+    source_dir = _make_source(tmp_path)
+    target_dir = tmp_path / "dest" / "skill"
+    target_dir.mkdir(parents=True)
+    (target_dir / "SKILL.md").write_text("old")
+    backup_root = tmp_path / "backups"
+
+    result = copy_skill_dir(str(source_dir), str(target_dir), yes=True, backup_root=str(backup_root))
+
+    assert Path(result.backup_path).parent == backup_root
+    assert (Path(result.backup_path) / "SKILL.md").read_text() == "old"
+    assert [path.name for path in target_dir.parent.iterdir()] == ["skill"]
+
+
+def test_copy_skill_dir_renames_into_backup_root_on_same_filesystem(tmp_path: Path) -> None:
+    source_dir = _make_source(tmp_path)
+    target_dir = tmp_path / "dest" / "skill"
+    target_dir.mkdir(parents=True)
+    original_inode = target_dir.stat().st_ino
+    backup_root = target_dir.parent / ".backups"
+
+    result = copy_skill_dir(str(source_dir), str(target_dir), yes=True, backup_root=str(backup_root))
+
+    assert Path(result.backup_path).parent == backup_root
+    assert Path(result.backup_path).stat().st_ino == original_inode
+
+
+def test_prune_backups_keeps_newest_per_skill(tmp_path: Path) -> None:
+    for name in ["pdf.backup-100", "pdf.backup-300", "pdf.backup-200", "pdf-extra.backup-50", "docx.backup-10"]:
+        (tmp_path / name).mkdir()
+
+    removed = prune_backups(str(tmp_path), "pdf", keep=2)
+
+    assert [Path(path).name for path in removed] == ["pdf.backup-100"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "docx.backup-10",
+        "pdf-extra.backup-50",
+        "pdf.backup-200",
+        "pdf.backup-300",
+    ]
+    assert prune_backups(str(tmp_path / "missing"), "pdf", keep=2) == []
+
+
+def test_copy_skill_dir_reports_files_and_bytes(tmp_path: Path) -> None:
+    source_dir = _make_source(tmp_path)
+    (source_dir / "notes.txt").write_text("12345")
+
+    copied = copy_skill_dir(str(source_dir), str(tmp_path / "copy"))
+    linked = copy_skill_dir(str(source_dir), str(tmp_path / "link"), link_mode="symlink")
+
+    assert (copied.files, copied.bytes) == (3, len("skill") + len("echo hi") + 5)
+    assert (linked.files, linked.bytes) == (0, 0)
+
+
+def test_write_text_atomic_replaces_file_and_keeps_mode(tmp_path: Path) -> None:
+    target = tmp_path / "AGENTS.md"
+    target.write_text("old\n", encoding="utf-8")
+    target.chmod(0o640)
+    inode = target.stat().st_ino
+
+    write_text_atomic(str(target), "new\n")
+
+    assert target.read_text(encoding="utf-8") == "new\n"
+    assert target.stat().st_mode & 0o777 == 0o640
+    assert target.stat().st_ino != inode
+    assert [path.name for path in tmp_path.iterdir()] == ["AGENTS.md"]
+
+
+def test_write_text_atomic_writes_through_symlink(tmp_path: Path) -> None:
+    target = tmp_path / "CLAUDE.md"
+    target.write_text("old\n", encoding="utf-8")
+    link = tmp_path / "AGENTS.md"
+    link.symlink_to("CLAUDE.md")
+
+    write_text_atomic(str(link), ["new", "\n"])
+
+    assert link.is_symlink()
+    assert target.read_text(encoding="utf-8") == "new\n"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["AGENTS.md", "CLAUDE.md"]
@@ -0,0 +1,50 @@
+import os
+from pathlib import Path
+
+from openskills.utils.install_record import (
+    INSTALL_RECORD_FILE,
+    InstalledSkill,
+    forget_installs,
+    hash_skill_tree,
+    read_install_record,
+    record_installs,
+)
+
+
+def _make_tree(root: Path) -> Path:
+    (root / "scripts").mkdir(parents=True)
+    (root / "SKILL.md").write_text("---\nname: demo\n---\n", encoding="utf-8")
+    (root / "scripts" / "run.sh").write_text("echo hi\n", encoding="utf-8")
+    return root
+
+
+def test_hash_skill_tree_depends_only_on_content(tmp_path: Path) -> None:
+    first = _make_tree(tmp_path / "first")
+    second = _make_tree(tmp_path / "second")
+    baseline = hash_skill_tree(first)
+
+    assert hash_skill_tree(second) == baseline
+
+    os.chmod(second / "scripts" / "run.sh", 0o755)
+    assert hash_skill_tree(second) != baseline
+
+    (first / "scripts" / "run.sh").write_text("echo bye\n", encoding="utf-8")
+    assert hash_skill_tree(first) != baseline
+
+
+def test_record_and_forget_installs(tmp_path: Path) -> None:
+    alpha = InstalledSkill("alpha", "https://example.com/repo", None, "skills", "abc", "h1")
+    beta = InstalledSkill("beta", "/local/skills", None, None, None, "h2")
+
+    assert read_install_record(tmp_path) == {}
+
+    record_installs(tmp_path, [alpha, beta])
+    record_installs(tmp_path, [InstalledSkill("alpha", alpha.source, None, "skills", "def", "h3")])
+
+    record = read_install_record(tmp_path)
+    assert record["alpha"].commit == "def"
+    assert record["beta"] == beta
+
+    forget_installs(tmp_path, ["alpha", "missing"])
+    assert list(read_install_record(tmp_path)) == ["beta"]
+    assert (tmp_path / INSTALL_RECORD_FILE).exists()
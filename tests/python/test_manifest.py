@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+
+from openskills.utils.manifest import (
+    LockedSource,
+    ManifestError,
+    ManifestSource,
+    find_locked_source,
+    load_manifest,
+    lockfile_path,
+    read_lockfile,
+    write_lockfile,
+)
+
+
+def test_load_manifest_parses_sources(tmp_path: Path) -> None:
+    manifest = tmp_path / "skills.toml"
+    manifest.write_text(
+        """[[sources]]
+source = "anthropics/skills"
+ref = "main"
+subpath = "/document-skills/"
+only = ["pdf", "docx"]
+
+[[sources]]
+source = "./local-skills"
+only = "a, b"
+""",
+        encoding="utf-8",
+    )
+
+    assert load_manifest(manifest) == [
+        ManifestSource("anthropics/skills", ref="main", subpath="document-skills", only=("docx", "pdf")),
+        ManifestSource("./local-skills", only=("a", "b")),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        ("", "has no"),
+        ("[[sources]]\nref = 'main'\n", "source is required"),
+        ("[[sources]]\nsource = 'a/b'\nonyl = ['x']\n", "unknown keys: onyl"),
+        ("[[sources]]\nsource = 'a/b'\nonly = [1]\n", "list of skill names"),
+        ("[[sources]\n", "Invalid manifest"),
+    ],
+)
+def test_load_manifest_rejects_malformed_entries(tmp_path: Path, content: str, message: str) -> None:
+    manifest = tmp_path / "skills.toml"
+    manifest.write_text(content, encoding="utf-8")
+
+    with pytest.raises(ManifestError, match=message):
+        load_manifest(manifest)
+
+
+def test_lockfile_round_trip(tmp_path: Path) -> None:
+    lock_path = lockfile_path(tmp_path / "skills.toml")
+    spec = ManifestSource("owner/repo", ref="v1", only=("pdf",))
+    entry = LockedSource("owner/repo", "v1", None, ("pdf",), "abc123", ("pdf",))
+
+    assert lock_path.name == "skills.lock"
+    assert read_lockfile(lock_path) == []
+
+    write_lockfile(lock_path, [entry])
+
+    locked = read_lockfile(lock_path)
+    assert locked == [entry]
+    assert find_locked_source(locked, spec) == entry
+    assert find_locked_source(locked, ManifestSource("owner/repo")) is None
@@ -4,9 +4,18 @@ import pytest
 
 from openskills.utils import (
     Skill,
+    SkillBudget,
     discover_skills,
+    has_unclosed_skills_section,
+    iter_skills_system,
+    iter_synced_agents_md,
+    locate_skills_section,
+    plan_skills_section,
+    rank_skills,
     render_skills_system,
     replace_skills_section,
+    skills_section_digest,
+    update_skills_section,
 )
 
 
@@ -89,3 +98,136 @@ def test_replace_skills_section_matches_golden() -> None:
     expected = Path("tests/python/fixtures/goldens/agents_sync_with_markers.md").read_text(encoding="utf-8")
 
     assert updated == expected
+
+
+def test_update_skills_section_records_digest_and_detects_no_change() -> None:
+    skills = _sample_skills()
+    content = "# Agents\n"
+
+    updated, changed = update_skills_section(content, skills)
+    digest = skills_section_digest(render_skills_system(skills))
+    assert changed
+    marker = f"<!-- openskills:skills-sha256={digest} -->\n"
+    assert f"{marker}<skills_system" in updated
+    assert updated.replace(marker, "") == replace_skills_section(content, skills)
+
+    assert update_skills_section(updated, skills) == (updated, False)
+
+    resynced, changed = update_skills_section(updated, skills[:1])
+    assert changed
+    assert resynced.count("openskills:skills-sha256") == 1
+    assert "<name>beta</name>" not in resynced
+
+    hand_edited = updated.replace("First skill description", "Edited by hand")
+    assert update_skills_section(hand_edited, skills) == (updated, True)
+
+
+def test_locate_skills_section_reports_offsets_names_and_digest() -> None:
+    skills = _sample_skills()
+    synced, _ = update_skills_section("# Intro\n\nBody text\n", skills)
+    content = f"{synced}\n## Footer\n"
+
+    section = locate_skills_section(content)
+
+    assert section is not None
+    assert section.kind == "system"
+    assert content[section.start : section.end] == render_skills_system(skills)
+    assert content[section.marker_start : section.start].startswith("<!-- openskills:skills-sha256=")
+    assert section.digest == skills_section_digest(render_skills_system(skills))
+    assert section.names == ("alpha", "beta")
+
+    assert locate_skills_section("# No section\n") is None
+    unclosed = "<skills_system>\nnever closed\n"
+    assert locate_skills_section(unclosed) is None
+    assert replace_skills_section(unclosed, skills) == unclosed
+    assert has_unclosed_skills_section(unclosed)
+    assert not has_unclosed_skills_section(content)
+    assert not has_unclosed_skills_section("# No section\n")
+
+
+def test_replace_skills_section_keeps_backslashes_literal() -> None:
+    skills = [
+        Skill(
+            name="regex",
+            description=r"Matches \d+ and \1 groups",
+            location="project",
+            base_dir=Path("/p/regex"),
+            skill_path=Path("/p/regex/SKILL.md"),
+        )
+    ]
+    content = '<skills_system priority="1">\nold\n</skills_system>\n'
+
+    updated = replace_skills_section(content, skills)
+
+    assert r"<description>Matches \d+ and \1 groups</description>" in updated
+
+
+def test_iter_skills_system_streams_the_rendered_section() -> None:
+    skills = _sample_skills()
+
+    chunks = list(iter_skills_system(iter(skills)))
+
+    assert len(chunks) > len(skills)
+    assert "".join(chunks) == render_skills_system(skills)
+
+
+def test_iter_synced_agents_md_is_idempotent_for_table_markers() -> None:
+    skills = _sample_skills()
+    content = Path("tests/python/fixtures/agents_with_markers.md").read_text(encoding="utf-8")
+
+    chunks = iter_synced_agents_md(content, iter(skills))
+    assert chunks is not None
+    synced = "".join(chunks)
+    assert synced.endswith("\n\nFooter text.\n")
+
+    assert iter_synced_agents_md(synced, skills) is None
+    resynced = "".join(iter_synced_agents_md(synced, skills[:1]) or [])
+    assert resynced.count("<!-- SKILLS_TABLE_END -->") == 2
+    assert "<name>beta</name>" not in resynced
+
+
+def _catalog(count: int) -> list[Skill]:
+    return [
+        Skill(
+            name=f"skill-{i:03d}",
+            description=f"Handles task {i} " + "with a rather long explanation " * 10,
+            location="project" if i % 10 == 0 else "global",
+            base_dir=Path(f"/skills/skill-{i:03d}"),
+            skill_path=Path(f"/skills/skill-{i:03d}/SKILL.md"),
+        )
+        for i in range(count)
+    ]
+
+
+def test_rank_skills_orders_by_location_usage_then_name() -> None:
+    skills = _catalog(12)
+
+    ranked = rank_skills(skills, usage={"skill-003": 5, "skill-007": 9})
+
+    assert [skill.name for skill in ranked[:4]] == ["skill-000", "skill-010", "skill-007", "skill-003"]
+    assert [skill.name for skill in rank_skills(skills, priority=("name",))] == sorted(s.name for s in skills)
+    with pytest.raises(ValueError):
+        rank_skills(skills, priority=("size",))
+
+
+@pytest.mark.parametrize("max_bytes", [1500, 4000, 20000])
+def test_plan_skills_section_stays_within_budget(max_bytes: int) -> None:
+    plan = plan_skills_section(_catalog(200), SkillBudget(max_bytes=max_bytes))
+
+    rendered = "".join(iter_skills_system(plan.skills, overflow=plan.overflow))
+    assert plan.size_bytes == len(rendered.encode("utf-8")) <= max_bytes
+    assert plan.collapsed == 200 - len(plan.skills)
+    assert f'<more_skills count="{plan.collapsed}">' in rendered
+    assert all(len(skill.description) <= 160 for skill in plan.skills)
+
+
+def test_plan_skills_section_keeps_everything_when_it_fits() -> None:
+    skills = _sample_skills()
+
+    unbudgeted = plan_skills_section(skills)
+    roomy = plan_skills_section(skills, SkillBudget(max_tokens=10_000))
+
+    assert unbudgeted.skills == tuple(skills) and unbudgeted.overflow is None
+    assert unbudgeted.size_bytes == len(render_skills_system(skills).encode("utf-8"))
+    assert roomy.collapsed == roomy.truncated == 0
+    assert render_skills_system(skills, budget=SkillBudget(max_tokens=10_000)) == render_skills_system(skills)
@@ -2,10 +2,13 @@ import os
 import re
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from collections.abc import Callable, Sequence
 
-from openskills.utils.repo_service import prepare_skill_working_copy
+import pytest
+
+from openskills.utils.repo_service import _run_git, prepare_skill_working_copy, remote_head, sync_mirror
 
 GitRunner = Callable[[Sequence[str], str | None], str]
 
@@ -101,3 +104,189 @@ def test_prepare_skill_working_copy_accepts_non_git_local_source(tmp_path: Path)
     working_copy.cleanup()
     assert not Path(working_copy.path).exists()
 
+
+_GIT_ENV = {
+    **os.environ,
+    "GIT_AUTHOR_NAME": "Test User",
+    "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "Test User",
+    "GIT_COMMITTER_EMAIL": "test@example.com",
+}
+
+
+def _commit_file(repo_dir: Path, name: str, content: str) -> str:
+    (repo_dir / name).write_text(content, encoding="utf-8")
+    subprocess.run(["git", "add", "."], cwd=repo_dir, check=True, env=_GIT_ENV)
+    subprocess.run(["git", "commit", "-q", "-m", name], cwd=repo_dir, check=True, env=_GIT_ENV)
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=repo_dir, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def _recording_runner(calls: list[list[str]]) -> GitRunner:
+    def _runner(args: Sequence[str], cwd: str | None = None) -> str:
+        calls.append(list(args))
+        return _run_git(args, cwd)
+
+    return _runner
+
+
+def test_prepare_skill_working_copy_reuses_bare_mirror(tmp_path: Path) -> None:
+    upstream = tmp_path / "upstream"
+    upstream.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=upstream, check=True)
+    first_commit = _commit_file(upstream, "SKILL.md", "v1")
+    source = upstream.as_uri()
+    mirror_cache = tmp_path / "mirrors"
+    calls: list[list[str]] = []
+    runner = _recording_runner(calls)
+
+    first = prepare_skill_working_copy(source, temp_root=str(tmp_path), git_runner=runner, mirror_cache=mirror_cache)
+    assert first.commit == first_commit
+    assert (Path(first.path) / "SKILL.md").read_text(encoding="utf-8") == "v1"
+    first.cleanup()
+
+    second_commit = _commit_file(upstream, "SKILL.md", "v2")
+    second = prepare_skill_working_copy(source, temp_root=str(tmp_path), git_runner=runner, mirror_cache=mirror_cache)
+    assert second.commit == second_commit
+    assert (Path(second.path) / "SKILL.md").read_text(encoding="utf-8") == "v2"
+    second.cleanup()
+
+    assert [call[:3] for call in calls if call[0] == "clone" and "--bare" in call] == [["clone", "--quiet", "--bare"]]
+    assert ["fetch", "--quiet", "--prune", "origin"] in [call[:4] for call in calls]
+    assert len(list(mirror_cache.glob("*.git"))) == 1
+
+
+def test_sync_mirror_fetches_only_branches_and_tags(tmp_path: Path) -> None:
+    upstream = tmp_path / "upstream"
+    upstream.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=upstream, check=True)
+    head = _commit_file(upstream, "SKILL.md", "v1")
+    subprocess.run(["git", "tag", "v1"], cwd=upstream, check=True)
+    subprocess.run(["git", "update-ref", "refs/pull/1/head", head], cwd=upstream, check=True)
+
+    def _refs(mirror: Path) -> list[str]:
+        listing = _run_git(["for-each-ref", "--format=%(refname)"], str(mirror))
+        return sorted(line for line in listing.splitlines() if not line.startswith("refs/heads/"))
+
+    mirror = sync_mirror(upstream.as_uri(), tmp_path / "mirrors")
+    assert _refs(mirror) == ["refs/tags/v1"]
+
+    subprocess.run(["git", "update-ref", "refs/pull/2/head", head], cwd=upstream, check=True)
+    subprocess.run(["git", "tag", "v2"], cwd=upstream, check=True)
+    assert sync_mirror(upstream.as_uri(), tmp_path / "mirrors") == mirror
+    assert _refs(mirror) == ["refs/tags/v1", "refs/tags/v2"]
+
+
+def test_sync_mirror_serializes_threads_on_one_mirror(tmp_path: Path) -> None:
+    upstream = tmp_path / "upstream"
+    upstream.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=upstream, check=True)
+    _commit_file(upstream, "SKILL.md", "v1")
+    mirror_cache = tmp_path / "mirrors"
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        mirrors = list(pool.map(lambda _: sync_mirror(upstream.as_uri(), mirror_cache), range(4)))
+
+    assert len(set(mirrors)) == 1
+    assert (mirrors[0] / "HEAD").exists()
+    assert [path.name for path in mirror_cache.iterdir()] == [mirrors[0].name]
+
+
+def _skills_monorepo(tmp_path: Path) -> Path:
+    upstream = tmp_path / "monorepo"
+    for name in ["pdf", "docx", "xlsx"]:
+        (upstream / "skills" / name).mkdir(parents=True)
+        (upstream / "skills" / name / "SKILL.md").write_text(f"---\nname: {name}\n---\n", encoding="utf-8")
+    (upstream / "assets").mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=upstream, check=True)
+    subprocess.run(["git", "config", "uploadpack.allowFilter", "true"], cwd=upstream, check=True)
+    _commit_file(upstream, "README.md", "readme")
+    return upstream
+
+
+def _materialized(working_path: str) -> list[str]:
+    root = Path(working_path)
+    return sorted(str(path.relative_to(root)) for path in root.rglob("SKILL.md") if ".git" not in path.parts)
+
+
+def test_prepare_skill_working_copy_sparse_subpath(tmp_path: Path) -> None:
+    upstream = _skills_monorepo(tmp_path)
+    calls: list[list[str]] = []
+
+    working = prepare_skill_working_copy(
+        f"{upstream.as_uri()}#skills/pdf",
+        temp_root=str(tmp_path),
+        git_runner=_recording_runner(calls),
+    )
+
+    assert "--filter=blob:none" in calls[0]
+    assert working.source == upstream.as_uri()
+    assert working.skill_root == Path(working.path) / "skills/pdf"
+    assert _materialized(working.path) == ["skills/pdf/SKILL.md"]
+    working.cleanup()
+
+
+def test_prepare_skill_working_copy_sparse_only_skips_mirror(tmp_path: Path) -> None:
+    upstream = _skills_monorepo(tmp_path)
+    calls: list[list[str]] = []
+
+    working = prepare_skill_working_copy(
+        upstream.as_uri(),
+        temp_root=str(tmp_path),
+        git_runner=_recording_runner(calls),
+        mirror_cache=tmp_path / "mirrors",
+        only=["docx", "xlsx"],
+    )
+
+    assert _materialized(working.path) == ["skills/docx/SKILL.md", "skills/xlsx/SKILL.md"]
+    assert not any("--mirror" in call for call in calls)
+    assert "--filter=blob:none" in calls[0]
+    assert not (tmp_path / "mirrors").exists()
+    working.cleanup()
+
+
+def test_prepare_skill_working_copy_sparse_only_without_match(tmp_path: Path) -> None:
+    upstream = _skills_monorepo(tmp_path)
+    temp_root = tmp_path / "work"
+    temp_root.mkdir()
+
+    with pytest.raises(ValueError, match="No skills named missing"):
+        prepare_skill_working_copy(upstream.as_uri(), temp_root=str(temp_root), only=["missing"])
+
+    assert list(temp_root.iterdir()) == []
+
+
+def test_prepare_skill_working_copy_in_place_for_local_source(tmp_path: Path) -> None:
+    source_dir = tmp_path / "local_skills"
+    (source_dir / "skills" / "pdf").mkdir(parents=True)
+    (source_dir / "skills" / "pdf" / "SKILL.md").write_text("metadata", encoding="utf-8")
+
+    working_copy = prepare_skill_working_copy(f"{source_dir}#skills", temp_root=str(tmp_path), in_place=True)
+
+    assert working_copy.in_place
+    assert Path(working_copy.path) == source_dir
+    assert working_copy.skill_root == source_dir / "skills"
+    assert working_copy.commit is None
+
+    working_copy.cleanup()
+    assert (source_dir / "skills" / "pdf" / "SKILL.md").exists()
+
+
+def test_remote_head_and_ref_checkout(tmp_path: Path) -> None:
+    upstream = tmp_path / "upstream"
+    upstream.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=upstream, check=True)
+    tagged = _commit_file(upstream, "SKILL.md", "v1")
+    subprocess.run(["git", "tag", "-a", "v1", "-m", "v1"], cwd=upstream, check=True, env=_GIT_ENV)
+    latest = _commit_file(upstream, "SKILL.md", "v2")
+    source = upstream.as_uri()
+
+    assert remote_head(source) == latest
+    assert remote_head(source, "v1") == tagged
+    assert remote_head(str(tmp_path / "not-a-repo")) is None
+
+    working = prepare_skill_working_copy(source, temp_root=str(tmp_path), ref="v1", mirror_cache=tmp_path / "mirrors")
+    assert working.commit == tagged
+    assert (Path(working.path) / "SKILL.md").read_text(encoding="utf-8") == "v1"
+    working.cleanup()
@@ -0,0 +1,131 @@
+from pathlib import Path
+
+import pytest
+
+from openskills.utils import SkillIndex, discover_skills, find_skill, iter_skills
+from openskills.utils import skill_index as skill_index_module
+
+
+def _write_skill(root: Path, name: str, description: str) -> Path:
+    skill_dir = root / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text(f"---\nname: {name}\ndescription: {description}\n---\n\n# {name}\n", encoding="utf-8")
+    return skill_md
+
+
+@pytest.fixture()
+def read_counter(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    reads: list[str] = []
+    real_read = skill_index_module._read_description
+
+    def _counting_read(skill_md: str) -> str:
+        reads.append(Path(skill_md).parent.name)
+        return real_read(skill_md)
+
+    monkeypatch.setattr(skill_index_module, "_read_description", _counting_read)
+    return reads
+
+
+def test_index_persists_and_skips_unchanged_reads(tmp_path: Path, read_counter: list[str]) -> None:
+    root = tmp_path / "skills"
+    _write_skill(root, "alpha", "Alpha description")
+    _write_skill(root, "beta", "Beta description")
+    cache_dir = tmp_path / "cache"
+
+    first = SkillIndex(cache_dir)
+    assert [entry.name for entry in first.scan(root)] == ["alpha", "beta"]
+    first.save()
+    assert read_counter == ["alpha", "beta"]
+
+    second = SkillIndex(cache_dir)
+    entries = second.scan(root)
+
+    assert [entry.description for entry in entries] == ["Alpha description", "Beta description"]
+    assert read_counter == ["alpha", "beta"]
+
+
+def test_index_rereads_only_changed_entries(tmp_path: Path, read_counter: list[str]) -> None:
+    root = tmp_path / "skills"
+    _write_skill(root, "alpha", "Alpha description")
+    beta_md = _write_skill(root, "beta", "Beta description")
+    cache_dir = tmp_path / "cache"
+
+    index = SkillIndex(cache_dir)
+    index.scan(root)
+    index.save()
+    read_counter.clear()
+
+    beta_md.write_text("---\nname: beta\ndescription: Beta, revised and longer\n---\n", encoding="utf-8")
+    _write_skill(root, "gamma", "Gamma description")
+    (root / "not-a-skill").mkdir()
+
+    entries = SkillIndex(cache_dir).scan(root)
+
+    assert [entry.name for entry in entries] == ["alpha", "beta", "gamma"]
+    assert entries[1].description == "Beta, revised and longer"
+    assert sorted(read_counter) == ["beta", "gamma"]
+
+
+def test_index_drops_removed_skills(tmp_path: Path) -> None:
+    root = tmp_path / "skills"
+    _write_skill(root, "alpha", "Alpha description")
+    gone = _write_skill(root, "gone", "Removed soon")
+    cache_dir = tmp_path / "cache"
+
+    index = SkillIndex(cache_dir)
+    index.scan(root)
+    index.save()
+
+    gone.unlink()
+    gone.parent.rmdir()
+
+    assert [entry.name for entry in SkillIndex(cache_dir).scan(root)] == ["alpha"]
+
+
+def test_discover_and_find_share_default_index(tmp_path: Path, read_counter: list[str]) -> None:
+    project = tmp_path / "project"
+    home = tmp_path / "home"
+    project.mkdir()
+    _write_skill(project / ".agent/skills", "alpha", "Alpha description")
+
+    first = discover_skills(cwd=project, home=home)
+    assert [skill.name for skill in first] == ["alpha"]
+    assert list((home / ".cache/openskills/index").glob("*.json"))
+
+    read_counter.clear()
+    second = discover_skills(cwd=project, home=home)
+    assert second == first
+    assert read_counter == []
+
+    found = find_skill("alpha", cwd=project, home=home)
+    assert found is not None
+    assert found.description == "Alpha description"
+    assert find_skill("missing", cwd=project, home=home) is None
+
+
+def test_parallel_scan_matches_serial_scan(tmp_path: Path) -> None:
+    root = tmp_path / "skills"
+    for i in range(25):
+        _write_skill(root, f"skill-{i:02d}", f"Description {i}")
+    (root / "empty-dir").mkdir()
+
+    serial = SkillIndex(None, jobs=1).scan(root)
+    parallel = SkillIndex(None, jobs=8).scan(root)
+
+    assert parallel == serial
+    assert [entry.name for entry in parallel] == [f"skill-{i:02d}" for i in range(25)]
+
+
+def test_undescribed_scan_only_stats_skill_files(tmp_path: Path, read_counter: list[str]) -> None:
+    project = tmp_path / "project"
+    root = project / ".claude/skills"
+    _write_skill(root, "alpha", "Alpha description")
+    _write_skill(root, "beta", "Beta description")
+    index = SkillIndex(tmp_path / "cache")
+
+    names = [skill.name for skill in iter_skills(cwd=project, home=tmp_path / "home", index=index, describe=False)]
+
+    assert names == ["alpha", "beta"]
+    assert read_counter == []
+    assert [entry.description for entry in index.scan(root)] == ["Alpha description", "Beta description"]
@@ -0,0 +1,95 @@
+from pathlib import Path
+
+import pytest
+
+from openskills.utils import SkillIndex, SkillResolver, SkillTable, discover_skill_table, discover_skills
+from openskills.utils import skills as skills_module
+
+
+def _write_skill(root: Path, name: str, description: str) -> None:
+    skill_dir = root / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    skill_dir.joinpath("SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: {description}\n---\n",
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture()
+def roots(tmp_path: Path) -> tuple[Path, Path]:
+    project = tmp_path / "project"
+    home = tmp_path / "home"
+    _write_skill(project / ".agent/skills", "shared", "Project copy")
+    _write_skill(home / ".claude/skills", "shared", "Global copy")
+    _write_skill(home / ".agent/skills", "solo", "Only global")
+    return project, home
+
+
+@pytest.fixture()
+def probe_counter(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    probes: list[str] = []
+    real_find = skills_module.find_skill
+
+    def _counting_find(skill_name: str, **kwargs):
+        probes.append(skill_name)
+        return real_find(skill_name, **kwargs)
+
+    monkeypatch.setattr(skills_module, "find_skill", _counting_find)
+    return probes
+
+
+def test_find_honors_priority_and_caches_misses(roots, probe_counter) -> None:
+    project, home = roots
+    resolver = SkillResolver(cwd=project, home=home, index=SkillIndex(None))
+
+    skill = resolver.find("shared")
+    assert skill is not None
+    assert skill.description == "Project copy"
+    assert skill.location == "project"
+
+    assert resolver.find("missing") is None
+    assert resolver.find("missing") is None
+    assert resolver.find("shared") is skill
+    assert probe_counter == ["shared", "missing"]
+
+
+def test_find_after_all_does_not_probe(roots, probe_counter) -> None:
+    project, home = roots
+    resolver = SkillResolver(cwd=project, home=home, index=SkillIndex(None))
+
+    assert [skill.name for skill in resolver.all()] == ["shared", "solo"]
+    assert resolver.find("solo") is not None
+    assert resolver.find("missing") is None
+    assert probe_counter == []
+
+
+def test_forget_surfaces_lower_priority_copy(roots) -> None:
+    project, home = roots
+    resolver = SkillResolver(cwd=project, home=home, index=SkillIndex(None))
+    resolver.all()
+
+    shared = resolver.find("shared")
+    assert shared is not None
+    for path in shared.base_dir.iterdir():
+        path.unlink()
+    shared.base_dir.rmdir()
+    resolver.forget("shared")
+
+    fallback = resolver.find("shared")
+    assert fallback is not None
+    assert fallback.description == "Global copy"
+    assert [skill.location for skill in resolver.all()] == ["global", "global"]
+
+
+def test_skill_table_matches_discover_skills(roots: tuple[Path, Path]) -> None:
+    project, home = roots
+
+    skills = discover_skills(cwd=project, home=home, index=SkillIndex(None))
+    table = discover_skill_table(cwd=project, home=home, index=SkillIndex(None))
+
+    assert list(table) == skills
+    assert SkillTable.from_skills(skills)[0] == skills[0]
+    assert "solo" in table and "missing" not in table
+    assert table.find("shared").description == "Project copy"
+    assert [row[3] for row in table.rows()] == [str(skill.base_dir) for skill in skills]
+    assert not hasattr(skills[0], "__dict__")
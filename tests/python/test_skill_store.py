@@ -0,0 +1,57 @@
+import shutil
+from pathlib import Path
+
+from openskills.utils import copy_skill_dir
+from openskills.utils.skill_store import SkillStore
+
+
+def _make_skill(root: Path, body: str = "skill") -> Path:
+    (root / "scripts").mkdir(parents=True)
+    (root / "SKILL.md").write_text(body, encoding="utf-8")
+    (root / "scripts" / "run.sh").write_text("echo hi", encoding="utf-8")
+    return root
+
+
+def _link_from_store(store: SkillStore, source: Path, target: Path, link_mode: str = "hardlink") -> str:
+    digest = store.add(source)
+    copy_skill_dir(str(store.object_path(digest)), str(target), link_mode=link_mode)
+    store.add_ref(digest, target)
+    return digest
+
+
+def test_store_keeps_one_read_only_copy_per_tree(tmp_path: Path) -> None:
+    store = SkillStore(tmp_path / "store")
+    first = store.add(_make_skill(tmp_path / "a"))
+    second = store.add(_make_skill(tmp_path / "b"))
+    other = store.add(_make_skill(tmp_path / "c", body="different"))
+
+    assert first == second != other
+    assert sorted(path.name for path in store.objects_dir.iterdir()) == sorted([first, other])
+    assert not (store.object_path(first) / "SKILL.md").stat().st_mode & 0o222
+
+
+def test_gc_removes_only_unreferenced_trees(tmp_path: Path) -> None:
+    store = SkillStore(tmp_path / "store")
+    hard_target = tmp_path / "project/.agent/skills/demo"
+    sym_target = tmp_path / "home/.agent/skills/demo"
+    digest = _link_from_store(store, _make_skill(tmp_path / "src"), hard_target)
+    _link_from_store(store, tmp_path / "src", sym_target, link_mode="symlink")
+    orphan = _link_from_store(store, _make_skill(tmp_path / "old", body="old"), tmp_path / "gone")
+
+    assert (hard_target / "SKILL.md").stat().st_ino == (store.object_path(digest) / "SKILL.md").stat().st_ino
+    shutil.rmtree(tmp_path / "gone")
+
+    preview = store.gc(dry_run=True)
+    assert preview.removed == (orphan,)
+    assert store.object_path(orphan).exists()
+
+    result = store.gc()
+    assert result.removed == (orphan,)
+    assert result.freed_bytes == len("old") + len("echo hi")
+    assert result.kept == 1
+    assert not store.object_path(orphan).exists()
+
+    shutil.rmtree(hard_target)
+    assert store.gc().removed == ()
+    sym_target.unlink()
+    assert store.gc().removed == (digest,)
@@ -5,9 +5,11 @@ import pytest
 
 from openskills.utils import (
     SkillDocument,
+    SkillDocumentCache,
     SkillMetadata,
     SkillValidationError,
     load_skill_document,
+    load_skill_metadata,
 )
 
 
@@ -69,3 +71,73 @@ def test_missing_required_fields() -> None:
         load_skill_document(invalid_path)
 
 
+def test_load_skill_metadata_skips_body(tmp_path: Path) -> None:
+    skill_md = tmp_path / "SKILL.md"
+    skill_md.write_bytes(b"---\nname: meta-only\ndescription: Header only\n---\n\xff\xfe body")
+
+    metadata = load_skill_metadata(skill_md)
+
+    assert metadata == SkillMetadata(name="meta-only", description="Header only")
+
+
+def test_load_skill_metadata_lenient_returns_none() -> None:
+    invalid_path = FIXTURES / "invalid_no_frontmatter" / "SKILL.md"
+
+    with warnings.catch_warnings(record=True) as caught:
+        result = load_skill_metadata(invalid_path, strict=False)
+
+    assert result is None
+    assert any("frontmatter" in str(w.message) for w in caught)
+
+
+def _write_skill(path: Path, description: str, body: str = "Body") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\nname: cached\ndescription: {description}\n---\n\n{body}\n", encoding="utf-8")
+    return path
+
+
+def test_document_cache_hits_until_file_changes(tmp_path: Path) -> None:
+    skill_path = _write_skill(tmp_path / "cached" / "SKILL.md", "First")
+    cache = SkillDocumentCache()
+
+    first = cache.document(skill_path)
+    assert cache.document(skill_path) is first
+    assert cache.metadata(skill_path) is first.metadata
+    assert (cache.stats().hits, cache.stats().misses) == (2, 1)
+
+    _write_skill(skill_path, "Second, and longer")
+    assert cache.document(skill_path).metadata.description == "Second, and longer"
+    assert cache.stats().misses == 2
+
+    assert cache.invalidate(skill_path) == 1
+    cache.document(skill_path)
+    assert cache.stats().misses == 3
+
+    skill_path.unlink()
+    with pytest.raises(SkillValidationError):
+        cache.document(skill_path)
+
+
+def test_document_cache_evicts_least_recently_used_within_byte_cap(tmp_path: Path) -> None:
+    paths = [_write_skill(tmp_path / f"s{i}" / "SKILL.md", "Sized", "x" * 2000) for i in range(3)]
+    cache = SkillDocumentCache(max_bytes=6000)
+
+    cache.document(paths[0])
+    cache.document(paths[1])
+    cache.document(paths[0])
+    cache.document(paths[2])
+
+    stats = cache.stats()
+    assert stats.entries == 2
+    assert stats.evictions == 1
+    assert stats.size_bytes <= stats.max_bytes
+    cache.document(paths[0])
+    assert cache.stats().hits == 2
+
+
+def test_load_skill_document_can_bypass_cache(tmp_path: Path) -> None:
+    skill_path = _write_skill(tmp_path / "cached" / "SKILL.md", "Fresh")
+
+    cached = load_skill_document(skill_path)
+    assert load_skill_document(skill_path) is cached
+    assert load_skill_document(skill_path, use_cache=False) is not cached
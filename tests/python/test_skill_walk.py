@@ -0,0 +1,80 @@
+from pathlib import Path
+
+from openskills.utils.skill_walk import find_agents_md_files, find_skill_dirs
+
+
+def _skill(path: Path) -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "SKILL.md").write_text("---\nname: x\ndescription: y\n---\n", encoding="utf-8")
+    return path
+
+
+def test_find_skill_dirs_prunes_default_and_hidden_dirs(tmp_path: Path) -> None:
+    alpha = _skill(tmp_path / "skills/alpha")
+    beta = _skill(tmp_path / "skills/beta")
+    _skill(tmp_path / ".git/objects/hidden")
+    _skill(tmp_path / "node_modules/pkg")
+    _skill(tmp_path / ".github/skill")
+
+    assert find_skill_dirs(tmp_path) == [alpha, beta]
+
+
+def test_find_skill_dirs_keeps_skills_named_like_build_outputs(tmp_path: Path) -> None:
+    build = _skill(tmp_path / "skills/build")
+    packaged = _skill(tmp_path / "dist/skills/pdf")
+    _skill(tmp_path / "out/scratch")
+    (tmp_path / ".skillignore").write_text("out\n", encoding="utf-8")
+
+    assert find_skill_dirs(tmp_path) == [packaged, build]
+
+
+def test_find_skill_dirs_stops_below_a_skill(tmp_path: Path) -> None:
+    outer = _skill(tmp_path / "outer")
+    _skill(outer / "examples/inner")
+
+    assert find_skill_dirs(tmp_path) == [outer]
+    assert find_skill_dirs(outer) == [outer]
+
+
+def test_find_skill_dirs_honors_skillignore(tmp_path: Path) -> None:
+    keep = _skill(tmp_path / "skills/keep")
+    _skill(tmp_path / "skills/drafts/wip")
+    _skill(tmp_path / "archive/old")
+    _skill(tmp_path / "skills/tmp-scratch")
+    (tmp_path / ".skillignore").write_text(
+        "# not ready\n/archive\nskills/drafts/\ntmp-*\n",
+        encoding="utf-8",
+    )
+
+    assert find_skill_dirs(tmp_path) == [keep]
+
+
+def test_find_skill_dirs_respects_max_depth(tmp_path: Path) -> None:
+    shallow = _skill(tmp_path / "shallow")
+    _skill(tmp_path / "a/b/deep")
+
+    assert find_skill_dirs(tmp_path, max_depth=1) == [shallow]
+    assert len(find_skill_dirs(tmp_path)) == 2
+
+
+def test_find_agents_md_files_reports_nested_workspaces(tmp_path: Path) -> None:
+    for rel in [
+        "AGENTS.md",
+        "services/a/AGENTS.md",
+        "services/b/nested/AGENTS.md",
+        "node_modules/x/AGENTS.md",
+        "dist/AGENTS.md",
+    ]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("# Agents\n", encoding="utf-8")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git/AGENTS.md").write_text("", encoding="utf-8")
+
+    found = find_agents_md_files(tmp_path)
+
+    assert [path.relative_to(tmp_path).as_posix() for path in found] == [
+        "AGENTS.md",
+        "services/a/AGENTS.md",
+        "services/b/nested/AGENTS.md",
+    ]
@@ -0,0 +1,84 @@
+import ast
+import os
+import subprocess
+import sys
+from importlib import import_module
+from pathlib import Path
+
+from click.testing import CliRunner
+
+import openskills.utils
+from openskills.cli import cli
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Install-only dependencies that must stay off the read/list path.
+INSTALL_ONLY_MODULES = {
+    "click",
+    "yaml",
+    "subprocess",
+    "shutil",
+    "tempfile",
+    "tomllib",
+    "openskills.operations",
+    "openskills.cli_commands",
+    "openskills.utils.repo_service",
+    "openskills.utils.fs_ops",
+    "openskills.utils.skill_validation",
+}
+
+
+def _imported_modules(argv: list[str], cwd: Path, home: Path) -> tuple[str, set[str]]:
+    code = (
+        "import sys\n"
+        "from openskills.client import main\n"
+        f"main({argv!r})\n"
+        "sys.stderr.write('\\n'.join(sorted(sys.modules)))\n"
+    )
+    env = {**os.environ, "HOME": str(home), "PYTHONPATH": str(REPO_ROOT), "OPENSKILLS_NO_DAEMON": "1"}
+    completed = subprocess.run(
+        [sys.executable, "-c", code], cwd=cwd, env=env, capture_output=True, text=True, check=True
+    )
+    return completed.stdout, set(completed.stderr.splitlines())
+
+
+def test_read_and_list_import_only_discovery_code(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    home = tmp_path / "home"
+    skill_dir = project / ".agent/skills/alpha"
+    skill_dir.mkdir(parents=True)
+    home.mkdir()
+    (skill_dir / "SKILL.md").write_text("---\nname: alpha\ndescription: Alpha skill\n---\n\nBody\n", encoding="utf-8")
+
+    out, modules = _imported_modules(["read", "alpha"], project, home)
+    assert "Skill read: alpha" in out
+    assert not modules & INSTALL_ONLY_MODULES
+
+    out, modules = _imported_modules(["list"], project, home)
+    assert "alpha" in out
+    assert not modules & INSTALL_ONLY_MODULES
+
+
+def test_lazy_commands_are_listed_and_resolved() -> None:
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--help"])
+
+    assert result.exit_code == 0
+    for name in ("install", "update", "sync", "remove", "manage", "gc", "daemon", "list", "read"):
+        assert f"  {name}" in result.output
+    assert runner.invoke(cli, ["install", "--help"]).exit_code == 0
+
+
+def test_utils_lazy_exports_match_type_checking_imports() -> None:
+    tree = ast.parse(Path(openskills.utils.__file__).read_text(encoding="utf-8"))
+    guarded = next(node for node in tree.body if isinstance(node, ast.If) and ast.unparse(node.test) == "TYPE_CHECKING")
+    imported = {
+        node.module: tuple(alias.name for alias in node.names)
+        for node in guarded.body
+        if isinstance(node, ast.ImportFrom) and node.module
+    }
+
+    assert imported == openskills.utils._SUBMODULE_EXPORTS
+    for module, names in imported.items():
+        submodule = import_module(f"openskills.utils.{module}")
+        assert all(hasattr(submodule, name) for name in names), module
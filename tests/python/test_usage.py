@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from openskills.utils import read_usage_counts, record_skill_read
+from openskills.utils import usage as usage_module
+
+
+def test_record_and_read_usage_counts(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("OPENSKILLS_CACHE_DIR", str(tmp_path / "cache"))
+
+    assert read_usage_counts() == {}
+    for name in ["pdf", "docx", "pdf"]:
+        record_skill_read(name)
+
+    assert read_usage_counts() == {"pdf": 2, "docx": 1}
+
+
+def test_usage_log_is_compacted_when_large(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("OPENSKILLS_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(usage_module, "COMPACT_BYTES", 16)
+    for _ in range(10):
+        record_skill_read("pdf")
+
+    assert read_usage_counts() == {"pdf": 10}
+    assert (tmp_path / "cache/usage.log").read_text(encoding="utf-8") == "pdf\t10\n"
+    record_skill_read("pdf")
+    assert read_usage_counts() == {"pdf": 11}
+
+
+def test_usage_recording_can_be_disabled(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("OPENSKILLS_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("OPENSKILLS_NO_USAGE", "1")
+
+    record_skill_read("pdf")
+
+    assert not (tmp_path / "cache/usage.log").exists()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import os
 import subprocess
 from pathlib import Path
@@ -7,6 +8,7 @@ from pathlib import Path
 from click.testing import CliRunner
 
 from openskills.cli import cli
+from openskills.utils import locate_skills_section
 
 
 def _write_skill(path: Path, name: str, description: str, body: str = "") -> None:
@@ -120,3 +122,353 @@ def test_manage_and_remove(monkeypatch) -> None:
         missing_result = runner.invoke(cli, ["remove", "missing"], env=env)
         assert missing_result.exit_code != 0
         assert "Skill 'missing' not found" in missing_result.output
+
+
+def test_install_only_selected_skill(monkeypatch) -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem() as tmp:
+        tmp_path = Path(tmp)
+        env = {"HOME": str(tmp_path / "home")}
+        repo = _create_git_repo(tmp_path)
+
+        result = runner.invoke(cli, ["install", f"{repo}#nested", "--only", "skill-two", "--yes"], env=env)
+        assert result.exit_code == 0, result.output
+
+        assert (tmp_path / ".agent/skills/skill-two/SKILL.md").exists()
+        assert not (tmp_path / ".agent/skills/skill-one").exists()
+
+
+def test_parallel_install_reports_in_order_with_totals() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem() as tmp:
+        tmp_path = Path(tmp)
+        env = {"HOME": str(tmp_path / "home")}
+        source = tmp_path / "many"
+        names = [f"skill-{i:02d}" for i in range(12)]
+        for name in names:
+            _write_skill(source, name, f"{name} description")
+
+        result = runner.invoke(cli, ["install", str(source), "--yes", "--jobs", "4"], env=env)
+        assert result.exit_code == 0, result.output
+
+        installed = [line.split()[1] for line in result.output.splitlines() if line.startswith("Installed ")]
+        assert installed == names
+        assert "Copied 12 files (" in result.output
+        assert all((tmp_path / ".agent/skills" / name / "SKILL.md").exists() for name in names)
+
+
+def test_install_from_manifest_skips_unchanged_sources() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem() as tmp:
+        tmp_path = Path(tmp)
+        env = {"HOME": str(tmp_path / "home")}
+        repo = _create_git_repo(tmp_path)
+        plain = tmp_path / "plain"
+        _write_skill(plain, "skill-three", "Skill three description")
+        manifest = tmp_path / "skills.toml"
+        manifest.write_text(
+            f'[[sources]]\nsource = "{repo}"\nonly = ["skill-two"]\n\n[[sources]]\nsource = "{plain}"\n',
+            encoding="utf-8",
+        )
+
+        first = runner.invoke(cli, ["install", "-f", str(manifest), "--yes"], env=env)
+        assert first.exit_code == 0, first.output
+        assert (tmp_path / ".agent/skills/skill-two/SKILL.md").exists()
+        assert (tmp_path / ".agent/skills/skill-three/SKILL.md").exists()
+        assert not (tmp_path / ".agent/skills/skill-one").exists()
+
+        lock = json.loads((tmp_path / "skills.lock").read_text(encoding="utf-8"))
+        assert [entry["skills"] for entry in lock["sources"]] == [["skill-two"], ["skill-three"]]
+        assert lock["sources"][0]["commit"]
+        assert lock["sources"][1]["commit"] is None
+
+        second = runner.invoke(cli, ["install", "-f", str(manifest), "--yes"], env=env)
+        assert second.exit_code == 0, second.output
+        assert f"Unchanged: {repo}" in second.output
+        assert "Installed skill-two" not in second.output
+        assert "Updated skill-three" in second.output
+
+
+def test_install_requires_source_or_manifest() -> None:
+    result = CliRunner().invoke(cli, ["install"])
+
+    assert result.exit_code != 0
+    assert "Pass either SOURCE or -f/--file MANIFEST" in result.output
+
+
+def test_update_copies_only_changed_skills() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem() as tmp:
+        tmp_path = Path(tmp)
+        env = {"HOME": str(tmp_path / "home"), "OPENSKILLS_CACHE_DIR": str(tmp_path / "cache")}
+        repo = _create_git_repo(tmp_path)
+        skills_root = tmp_path / ".agent/skills"
+
+        installed = runner.invoke(cli, ["install", str(repo), "--yes"], env=env)
+        assert installed.exit_code == 0, installed.output
+        assert (skills_root / ".openskills-lock.json").exists()
+
+        noop = runner.invoke(cli, ["update"], env=env)
+        assert noop.exit_code == 0, noop.output
+        assert f"Up to date: {repo} (2 skills)" in noop.output
+        assert "Updated 0 of 2 skills" in noop.output
+
+        _write_skill(repo / "nested", "skill-two", "Skill two description", "Revised details")
+        git_env = {**os.environ, "GIT_AUTHOR_NAME": "Test", "GIT_AUTHOR_EMAIL": "test@example.com"}
+        git_env |= {"GIT_COMMITTER_NAME": "Test", "GIT_COMMITTER_EMAIL": "test@example.com"}
+        subprocess.run(["git", "commit", "-qam", "revise"], cwd=repo, check=True, env=git_env)
+
+        changed = runner.invoke(cli, ["update"], env=env)
+        assert changed.exit_code == 0, changed.output
+        assert "Updated skill-two" in changed.output
+        assert "Updated skill-one" not in changed.output
+        assert "Revised details" in (skills_root / "skill-two/SKILL.md").read_text(encoding="utf-8")
+        assert not [path.name for path in skills_root.iterdir() if ".backup-" in path.name]
+        assert len(list((skills_root / ".openskills-backups").iterdir())) == 1
+        listed = runner.invoke(cli, ["list"], env=env)
+        assert "backup" not in listed.output
+
+        again = runner.invoke(cli, ["update"], env=env)
+        assert f"Up to date: {repo}" in again.output
+
+
+def test_store_install_shares_files_across_roots_and_gc() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem() as tmp:
+        tmp_path = Path(tmp)
+        env = {"HOME": str(tmp_path / "home"), "OPENSKILLS_CACHE_DIR": str(tmp_path / "cache")}
+        repo = _create_git_repo(tmp_path)
+
+        for extra in ([], ["--global"]):
+            result = runner.invoke(cli, ["install", str(repo), "--yes", "--store", *extra], env=env)
+            assert result.exit_code == 0, result.output
+
+        project_copy = tmp_path / ".agent/skills/skill-one/SKILL.md"
+        global_copy = tmp_path / "home/.agent/skills/skill-one/SKILL.md"
+        assert project_copy.stat().st_ino == global_copy.stat().st_ino
+        assert len(list((tmp_path / "cache/store/objects").iterdir())) == 2
+
+        assert runner.invoke(cli, ["remove", "skill-one"], env=env).exit_code == 0
+        kept = runner.invoke(cli, ["gc"], env=env)
+        assert "Removed 0 unreferenced skill trees" in kept.output
+
+        assert runner.invoke(cli, ["remove", "skill-one"], env=env).exit_code == 0
+        collected = runner.invoke(cli, ["gc"], env=env)
+        assert collected.exit_code == 0, collected.output
+        assert "Removed 1 unreferenced skill trees" in collected.output
+        assert len(list((tmp_path / "cache/store/objects").iterdir())) == 1
+
+
+def test_update_relinks_store_installs_from_the_store() -> None:
+    runner = CliRunner()
+    with runner.isolated_filesystem() as tmp:
+        tmp_path = Path(tmp)
+        env = {"HOME": str(tmp_path / "home"), "OPENSKILLS_CACHE_DIR": str(tmp_path / "cache")}
+        repo = _create_git_repo(tmp_path)
+        objects = tmp_path / "cache/store/objects"
+
+        hardlinked = runner.invoke(cli, ["install", str(repo), "--yes", "--store"], env=env)
+        assert hardlinked.exit_code == 0, hardlinked.output
+        symlinked = runner.invoke(
+            cli, ["install", str(repo), "--yes", "--store", "--link", "symlink", "--global"], env=env
+        )
+        assert symlinked.exit_code == 0, symlinked.output
+
+        _write_skill(repo / "nested", "skill-two", "Skill two description", "Revised details")
+        git_env = {**os.environ, "GIT_AUTHOR_NAME": "Test", "GIT_AUTHOR_EMAIL": "test@example.com"}
+        git_env |= {"GIT_COMMITTER_NAME": "Test", "GIT_COMMITTER_EMAIL": "test@example.com"}
+        subprocess.run(["git", "commit", "-qam", "revise"], cwd=repo, check=True, env=git_env)
+
+        for extra in ([], ["--global"]):
+            result = runner.invoke(cli, ["update", *extra], env=env)
+            assert result.exit_code == 0, result.output
+            assert "Updated skill-two" in result.output
+
+        project_copy = tmp_path / ".agent/skills/skill-two/SKILL.md"
+        assert "Revised details" in project_copy.read_text(encoding="utf-8")
+        assert project_copy.stat().st_nlink > 1
+        assert not project_copy.stat().st_mode & 0o222
+
+        global_copy = tmp_path / "home/.agent/skills/skill-two"
+        assert global_copy.is_symlink()
+        assert global_copy.resolve().parent == objects.resolve()
+        assert "Revised details" in (global_copy / "SKILL.md").read_text(encoding="utf-8")
+
+        collected = runner.invoke(cli, ["gc"], env=env)
+        assert "Removed 1 unreferenced skill trees" in collected.output
+        assert project_copy.stat().st_ino == (global_copy / "SKILL.md").stat().st_ino
+
+        again = runner.invoke(cli, ["update"], env=env)
+        assert f"Up to date: {repo}" in again.output
+
+
+def test_sync_skips_rewriting_unchanged_agents_md(tmp_path: Path, monkeypatch) -> None:
+    project = tmp_path / "project"
+    _write_skill(project / ".claude/skills", "alpha", "Alpha description")
+    agents_md = project / "AGENTS.md"
+    agents_md.write_text("# Agents\n", encoding="utf-8")
+    monkeypatch.chdir(project)
+    env = {"HOME": str(tmp_path / "home"), "OPENSKILLS_CACHE_DIR": str(tmp_path / "cache")}
+    runner = CliRunner()
+
+    first = runner.invoke(cli, ["sync", "--yes"], env=env)
+    assert first.exit_code == 0, first.output
+    assert "Added skills section to AGENTS.md with 1 skill(s)" in first.output
+    synced = agents_md.read_text(encoding="utf-8")
+    os.utime(agents_md, ns=(1_000_000_000, 1_000_000_000))
+
+    second = runner.invoke(cli, ["sync", "--yes"], env=env)
+    assert second.exit_code == 0, second.output
+    assert "AGENTS.md already up to date with 1 skill(s)" in second.output
+    assert agents_md.stat().st_mtime_ns == 1_000_000_000
+    assert agents_md.read_text(encoding="utf-8") == synced
+
+    _write_skill(project / ".claude/skills", "beta", "Beta description")
+    third = runner.invoke(cli, ["sync", "--yes"], env=env)
+    assert "Synced AGENTS.md with 2 skill(s)" in third.output
+    assert "<name>beta</name>" in agents_md.read_text(encoding="utf-8")
+
+    listed = runner.invoke(cli, ["list", "--format", "xml"], env=env)
+    assert listed.exit_code == 0, listed.output
+    assert listed.output.startswith("<available_skills>\n\n<skill>\n<name>alpha</name>")
+    assert listed.output in agents_md.read_text(encoding="utf-8")
+
+
+def test_sync_budget_ranks_by_usage_and_collapses_the_rest(tmp_path: Path, monkeypatch) -> None:
+    project = tmp_path / "project"
+    for i in range(30):
+        _write_skill(project / ".claude/skills", f"skill-{i:02d}", f"Skill number {i} " + "does work " * 30)
+    agents_md = project / "AGENTS.md"
+    agents_md.write_text("# Agents\n", encoding="utf-8")
+    monkeypatch.chdir(project)
+    env = {"HOME": str(tmp_path / "home"), "OPENSKILLS_CACHE_DIR": str(tmp_path / "cache")}
+    runner = CliRunner()
+
+    read = runner.invoke(cli, ["read", "skill-29"], env=env)
+    assert read.exit_code == 0, read.output
+
+    result = runner.invoke(cli, ["sync", "--yes", "--max-tokens", "1000"], env=env)
+    assert result.exit_code == 0, result.output
+    assert "(budget 3.9 KiB)" in result.output
+    assert "in the index line" in result.output
+    section = locate_skills_section(agents_md.read_text(encoding="utf-8"))
+    assert section is not None
+    assert section.end - section.start <= 4000
+    assert section.names[0] == "skill-29"
+    assert "<more_skills count=" in agents_md.read_text(encoding="utf-8")
+
+    rejected = runner.invoke(cli, ["sync", "--yes", "--priority", "size"], env=env)
+    assert rejected.exit_code != 0
+
+
+def test_list_json_and_ndjson_output(tmp_path: Path, monkeypatch) -> None:
+    project = tmp_path / "project"
+    _write_skill(project / ".agent/skills", "alpha", "Alpha description")
+    _write_skill(tmp_path / "home/.agent/skills", "beta", "Beta description")
+    monkeypatch.chdir(project)
+    env = {"HOME": str(tmp_path / "home"), "OPENSKILLS_CACHE_DIR": str(tmp_path / "cache")}
+    runner = CliRunner()
+
+    as_json = runner.invoke(cli, ["list", "--json"], env=env)
+    assert as_json.exit_code == 0, as_json.output
+    records = json.loads(as_json.output)
+    assert [(record["name"], record["location"]) for record in records] == [("alpha", "project"), ("beta", "global")]
+    assert records[0]["skill_path"] == str(project / ".agent/skills/alpha/SKILL.md")
+
+    as_ndjson = runner.invoke(cli, ["list", "--ndjson", "--fields", "name,location"], env=env)
+    assert as_ndjson.exit_code == 0, as_ndjson.output
+    assert [json.loads(line) for line in as_ndjson.output.splitlines()] == [
+        {"name": "alpha", "location": "project"},
+        {"name": "beta", "location": "global"},
+    ]
+
+    assert runner.invoke(cli, ["list", "--json", "--fields", "size"], env=env).exit_code != 0
+    assert runner.invoke(cli, ["list", "--fields", "name"], env=env).exit_code != 0
+
+
+def test_read_several_skills_in_one_call(tmp_path: Path, monkeypatch) -> None:
+    project = tmp_path / "project"
+    _write_skill(project / ".agent/skills", "alpha", "Alpha description")
+    _write_skill(tmp_path / "home/.agent/skills", "beta", "Beta description")
+    monkeypatch.chdir(project)
+    env = {"HOME": str(tmp_path / "home"), "OPENSKILLS_CACHE_DIR": str(tmp_path / "cache")}
+    runner = CliRunner()
+
+    both = runner.invoke(cli, ["read", "beta", "alpha"], env=env)
+    assert both.exit_code == 0, both.stderr
+    assert both.stdout.index("Reading: beta") < both.stdout.index("Reading: alpha")
+    assert both.stdout.count("Base directory:") == 2
+
+    piped = runner.invoke(cli, ["read", "--stdin", "--max-bytes", "10"], input="alpha\n\nmissing\ngone\n", env=env)
+    assert piped.exit_code == 1
+    assert "Reading: alpha" in piped.stdout
+    assert "[Truncated: showing 10 of" in piped.stdout
+    assert "Error: 2 skills not found: 'missing', 'gone'" in piped.stderr
+    assert piped.stderr.count("Searched:") == 1
+
+    assert runner.invoke(cli, ["read"], env=env).exit_code == 2
+
+
+def test_sync_keeps_symlinked_agents_md_linked(tmp_path: Path, monkeypatch) -> None:
+    project = tmp_path / "project"
+    _write_skill(project / ".claude/skills", "alpha", "Alpha description")
+    (project / "CLAUDE.md").write_text("# Agents\n", encoding="utf-8")
+    (project / "AGENTS.md").symlink_to("CLAUDE.md")
+    monkeypatch.chdir(project)
+    env = {"HOME": str(tmp_path / "home"), "OPENSKILLS_CACHE_DIR": str(tmp_path / "cache")}
+
+    for args in (["sync", "--yes"], ["sync", "--recursive"]):
+        result = CliRunner().invoke(cli, args, env=env)
+        assert result.exit_code == 0, result.output
+        assert (project / "AGENTS.md").is_symlink()
+        assert "<name>alpha</name>" in (project / "CLAUDE.md").read_text(encoding="utf-8")
+
+
+def test_sync_reports_unclosed_skills_section(tmp_path: Path, monkeypatch) -> None:
+    project = tmp_path / "project"
+    _write_skill(project / ".claude/skills", "alpha", "Alpha description")
+    original = "# Agents\n\n<skills_system>\nnever closed\n"
+    (project / "AGENTS.md").write_text(original, encoding="utf-8")
+    monkeypatch.chdir(project)
+    env = {"HOME": str(tmp_path / "home"), "OPENSKILLS_CACHE_DIR": str(tmp_path / "cache")}
+    runner = CliRunner()
+
+    single = runner.invoke(cli, ["sync", "--yes"], env=env)
+    assert single.exit_code == 0, single.output
+    assert "never closed" in single.stderr
+    assert "up to date" not in single.output
+
+    recursive = runner.invoke(cli, ["sync", "--recursive"], env=env)
+    assert recursive.exit_code != 0
+    assert "failed     AGENTS.md: skills section is opened but never closed" in recursive.stderr
+    assert (project / "AGENTS.md").read_text(encoding="utf-8") == original
+
+
+def test_sync_recursive_updates_each_workspace(tmp_path: Path, monkeypatch) -> None:
+    monorepo = tmp_path / "monorepo"
+    home = tmp_path / "home"
+    _write_skill(home / ".agent/skills", "shared", "Global skill")
+    _write_skill(monorepo / "svc-a/.claude/skills", "only-a", "Local to A")
+    for rel in ["svc-a", "svc-b", "svc-c"]:
+        (monorepo / rel).mkdir(parents=True, exist_ok=True)
+        (monorepo / rel / "AGENTS.md").write_text("# Agents\n", encoding="utf-8")
+    monkeypatch.chdir(monorepo)
+    env = {"HOME": str(home), "OPENSKILLS_CACHE_DIR": str(tmp_path / "cache")}
+    runner = CliRunner()
+
+    first = runner.invoke(cli, ["sync", "--recursive"], env=env)
+    assert first.exit_code == 0, first.output
+    assert "changed    svc-a/AGENTS.md (2 skills)" in first.output
+    assert "changed    svc-b/AGENTS.md (1 skills)" in first.output
+    assert "3 changed, 0 unchanged" in first.output
+    svc_a = (monorepo / "svc-a/AGENTS.md").read_text(encoding="utf-8")
+    svc_b = (monorepo / "svc-b/AGENTS.md").read_text(encoding="utf-8")
+    assert "<name>only-a</name>" in svc_a and "<name>shared</name>" in svc_a
+    assert "<name>only-a</name>" not in svc_b and "<name>shared</name>" in svc_b
+
+    _write_skill(monorepo / "svc-c/.agent/skills", "only-c", "Local to C")
+    second = runner.invoke(cli, ["sync", "--workspaces"], env=env)
+    assert second.exit_code == 0, second.output
+    assert "unchanged  svc-a/AGENTS.md (2 skills)" in second.output
+    assert "changed    svc-c/AGENTS.md (2 skills)" in second.output
+    assert "1 changed, 2 unchanged" in second.output
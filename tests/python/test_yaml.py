@@ -0,0 +1,98 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+from openskills.utils import FrontmatterError, extract_yaml_field, parse_frontmatter, read_frontmatter
+
+
+def test_read_frontmatter_stops_at_closing_delimiter(tmp_path: Path) -> None:
+    skill_md = tmp_path / "SKILL.md"
+    # An undecodable body proves the reader never touches bytes past '---'.
+    skill_md.write_bytes(b"---\nname: big\ndescription: Large body\n---\n\xff\xfe" + b"x" * 1_000_000)
+
+    assert read_frontmatter(skill_md) == "name: big\ndescription: Large body\n"
+
+
+def test_read_frontmatter_enforces_byte_cap(tmp_path: Path) -> None:
+    skill_md = tmp_path / "SKILL.md"
+    skill_md.write_text("---\nname: capped\ndescription: " + "y" * 200 + "\n---\nbody\n", encoding="utf-8")
+
+    with pytest.raises(FrontmatterError, match="exceeds 64 bytes"):
+        read_frontmatter(skill_md, max_bytes=64)
+
+
+def test_read_frontmatter_cap_from_environment(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    skill_md = tmp_path / "SKILL.md"
+    skill_md.write_text("---\nname: capped\ndescription: " + "y" * 200 + "\n---\n", encoding="utf-8")
+    monkeypatch.setenv("OPENSKILLS_FRONTMATTER_MAX_BYTES", "32")
+
+    with pytest.raises(FrontmatterError):
+        read_frontmatter(skill_md)
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        ("# No frontmatter\n", "start delimiter"),
+        ("---\nname: open\n", "closing '---'"),
+    ],
+)
+def test_read_frontmatter_reports_missing_delimiters(tmp_path: Path, content: str, message: str) -> None:
+    skill_md = tmp_path / "SKILL.md"
+    skill_md.write_text(content, encoding="utf-8")
+
+    with pytest.raises(FrontmatterError, match=message):
+        read_frontmatter(skill_md)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "name: pdf\ndescription: Work with PDF files\n",
+        "name: 'quoted'\ndescription: \"double quoted\"\ncontext: it''s fine # trailing comment\n",
+        "name: folded\ndescription: >\n  Spans several\n  lines here\n",
+        "name: literal\ndescription: |\n  keep\n  newlines\n",
+        "name: listy\ntags: [a, b]\nmetadata:\n  owner: team\n",
+        "name: typed\nversion: 1.2\nenabled: yes\nempty:\n",
+        "# leading comment\n\nname: spaced\ndescription: Has a # hash inside\n",
+        "name: ints\nhex: 0x1F\noctal: 0o17\nbinary: 0b101\n",
+        "name: dates\ncreated: 2024-01-01 10:00:00\nday: 2024-01-01\nstamp: 2024-01-01t10:00:00Z\n",
+    ],
+)
+def test_parse_frontmatter_matches_pyyaml(text: str) -> None:
+    assert parse_frontmatter(text).fields == yaml.safe_load(text)
+
+
+def test_parse_frontmatter_returns_typed_record() -> None:
+    record = parse_frontmatter("name: pdf\ndescription: >\n  Folded\n  text\ncontext: Notes\n")
+
+    assert record.name == "pdf"
+    assert record.description == "Folded text\n"
+    assert record.context == "Notes"
+
+
+def test_parse_frontmatter_invalid_yaml_strict_and_lenient() -> None:
+    text = "name: colon\ndescription: Use for: PDFs\n"
+
+    with pytest.raises(FrontmatterError, match="Invalid YAML"):
+        parse_frontmatter(text)
+
+    assert parse_frontmatter(text, lenient=True).description == "Use for: PDFs"
+
+
+@pytest.mark.parametrize("value", ["tab\tinside", "="])
+def test_parse_frontmatter_rejects_what_pyyaml_rejects(value: str) -> None:
+    text = f"name: strict\ndescription: {value}\n"
+
+    with pytest.raises(yaml.YAMLError):
+        yaml.safe_load(text)
+    with pytest.raises(FrontmatterError):
+        parse_frontmatter(text)
+
+
+def test_extract_yaml_field_ignores_body() -> None:
+    content = "---\nname: no-description\n---\n\ndescription: not frontmatter\n"
+
+    assert extract_yaml_field(content, "name") == "no-description"
+    assert extract_yaml_field(content, "description") == ""